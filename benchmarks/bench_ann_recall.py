@@ -0,0 +1,85 @@
+"""
+Benchmark: recall@k and query speed of the approximate FAISS index types.
+
+A synthetic clustered corpus is indexed with every supported layout. Each
+approximate index is queried with a sweep of its recall/speed knob (nprobe
+for IVF types, efSearch for HNSW), and its results are compared with the
+exact ``Flat`` baseline. Build time, queries per second and recall@k are
+reported for each setting.
+
+Usage:
+    python benchmarks/bench_ann_recall.py --n 200000 --dim 384 --queries 1000 --k 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+if MAIN_DIR not in sys.path:
+    sys.path.append(MAIN_DIR)
+
+# pylint: disable=wrong-import-position
+from src.enums import FaissIndexType
+from src.rag.faiss_search import build_faiss_index, search_parameters
+
+
+def _corpus(n_vectors: int, dim: int, n_queries: int):
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((max(16, n_vectors // 1000), dim), dtype=np.float32)
+    labels = rng.integers(0, len(centers), n_vectors + n_queries)
+    points = centers[labels] + 0.3 * rng.standard_normal((len(labels), dim), dtype=np.float32)
+    return points[:n_vectors], points[n_vectors:]
+
+
+def _recall(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(row_f) & set(row_t)) for row_f, row_t in zip(found, truth))
+    return hits / truth.size
+
+
+def _timed_search(index, queries: np.ndarray, k: int, **knobs):
+    params = search_parameters(index, **knobs)
+    start = time.perf_counter()
+    _, ids = index.search(queries, k, params=params)
+    return ids, len(queries) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[16, 32, 64, 128])
+    args = parser.parse_args()
+
+    corpus, queries = _corpus(args.n, args.dim, args.queries)
+    print(f"{args.n} vectors, dim {args.dim}, {args.queries} queries, recall@{args.k}\n")
+    print(f"{'index':>8} {'knob':>14} {'build s':>9} {'QPS':>10} {'recall':>8}")
+
+    truth = None
+    for index_type in FaissIndexType:
+        start = time.perf_counter()
+        index = build_faiss_index(corpus, index_type)
+        build_time = time.perf_counter() - start
+
+        if index_type is FaissIndexType.FLAT:
+            sweep = [("exact", {})]
+        elif index_type is FaissIndexType.HNSW:
+            sweep = [(f"efSearch={ef}", {"ef_search": ef}) for ef in args.ef_search]
+        else:
+            sweep = [(f"nprobe={nprobe}", {"nprobe": nprobe}) for nprobe in args.nprobe]
+
+        for label, knobs in sweep:
+            ids, qps = _timed_search(index, queries, args.k, **knobs)
+            truth = ids if truth is None else truth
+            recall = _recall(ids, truth)
+            print(f"{index_type.value:>8} {label:>14} {build_time:>9.2f} {qps:>10.0f} {recall:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
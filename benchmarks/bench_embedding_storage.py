@@ -0,0 +1,91 @@
+"""
+Benchmark: loading embeddings stored as JSON text vs raw float32 bytes.
+
+For every corpus size a temporary SQLite database is filled twice, once with
+legacy ``json.dumps(list)`` rows and once with the binary float32 format, and
+the time to turn the whole table back into a float32 matrix is measured. The
+on-disk size of each table is reported alongside.
+
+Usage:
+    python benchmarks/bench_embedding_storage.py --sizes 10000 100000 1000000 --dim 384
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+if MAIN_DIR not in sys.path:
+    sys.path.append(MAIN_DIR)
+
+# pylint: disable=wrong-import-position
+from src.dbs.embedding_codec import EMBEDDING_DTYPE, decode_embeddings, encode_embedding
+
+INSERT_BATCH = 10_000
+
+
+def _fill(path: str, n_vectors: int, dim: int, binary: bool) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE embeddings (id INTEGER PRIMARY KEY, embedding BLOB, dim INTEGER, dtype TEXT)"
+    )
+    rng = np.random.default_rng(0)
+    for start in range(0, n_vectors, INSERT_BATCH):
+        batch = rng.random((min(INSERT_BATCH, n_vectors - start), dim), dtype=np.float32)
+        if binary:
+            rows = [(encode_embedding(vec), dim, EMBEDDING_DTYPE) for vec in batch]
+        else:
+            rows = [(json.dumps(vec.tolist()), None, "json") for vec in batch]
+        conn.executemany("INSERT INTO embeddings (embedding, dim, dtype) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def _load_json(path: str) -> np.ndarray:
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT embedding FROM embeddings ORDER BY id").fetchall()
+    conn.close()
+    return np.vstack([np.array(json.loads(row[0]), dtype=np.float32) for row in rows])
+
+
+def _load_binary(path: str, dim: int) -> np.ndarray:
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT embedding FROM embeddings ORDER BY id").fetchall()
+    conn.close()
+    return decode_embeddings([row[0] for row in rows], dim)
+
+
+def run(sizes, dim: int) -> None:
+    """Fill, load and report for every requested corpus size."""
+    print(f"{'vectors':>10} {'format':>8} {'size MB':>10} {'load s':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_vectors in sizes:
+            timings = {}
+            for fmt in ("json", "binary"):
+                path = os.path.join(tmp_dir, f"{fmt}_{n_vectors}.sqlite3")
+                _fill(path, n_vectors, dim, binary=fmt == "binary")
+
+                start = time.perf_counter()
+                matrix = _load_binary(path, dim) if fmt == "binary" else _load_json(path)
+                timings[fmt] = time.perf_counter() - start
+                assert matrix.shape == (n_vectors, dim)
+
+                speedup = timings["json"] / timings[fmt]
+                size_mb = os.path.getsize(path) / 1e6
+                print(f"{n_vectors:>10} {fmt:>8} {size_mb:>10.1f} {timings[fmt]:>10.3f} "
+                      f"{speedup:>7.1f}x")
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+    run(args.sizes, args.dim)
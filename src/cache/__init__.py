@@ -0,0 +1,14 @@
+"""
+cache package.
+
+Provides ResponseCache, the two-tier (in-memory LRU + SQLite) cache of
+generated chat responses, and SemanticCache, which reuses answers to
+earlier queries whose embeddings are close to a new one, and
+QueryEmbeddingCache, an LRU of query embeddings in front of the embedding model.
+ResponseWriter batches new query_responses rows on a background thread.
+"""
+
+from .response_cache import ResponseCache
+from .response_writer import ResponseWriter
+from .semantic_cache import SemanticCache
+from .query_embedding_cache import QueryEmbeddingCache
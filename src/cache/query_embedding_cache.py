@@ -0,0 +1,131 @@
+"""
+query_embedding_cache module: bounded LRU of query text -> embedding.
+
+Repeated questions ("opening hours?") are common, and each one costs a full
+transformer forward pass before retrieval can start. This cache sits in front
+of ``embed_query`` and returns the stored vector for a query that was embedded
+before by the same model with the same normalization flag. Lookups are
+exported as a Prometheus counter labelled by result.
+"""
+
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs.metrics import QUERY_EMBEDDING_CACHE_LOOKUPS_TOTAL
+    from src.helpers import get_settings, Settings
+
+except ImportError as ie:
+    logging.error("Import error during setup: %s", ie, exc_info=True)
+except (ValueError, KeyError, RuntimeError) as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+def freeze_vector(vector: Sequence[float]) -> np.ndarray:
+    """Return ``vector`` as a read-only float32 array, copying unless it already is one."""
+    if (isinstance(vector, np.ndarray) and vector.dtype == np.float32
+            and not vector.flags.writeable):
+        return vector
+    frozen = np.array(vector, dtype=np.float32)
+    frozen.setflags(write=False)
+    return frozen
+
+
+class QueryEmbeddingCache:
+    """
+    Thread-safe LRU of query embeddings keyed by (model, normalize flag, query).
+
+    Vectors are stored as read-only float32 arrays (4 bytes per dimension) and
+    returned without copying; callers that need to modify one must copy it.
+
+    Attributes:
+        max_entries (int): Number of embeddings kept; 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        app_settings: Settings = get_settings()
+        self.max_entries = (app_settings.QUERY_EMBEDDING_CACHE_SIZE
+                            if max_entries is None else max_entries)
+        self._entries: "OrderedDict[Tuple[Hashable, bool, str], np.ndarray]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Entry count, hit/miss totals and hit rate since startup."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def get(self, model: Hashable, normalize: bool, query: str) -> Optional[np.ndarray]:
+        """
+        Return the cached embedding of ``query``, or None on a miss.
+
+        Args:
+            model (Hashable): Identity of the embedding model, e.g. its name.
+            normalize (bool): Whether the embedding was L2-normalized.
+            query (str): The exact query text.
+
+        Returns:
+            Optional[np.ndarray]: The cached read-only float32 vector.
+        """
+        if self.max_entries <= 0:
+            return None
+        key = (model, normalize, query)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self._misses += 1
+                QUERY_EMBEDDING_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc()
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        QUERY_EMBEDDING_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc()
+        return vector
+
+    def put(self, model: Hashable, normalize: bool, query: str, vector: Sequence[float]) -> None:
+        """
+        Remember the embedding of ``query``, evicting the least recently used entry.
+
+        Args:
+            model (Hashable): Identity of the embedding model, e.g. its name.
+            normalize (bool): Whether the embedding was L2-normalized.
+            query (str): The exact query text.
+            vector (Sequence[float]): The embedding; stored as a read-only float32
+                array, without copying when it already is one.
+        """
+        if self.max_entries <= 0:
+            return
+        stored = freeze_vector(vector)
+        key = (model, normalize, query)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after the embedding model was replaced."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,239 @@
+"""
+response_cache module: two-tier cache of generated chat responses.
+
+Lookups first hit a bounded in-memory LRU and fall back to the indexed
+``query_responses`` table, keyed on (user_id, normalized query hash), so the
+same question asked with different casing or spacing is served from cache.
+Entries expire after a TTL, the table is capped at a maximum row count by a
+background eviction thread, and hits, misses and evictions are exported as
+Prometheus counters. New rows are written through an optional
+:class:`ResponseWriter`, which batches them off the request path.
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_debug, log_error, log_info
+    from src.logs.metrics import (
+        RESPONSE_CACHE_EVICTIONS_TOTAL,
+        RESPONSE_CACHE_HITS_TOTAL,
+        RESPONSE_CACHE_MISSES_TOTAL,
+    )
+    from src.helpers import get_settings, Settings
+    from src.enums import ResponseCacheLogMessages
+    from src.dbs import (
+        evict_query_responses,
+        hash_query,
+        insert_query_response,
+        lookup_query_response,
+    )
+
+except ImportError as ie:
+    logging.error("Import error during setup: %s", ie, exc_info=True)
+except (ValueError, KeyError, RuntimeError) as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+if TYPE_CHECKING:
+    from src.cache.response_writer import ResponseWriter
+
+
+class ResponseCache:
+    """
+    Thread-safe response cache backed by the ``query_responses`` table.
+
+    Attributes:
+        ttl_seconds (int): Age after which an entry expires; 0 disables expiry.
+        max_rows (int): Row cap for the table; 0 disables the cap.
+        lru_size (int): Number of entries kept in memory.
+        eviction_interval (int): Seconds between background eviction passes.
+        writer (Optional[ResponseWriter]): Write-behind queue for new rows; rows
+            are inserted synchronously when None.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        ttl_seconds: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        lru_size: Optional[int] = None,
+        eviction_interval: Optional[int] = None,
+        writer: Optional["ResponseWriter"] = None,
+    ):
+        app_settings: Settings = get_settings()
+        self.conn = conn
+        self.ttl_seconds = (app_settings.RESPONSE_CACHE_TTL_SECONDS
+                            if ttl_seconds is None else ttl_seconds)
+        self.max_rows = app_settings.RESPONSE_CACHE_MAX_ROWS if max_rows is None else max_rows
+        self.lru_size = app_settings.RESPONSE_CACHE_LRU_SIZE if lru_size is None else lru_size
+        self.eviction_interval = (app_settings.RESPONSE_CACHE_EVICTION_INTERVAL
+                                  if eviction_interval is None else eviction_interval)
+        self.writer = writer
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Current in-memory size and configured limits."""
+        with self._lock:
+            size = len(self._memory)
+        return {
+            "memory_entries": size,
+            "lru_size": self.lru_size,
+            "max_rows": self.max_rows,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def get(self, user_id: str, query: str) -> Optional[str]:
+        """
+        Return the cached raw response for the user's query, or None.
+
+        Args:
+            user_id (str): User the response was generated for.
+            query (str): The user's query; case and whitespace are ignored.
+
+        Returns:
+            Optional[str]: The raw LLM output stored for the query.
+        """
+        key = (user_id, hash_query(query))
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[1]):
+                    self._memory.move_to_end(key)
+                    RESPONSE_CACHE_HITS_TOTAL.labels(tier="memory").inc()
+                    log_debug(ResponseCacheLogMessages.DEBUG_MEMORY_HIT.value.format(user_id))
+                    return entry[0]
+                del self._memory[key]
+                # The database row is counted as "ttl" when it is evicted.
+                RESPONSE_CACHE_EVICTIONS_TOTAL.labels(reason="memory_ttl").inc()
+
+        try:
+            row = lookup_query_response(
+                self.conn, user_id, query, max_age_seconds=self.ttl_seconds or None
+            )
+        except sqlite3.Error as err:
+            log_error(ResponseCacheLogMessages.ERR_LOOKUP_FAILED.value.format(err))
+            row = None
+
+        if row is None:
+            RESPONSE_CACHE_MISSES_TOTAL.inc()
+            log_debug(ResponseCacheLogMessages.DEBUG_MISS.value.format(user_id))
+            return None
+
+        response, created_at = row
+        self._remember(key, response, created_at)
+        RESPONSE_CACHE_HITS_TOTAL.labels(tier="database").inc()
+        log_debug(ResponseCacheLogMessages.DEBUG_DB_HIT.value.format(user_id))
+        return response
+
+    def put(self, user_id: str, query: str, response: str) -> None:
+        """
+        Store a freshly generated response in both tiers.
+
+        With a writer the database row is queued and written in a later batch;
+        the in-memory tier serves the response meanwhile.
+
+        Args:
+            user_id (str): User the response was generated for.
+            query (str): The user's query.
+            response (str): Raw LLM output.
+        """
+        if self.writer is not None:
+            self.writer.submit(user_id, query, response)
+        else:
+            insert_query_response(conn=self.conn, query=query, response=response, user_id=user_id)
+        self._remember((user_id, hash_query(query)), response, time.time())
+
+    def clear(self) -> None:
+        """
+        Drop the in-memory tier and unwritten rows, e.g. after the
+        ``query_responses`` table is cleared.
+        """
+        if self.writer is not None:
+            self.writer.discard()
+        with self._lock:
+            self._memory.clear()
+        log_info(ResponseCacheLogMessages.INFO_CLEARED.value)
+
+    def evict(self) -> int:
+        """
+        Delete expired rows and rows beyond the cap, expire in-memory entries and
+        drop the in-memory copies of rows removed by the cap.
+
+        Returns:
+            int: Number of database rows removed.
+        """
+        expired, overflow = evict_query_responses(self.conn, self.ttl_seconds, self.max_rows)
+        if expired:
+            RESPONSE_CACHE_EVICTIONS_TOTAL.labels(reason="ttl").inc(expired)
+        if overflow:
+            RESPONSE_CACHE_EVICTIONS_TOTAL.labels(reason="max_rows").inc(len(overflow))
+
+        with self._lock:
+            stale = [key for key, (_, created_at) in self._memory.items()
+                     if self._expired(created_at)]
+            for key in stale + overflow:
+                self._memory.pop(key, None)
+        return expired + len(overflow)
+
+    def start(self) -> None:
+        """Run one eviction pass now and keep evicting on a background thread."""
+        log_info(ResponseCacheLogMessages.INFO_STARTED.value.format(
+            self.ttl_seconds, self.max_rows, self.lru_size, self.eviction_interval))
+        self.evict()
+        if self.eviction_interval <= 0 or self._worker is not None:
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._eviction_loop, name="response-cache-evictor", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the background eviction thread."""
+        if self._worker is None:
+            return
+        self._stop.set()
+        self._worker.join(timeout=5)
+        self._worker = None
+        log_info(ResponseCacheLogMessages.INFO_STOPPED.value)
+
+    def _eviction_loop(self) -> None:
+        while not self._stop.wait(self.eviction_interval):
+            try:
+                self.evict()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                log_error(ResponseCacheLogMessages.ERR_EVICTION_FAILED.value.format(err))
+
+    def _remember(self, key: Tuple[str, str], response: str, created_at: float) -> None:
+        if self.lru_size <= 0:
+            return
+        with self._lock:
+            self._memory[key] = (response, created_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.lru_size:
+                self._memory.popitem(last=False)
+                RESPONSE_CACHE_EVICTIONS_TOTAL.labels(reason="lru").inc()
+
+    def _expired(self, created_at: Optional[float]) -> bool:
+        if self.ttl_seconds <= 0 or created_at is None:
+            return False
+        return time.time() - created_at > self.ttl_seconds
@@ -0,0 +1,200 @@
+"""
+response_writer module: write-behind queue for ``query_responses`` inserts.
+
+Committing one row per cache miss puts a write transaction on the hot path of
+every generated answer. ``ResponseWriter`` accepts rows into a bounded
+in-memory queue instead and a background thread writes them in batched
+transactions, every ``flush_interval`` seconds or as soon as ``batch_size``
+rows are waiting. When the queue is full the submitting thread flushes it
+itself, so memory stays bounded under sustained load. Queue depth, flush
+latency and written rows are exported as Prometheus metrics.
+
+Freshly generated answers stay readable before they are flushed through the
+in-memory tier of :class:`ResponseCache`.
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_debug, log_error, log_info, log_warning
+    from src.logs.metrics import (
+        RESPONSE_WRITE_FLUSH_SECONDS,
+        RESPONSE_WRITE_QUEUE_DEPTH,
+        RESPONSE_WRITE_ROWS_TOTAL,
+    )
+    from src.helpers import get_settings, Settings
+    from src.enums import ResponseCacheLogMessages
+    from src.dbs import insert_query_responses
+
+except ImportError as ie:
+    logging.error("Import error during setup: %s", ie, exc_info=True)
+except (ValueError, KeyError, RuntimeError) as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+class ResponseWriter:
+    """
+    Batches ``query_responses`` inserts on a background thread.
+
+    Until :meth:`start` is called (and after :meth:`stop`), every submitted row
+    is written immediately.
+
+    Attributes:
+        max_queue (int): Maximum number of rows waiting to be written.
+        batch_size (int): Number of waiting rows that triggers a flush.
+        flush_interval (float): Seconds between background flushes.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        max_queue: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        app_settings: Settings = get_settings()
+        self.conn = conn
+        self.max_queue = app_settings.RESPONSE_WRITE_QUEUE_SIZE if max_queue is None else max_queue
+        self.batch_size = (app_settings.RESPONSE_WRITE_BATCH_SIZE
+                           if batch_size is None else batch_size)
+        self.flush_interval = (app_settings.RESPONSE_WRITE_FLUSH_INTERVAL
+                               if flush_interval is None else flush_interval)
+        if self.max_queue <= 0 or self.batch_size <= 0 or self.flush_interval <= 0:
+            raise ValueError("max_queue, batch_size and flush_interval must be greater than zero.")
+        self._pending: Deque[Tuple[str, str, str, float]] = deque()
+        self._ready = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Current queue depth and configured limits."""
+        with self._ready:
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "max_queue": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+        }
+
+    def submit(self, user_id: str, query: str, response: str) -> None:
+        """
+        Queue a query-response row for writing.
+
+        Args:
+            user_id (str): User the response was generated for.
+            query (str): The user's query.
+            response (str): Raw LLM output.
+        """
+        row = (user_id, query, response, time.time())
+        with self._ready:
+            running = self._worker is not None
+            if running and len(self._pending) < self.max_queue:
+                self._pending.append(row)
+                RESPONSE_WRITE_QUEUE_DEPTH.set(len(self._pending))
+                if len(self._pending) >= self.batch_size:
+                    self._ready.notify()
+                return
+            self._pending.append(row)
+        if running:
+            log_warning(ResponseCacheLogMessages.WARN_QUEUE_FULL.value.format(self.max_queue))
+        self.flush()
+
+    def flush(self) -> int:
+        """
+        Write every queued row in one transaction.
+
+        Returns:
+            int: Number of rows written; rows of a failed transaction are dropped.
+        """
+        with self._flush_lock:
+            with self._ready:
+                rows = list(self._pending)
+                self._pending.clear()
+                RESPONSE_WRITE_QUEUE_DEPTH.set(0)
+            if not rows:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                written = insert_query_responses(self.conn, rows)
+            except sqlite3.Error as err:
+                RESPONSE_WRITE_ROWS_TOTAL.labels(result="failed").inc(len(rows))
+                log_error(ResponseCacheLogMessages.ERR_FLUSH_FAILED.value.format(len(rows), err))
+                return 0
+            elapsed = time.perf_counter() - started
+            RESPONSE_WRITE_FLUSH_SECONDS.observe(elapsed)
+            RESPONSE_WRITE_ROWS_TOTAL.labels(result="written").inc(written)
+            log_debug(ResponseCacheLogMessages.DEBUG_FLUSHED.value.format(written, elapsed * 1000))
+            return written
+
+    def discard(self) -> int:
+        """
+        Drop queued rows without writing them, e.g. before the table is cleared.
+
+        Waits for a flush that already took rows off the queue, so once this
+        returns no row queued earlier can still reach the database.
+
+        Returns:
+            int: Number of rows dropped.
+        """
+        with self._flush_lock:
+            with self._ready:
+                dropped = len(self._pending)
+                self._pending.clear()
+                RESPONSE_WRITE_QUEUE_DEPTH.set(0)
+        if dropped:
+            RESPONSE_WRITE_ROWS_TOTAL.labels(result="discarded").inc(dropped)
+            log_info(ResponseCacheLogMessages.INFO_WRITER_DISCARDED.value.format(dropped))
+        return dropped
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        with self._ready:
+            if self._worker is not None:
+                return
+            self._stop.clear()
+            self._worker = threading.Thread(
+                target=self._flush_loop, name="response-writer", daemon=True
+            )
+        self._worker.start()
+        log_info(ResponseCacheLogMessages.INFO_WRITER_STARTED.value.format(
+            self.max_queue, self.batch_size, self.flush_interval))
+
+    def stop(self) -> None:
+        """Stop the background thread and write everything still queued."""
+        with self._ready:
+            worker, self._worker = self._worker, None
+            self._stop.set()
+            self._ready.notify_all()
+        if worker is not None:
+            worker.join(timeout=10)
+        flushed = self.flush()
+        log_info(ResponseCacheLogMessages.INFO_WRITER_STOPPED.value.format(flushed))
+
+    def _flush_loop(self) -> None:
+        while not self._stop.is_set():
+            with self._ready:
+                if len(self._pending) < self.batch_size and not self._stop.is_set():
+                    self._ready.wait(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                log_error(ResponseCacheLogMessages.ERR_FLUSH_FAILED.value.format("queued", err))
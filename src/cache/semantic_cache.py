@@ -0,0 +1,170 @@
+"""
+semantic_cache module: reuses answers to previously asked, similar queries.
+
+The exact-match response cache misses on rephrasings ("store hours?" vs
+"what are your store hours"). This cache keeps the embedding of every
+answered query in a small inner-product FAISS index per user and returns the
+stored answer when a new query's cosine similarity clears a threshold. The
+query embedding is the one retrieval computes anyway, so a lookup costs one
+tiny vector search. Entries are dropped whenever the indexed chunk corpus
+changes, since answers generated from the old corpus may be outdated.
+"""
+
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import faiss
+import numpy as np
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_debug, log_info
+    from src.logs.metrics import SEMANTIC_CACHE_INVALIDATIONS_TOTAL, SEMANTIC_CACHE_LOOKUPS_TOTAL
+    from src.helpers import get_settings, Settings
+    from src.enums import SemanticCacheLogMessages
+
+except ImportError as ie:
+    logging.error("Import error during setup: %s", ie, exc_info=True)
+except (ValueError, KeyError, RuntimeError) as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+class SemanticCache:
+    """
+    Thread-safe nearest-neighbour cache of answered queries.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a hit.
+        max_entries (int): Total entries kept across users; the oldest are dropped first.
+        index_service: Optional object exposing a ``version`` counter that changes
+            with the chunk corpus (the FaissIndexService).
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        index_service=None,
+    ):
+        app_settings: Settings = get_settings()
+        self.threshold = (app_settings.SEMANTIC_CACHE_THRESHOLD
+                          if threshold is None else threshold)
+        self.max_entries = (app_settings.SEMANTIC_CACHE_MAX_ENTRIES
+                            if max_entries is None else max_entries)
+        self.index_service = index_service
+        self._indexes: Dict[str, faiss.IndexIDMap2] = {}
+        self._entries: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+        self._next_id = 0
+        self._corpus_version = self._current_version()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Entry count, hit/miss totals and hit rate since startup."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "threshold": self.threshold,
+            }
+
+    def get(self, user_id: str, vector: np.ndarray) -> Optional[str]:
+        """
+        Return the answer cached for the user's most similar earlier query.
+
+        Args:
+            user_id (str): User asking the query.
+            vector (np.ndarray): Query embedding, 1D or shape (1, dim).
+
+        Returns:
+            Optional[str]: The cached raw response, or None below the threshold.
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            self._check_corpus()
+            index = self._indexes.get(user_id)
+            score, entry_id = -1.0, -1
+            if index is not None and index.ntotal and index.d == query.shape[1]:
+                scores, ids = index.search(query, 1)
+                score, entry_id = float(scores[0][0]), int(ids[0][0])
+
+            if entry_id >= 0 and score >= self.threshold:
+                self._hits += 1
+                SEMANTIC_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc()
+                log_debug(SemanticCacheLogMessages.DEBUG_HIT.value.format(user_id, score))
+                return self._entries[entry_id][1]
+
+            self._misses += 1
+            SEMANTIC_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc()
+            log_debug(SemanticCacheLogMessages.DEBUG_MISS.value.format(user_id, score))
+            return None
+
+    def put(self, user_id: str, vector: np.ndarray, response: str) -> None:
+        """
+        Remember the answer generated for a query embedding.
+
+        Args:
+            user_id (str): User the answer was generated for.
+            vector (np.ndarray): Query embedding, 1D or shape (1, dim).
+            response (str): Raw LLM output.
+        """
+        if self.max_entries <= 0:
+            return
+        query = self._normalize(vector)
+        with self._lock:
+            self._check_corpus()
+            index = self._indexes.get(user_id)
+            if index is None or index.d != query.shape[1]:
+                index = faiss.IndexIDMap2(faiss.IndexFlatIP(query.shape[1]))
+                self._indexes[user_id] = index
+            entry_id = self._next_id
+            self._next_id += 1
+            index.add_with_ids(query, np.asarray([entry_id], dtype=np.int64))
+            self._entries[entry_id] = (user_id, response)
+
+            while len(self._entries) > self.max_entries:
+                old_id, (old_user, _) = self._entries.popitem(last=False)
+                self._indexes[old_user].remove_ids(np.asarray([old_id], dtype=np.int64))
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after the chunk corpus was cleared."""
+        with self._lock:
+            self._clear()
+
+    def _check_corpus(self) -> None:
+        version = self._current_version()
+        if version != self._corpus_version:
+            self._corpus_version = version
+            if self._entries:
+                SEMANTIC_CACHE_INVALIDATIONS_TOTAL.inc()
+                self._clear()
+
+    def _clear(self) -> None:
+        self._indexes.clear()
+        self._entries.clear()
+        log_info(SemanticCacheLogMessages.INFO_CLEARED.value)
+
+    def _current_version(self) -> int:
+        return getattr(self.index_service, "version", 0)
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        query = np.array(np.atleast_2d(vector), dtype=np.float32)
+        faiss.normalize_L2(query)
+        return query
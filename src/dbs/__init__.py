@@ -1,4 +1,37 @@
 from .create_sqlite_engin import create_sqlite_engine
-from .create_taples import create_chunks_table, create_embeddings_table, create_query_responses_table
-from .insert_to_database import insert_chunk, insert_embedding, insert_query_response
-from .pull_from_database import pull_from_table
\ No newline at end of file
+from .sqlite_pool import PooledConnection, SQLitePool, create_sqlite_pool, unwrap_connection
+from .create_taples import (
+    create_chunks_table,
+    create_chunks_fts_table,
+    create_embeddings_table,
+    create_embedding_cache_table,
+    create_query_responses_table,
+)
+from .insert_to_database import (
+    delete_embeddings,
+    delete_orphan_embeddings,
+    insert_chunk,
+    insert_embedding,
+    insert_embeddings,
+    insert_query_response,
+    insert_query_responses,
+    sync_chunks_fts,
+)
+from .pull_from_database import (
+    pull_from_table,
+    lookup_query_response,
+    stream_from_table,
+    stream_columns,
+    stream_query,
+)
+from .evict_from_database import evict_query_responses
+from .query_key import normalize_query, hash_query
+from .embedding_codec import encode_embedding, decode_embeddings, decode_legacy_embedding
+from .migrate_embeddings import migrate_json_embeddings
+from .embedding_cache import (
+    hash_chunk_text,
+    lookup_cached_embeddings,
+    store_cached_embeddings,
+)
+from .async_db import AsyncDatabase
+from .migrations import MIGRATIONS, run_migrations, schema_version
@@ -0,0 +1,109 @@
+"""
+Awaitable database access for async route handlers.
+
+Calling SQLite from an ``async def`` route runs the statement on the event loop,
+so one slow ``DELETE`` or bulk insert stalls every other request. ``AsyncDatabase``
+runs database work on a small dedicated thread pool instead and exposes
+awaitable versions of the ``dbs`` functions. The connection it is given is
+normally the pool proxy (``app.state.conn``), so every DB thread works on its
+own WAL connection and reads proceed in parallel with writes.
+
+Any function taking the connection as its first argument can be run with
+``await db.run(func, ...)``, e.g. ``await db.run(clear_table, "chunks")``.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import sys
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    # Add to Python path only if it's not already there
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from logs import log_info
+    from helpers import get_settings, Settings
+    from .insert_to_database import insert_chunk, insert_query_response
+    from .pull_from_database import lookup_query_response, pull_from_table
+except ModuleNotFoundError as e:
+    logging.error("Module not found: %s", e, exc_info=True)
+except ImportError as e:
+    logging.error("Import error: %s", e, exc_info=True)
+except Exception as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+class AsyncDatabase:
+    """
+    Runs blocking database calls on dedicated threads and awaits their result.
+
+    Attributes:
+        conn (sqlite3.Connection): Connection (or pool proxy) passed to every call.
+        max_workers (int): Number of database threads.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, max_workers: Optional[int] = None):
+        app_settings: Settings = get_settings()
+        self.conn = conn
+        self.max_workers = app_settings.DB_ASYNC_WORKERS if max_workers is None else max_workers
+        if self.max_workers <= 0:
+            raise ValueError("max_workers must be greater than zero.")
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="db-worker"
+        )
+        log_info(f"Async database access started with {self.max_workers} thread(s).")
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``func(conn, *args, **kwargs)`` on a database thread.
+
+        Returns:
+            Any: Whatever ``func`` returns; its exceptions propagate to the caller.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, self.conn, *args, **kwargs)
+        )
+
+    async def pull_from_table(
+        self,
+        table_name: str,
+        rely_data: str = "text",
+        cach: Optional[Tuple[str, str]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Union[List[Dict[str, Any]], Optional[str]]:
+        """Awaitable :func:`pull_from_table`."""
+        return await self.run(
+            pull_from_table, table_name=table_name, rely_data=rely_data, cach=cach, columns=columns
+        )
+
+    async def lookup_query_response(
+        self, user_id: str, query: str, max_age_seconds: Optional[float] = None
+    ) -> Optional[Tuple[str, float]]:
+        """Awaitable :func:`lookup_query_response`."""
+        return await self.run(lookup_query_response, user_id, query, max_age_seconds)
+
+    async def insert_chunk(self, data: pd.DataFrame) -> None:
+        """Awaitable :func:`insert_chunk`."""
+        return await self.run(insert_chunk, data)
+
+    async def insert_query_response(self, query: str, response: str, user_id: str) -> None:
+        """Awaitable :func:`insert_query_response`."""
+        return await self.run(insert_query_response, query, response, user_id)
+
+    def shutdown(self) -> None:
+        """Wait for running calls to finish and stop the database threads."""
+        self._executor.shutdown(wait=True)
+        log_info("Async database access stopped.")
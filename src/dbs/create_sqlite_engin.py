@@ -30,10 +30,13 @@ def create_sqlite_engine():
     """
     Creates a connection to an SQLite database.
     If the database does not exist, it will be created.
+
+    The connection may be used from the chat executor's worker threads,
+    so the same-thread check is disabled.
     """
     try:
         # Create a connection to the SQLite database
-        conn = sqlite3.connect(database=app_setting.DATABASE_URL)
+        conn = sqlite3.connect(database=app_setting.DATABASE_URL, check_same_thread=False)
         log_info(f"Successfully connected to the database: {app_setting.DATABASE_URL}")
         return conn
     except Exception as e:
@@ -2,6 +2,7 @@ import logging
 import os
 import sys
 import sqlite3
+import time
 
 
 FILE_LOCATION = f"{os.path.dirname(__file__)}/create_taples.py"
@@ -16,8 +17,9 @@ try:
     if MAIN_DIR not in sys.path:
         sys.path.append(MAIN_DIR)
 
-    from logs import log_error, log_info
+    from logs import log_error, log_info, log_warning
     from helpers import get_settings, Settings
+    from .query_key import hash_query
 except ModuleNotFoundError as e:
     logging.error("Module not found: %s", e, exc_info=True)
 except ImportError as e:
@@ -28,6 +30,19 @@ except Exception as e:
 
 app_setting: Settings = get_settings()
 
+
+def _add_missing_columns(conn: sqlite3.Connection, table_name: str, columns: dict):
+    """
+    Adds columns introduced after a table was first created, so databases
+    written by older releases keep working.
+    """
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")}
+    for column, declaration in columns.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column} {declaration}")
+            log_info(f"Added column '{column}' to table '{table_name}'.")
+    conn.commit()
+
 def create_chunks_table(conn: sqlite3.Connection):
     try:
         conn.execute("""
@@ -45,6 +60,49 @@ def create_chunks_table(conn: sqlite3.Connection):
         log_error(f"Error creating 'chunks' table: {e}")
         raise
 
+def create_chunks_fts_table(conn: sqlite3.Connection) -> bool:
+    """
+    Creates the FTS5 full-text index over 'chunks.page_contest' used for BM25
+    lexical retrieval.
+
+    The index is an external-content table: it stores only the inverted index
+    and reads chunk text from 'chunks'. New chunks are indexed by
+    ``insert_chunk``; a trigger removes deleted chunks. Chunks stored before the
+    index existed are indexed here.
+
+    Returns:
+        bool: False if this SQLite build lacks FTS5, in which case lexical
+            retrieval is unavailable.
+    """
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+                page_contest,
+                content='chunks',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_delete AFTER DELETE ON chunks BEGIN
+                INSERT INTO chunks_fts (chunks_fts, rowid, page_contest)
+                VALUES ('delete', old.id, old.page_contest);
+            END;
+        """)
+        indexed = conn.execute("SELECT COUNT(*) FROM chunks_fts_docsize").fetchone()[0]
+        stored = conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+        if indexed != stored:
+            conn.execute("INSERT INTO chunks_fts (chunks_fts) VALUES ('rebuild')")
+            log_info(f"Indexed {stored} chunk(s) in 'chunks_fts'.")
+        conn.commit()
+        log_info("Table 'chunks_fts' created successfully.")
+        return True
+    except sqlite3.OperationalError as e:
+        log_warning(f"Full-text index unavailable, lexical retrieval disabled: {e}")
+        return False
+    except Exception as e:
+        log_error(f"Error creating 'chunks_fts' table: {e}")
+        raise
 
 
 def create_embeddings_table(conn: sqlite3.Connection):
@@ -54,15 +112,47 @@ def create_embeddings_table(conn: sqlite3.Connection):
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 chunk_id INTEGER NOT NULL,
                 embedding BLOB NOT NULL,
+                dim INTEGER,
+                dtype TEXT NOT NULL DEFAULT 'json',
                 FOREIGN KEY(chunk_id) REFERENCES chunks(id)
             );
         """)
+        _add_missing_columns(conn, "embeddings", {
+            "dim": "INTEGER",
+            "dtype": "TEXT NOT NULL DEFAULT 'json'",
+        })
         log_info("Table 'embeddings' created successfully.")
     except Exception as e:
         log_error(f"Error creating 'embeddings' table: {e}")
         raise
 
 
+def create_embedding_cache_table(conn: sqlite3.Connection):
+    """
+    Creates the content-addressed 'embedding_cache' table.
+
+    Rows are keyed by (model, normalized, content_hash), where content_hash is
+    the SHA-256 of the chunk text, so stored vectors outlive chunk ids.
+    """
+    try:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                normalized INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                dim INTEGER NOT NULL,
+                dtype TEXT NOT NULL,
+                PRIMARY KEY (model, normalized, content_hash)
+            ) WITHOUT ROWID;
+        """)
+        conn.commit()
+        log_info("Table 'embedding_cache' created successfully.")
+    except Exception as e:
+        log_error(f"Error creating 'embedding_cache' table: {e}")
+        raise
+
+
 def create_query_responses_table(conn: sqlite3.Connection):
     try:
         conn.execute("""
@@ -70,10 +160,46 @@ def create_query_responses_table(conn: sqlite3.Connection):
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id TEXT NOT NULL,
                 query TEXT NOT NULL,
-                response TEXT NOT NULL
+                response TEXT NOT NULL,
+                query_hash TEXT,
+                created_at REAL
             );
         """)
+        _add_missing_columns(conn, "query_responses", {
+            "query_hash": "TEXT",
+            "created_at": "REAL",
+        })
+        _backfill_query_hashes(conn)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_query_responses_user_hash
+            ON query_responses (user_id, query_hash);
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_query_responses_created_at
+            ON query_responses (created_at);
+        """)
+        conn.commit()
         log_info("Table 'query_responses' created successfully.")
     except Exception as e:
         log_error(f"Error creating 'query_responses' table: {e}")
         raise
+
+
+def _backfill_query_hashes(conn: sqlite3.Connection):
+    """
+    Fills in the lookup hash and timestamp of rows cached before those columns
+    existed. Their age is unknown, so they are treated as created now.
+    """
+    rows = conn.execute(
+        "SELECT id, query FROM query_responses WHERE query_hash IS NULL"
+    ).fetchall()
+    if not rows:
+        return
+    now = time.time()
+    with conn:
+        conn.executemany(
+            "UPDATE query_responses SET query_hash = ?, created_at = COALESCE(created_at, ?) "
+            "WHERE id = ?",
+            [(hash_query(query), now, row_id) for row_id, query in rows],
+        )
+    log_info(f"Backfilled cache keys for {len(rows)} row(s) in 'query_responses'.")
@@ -0,0 +1,126 @@
+"""
+Content-addressed store of chunk embeddings in the 'embedding_cache' table.
+
+Vectors are keyed by the embedding model, whether they were normalized, and
+the SHA-256 of the chunk text. Unlike the 'embeddings' table they are not tied
+to chunk ids, so they survive re-chunking: when documents are re-ingested,
+only chunks whose text is new or changed have to go through the encoder.
+The table is emptied whenever the embeddings are reset through /chat/manage.
+"""
+
+import hashlib
+import logging
+import os
+import sys
+import sqlite3
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    # Add to Python path only if it's not already there
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from logs import log_debug, log_error
+    from .embedding_codec import EMBEDDING_DTYPE, decode_embeddings, encode_embedding
+except ModuleNotFoundError as e:
+    logging.error("Module not found: %s", e, exc_info=True)
+except ImportError as e:
+    logging.error("Import error: %s", e, exc_info=True)
+except Exception as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+# Stay well below SQLite's bound-parameter limit (999 on older builds).
+_MAX_IN_PARAMS = 500
+
+
+def hash_chunk_text(text: str) -> str:
+    """
+    Returns the content key of a chunk: the SHA-256 hex digest of its exact text.
+
+    Args:
+        text (str): Chunk text as it is sent to the encoder.
+
+    Returns:
+        str: 64-character hex digest.
+    """
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+
+def lookup_cached_embeddings(
+    conn: sqlite3.Connection, model: str, normalized: bool, content_hashes: Sequence[str]
+) -> Dict[str, np.ndarray]:
+    """
+    Fetches the stored vectors of the given chunk texts.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+        model (str): Name of the embedding model that produced the vectors.
+        normalized (bool): Whether the vectors were L2-normalized.
+        content_hashes (Sequence[str]): Keys from ``hash_chunk_text``.
+
+    Returns:
+        Dict[str, np.ndarray]: float32 vector per content hash found.
+    """
+    wanted = list(dict.fromkeys(content_hashes))
+    found: Dict[str, np.ndarray] = {}
+    try:
+        for start in range(0, len(wanted), _MAX_IN_PARAMS):
+            batch = wanted[start:start + _MAX_IN_PARAMS]
+            placeholders = ", ".join("?" * len(batch))
+            rows = conn.execute(
+                "SELECT content_hash, embedding, dim FROM embedding_cache "
+                f"WHERE model = ? AND normalized = ? AND content_hash IN ({placeholders})",
+                (model, int(normalized), *batch),
+            ).fetchall()
+            for content_hash, blob, dim in rows:
+                found[content_hash] = decode_embeddings([blob], dim)[0]
+    except sqlite3.DatabaseError as db_err:
+        log_error(f"Database error while reading the embedding cache: {db_err}")
+        return {}
+    log_debug(f"Embedding cache: {len(found)} of {len(wanted)} chunk text(s) found.")
+    return found
+
+
+def store_cached_embeddings(
+    conn: sqlite3.Connection,
+    model: str,
+    normalized: bool,
+    content_hashes: Sequence[str],
+    embeddings,
+) -> int:
+    """
+    Stores freshly computed vectors under their content hashes in one transaction.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+        model (str): Name of the embedding model that produced the vectors.
+        normalized (bool): Whether the vectors were L2-normalized.
+        content_hashes (Sequence[str]): Key of each vector.
+        embeddings: 2D array-like of shape (len(content_hashes), dim).
+
+    Returns:
+        int: Number of rows written (0 if the batch was rolled back).
+    """
+    rows: List[tuple] = []
+    for content_hash, embedding in zip(content_hashes, embeddings):
+        embedding_bytes = encode_embedding(embedding)
+        rows.append((model, int(normalized), content_hash, embedding_bytes,
+                     len(embedding_bytes) // 4, EMBEDDING_DTYPE))
+    try:
+        with conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO embedding_cache
+                    (model, normalized, content_hash, embedding, dim, dtype)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+        return len(rows)
+    except sqlite3.DatabaseError as db_err:
+        log_error(f"Database error while writing the embedding cache: {db_err}")
+        return 0
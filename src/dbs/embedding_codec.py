@@ -0,0 +1,67 @@
+"""
+Binary encoding for embedding vectors stored in the 'embeddings' table.
+
+Vectors are written as raw little-endian float32 bytes, with the dimension and
+dtype recorded in their own columns so a whole table can be decoded with a
+single ``np.frombuffer`` call. Rows written by older releases hold a JSON list
+and carry the ``json`` dtype marker until they are migrated.
+"""
+
+import json
+from typing import Iterable, Sequence
+
+import numpy as np
+
+EMBEDDING_DTYPE = "<f4"
+LEGACY_JSON_DTYPE = "json"
+
+
+def encode_embedding(embedding: Iterable[float]) -> bytes:
+    """
+    Serialize one embedding vector to little-endian float32 bytes.
+
+    Args:
+        embedding (Iterable[float]): 1D vector (list, tuple or numpy array).
+
+    Returns:
+        bytes: Raw vector bytes, ``4 * dim`` long.
+    """
+    return np.asarray(embedding, dtype=EMBEDDING_DTYPE).ravel().tobytes()
+
+
+def decode_embeddings(blobs: Sequence[bytes], dim: int) -> np.ndarray:
+    """
+    Decode many float32 blobs of the same dimension in one pass.
+
+    Args:
+        blobs (Sequence[bytes]): Raw vector bytes as returned by SQLite.
+        dim (int): Dimension shared by every vector.
+
+    Returns:
+        np.ndarray: Array of shape (len(blobs), dim) and dtype float32.
+
+    Raises:
+        ValueError: If the blobs do not add up to ``len(blobs) * dim`` floats.
+    """
+    buffer = b"".join(blobs)
+    vectors = np.frombuffer(buffer, dtype=EMBEDDING_DTYPE)
+    if vectors.size != len(blobs) * dim:
+        raise ValueError(
+            f"Expected {len(blobs)} vectors of dimension {dim}, got {vectors.size} floats."
+        )
+    return vectors.reshape(len(blobs), dim).astype(np.float32, copy=False)
+
+
+def decode_legacy_embedding(blob) -> np.ndarray:
+    """
+    Decode a JSON-encoded vector written before the binary format existed.
+
+    Args:
+        blob (Union[str, bytes]): JSON list of floats.
+
+    Returns:
+        np.ndarray: 1D float32 vector.
+    """
+    if isinstance(blob, (bytes, bytearray, memoryview)):
+        blob = bytes(blob).decode("utf-8")
+    return np.asarray(json.loads(blob), dtype=np.float32)
@@ -0,0 +1,78 @@
+"""
+Eviction of stale rows from the 'query_responses' cache table.
+
+Rows older than the configured TTL are deleted first; if the table is still
+above its row cap, the oldest remaining rows are dropped until it fits.
+Both deletes run through the indexes created by
+``create_query_responses_table``.
+"""
+
+import logging
+import os
+import sys
+import sqlite3
+import time
+from typing import List, Tuple
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    # Add to Python path only if it's not already there
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from logs import log_error, log_info
+except ModuleNotFoundError as e:
+    logging.error("Module not found: %s", e, exc_info=True)
+except ImportError as e:
+    logging.error("Import error: %s", e, exc_info=True)
+except Exception as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+def evict_query_responses(
+    conn: sqlite3.Connection, ttl_seconds: float, max_rows: int
+) -> Tuple[int, List[Tuple[str, str]]]:
+    """
+    Deletes expired cache rows, then the oldest rows beyond ``max_rows``.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+        ttl_seconds (float): Maximum row age in seconds; 0 disables expiry.
+        max_rows (int): Maximum number of rows kept; 0 disables the cap.
+
+    Returns:
+        Tuple[int, List[Tuple[str, str]]]: Number of rows removed because they
+            expired, and the ``(user_id, query_hash)`` of every row removed
+            because of the cap, so callers can drop copies they hold in memory.
+    """
+    expired = 0
+    overflow: List[Tuple[str, str]] = []
+    try:
+        with conn:
+            if ttl_seconds > 0:
+                expired = conn.execute(
+                    "DELETE FROM query_responses WHERE created_at < ?",
+                    (time.time() - ttl_seconds,),
+                ).rowcount
+            if max_rows > 0:
+                cutoff = conn.execute(
+                    "SELECT id FROM query_responses ORDER BY id DESC LIMIT 1 OFFSET ?",
+                    (max_rows,),
+                ).fetchone()
+                if cutoff is not None:
+                    overflow = conn.execute(
+                        "SELECT user_id, query_hash FROM query_responses WHERE id <= ?",
+                        cutoff,
+                    ).fetchall()
+                    conn.execute("DELETE FROM query_responses WHERE id <= ?", cutoff)
+        if expired or overflow:
+            log_info(f"Evicted {expired} expired and {len(overflow)} overflow row(s) "
+                     "from 'query_responses'.")
+    except sqlite3.Error as e:
+        log_error(f"Failed to evict rows from 'query_responses': {e}")
+        overflow = []
+    return expired, overflow
@@ -2,7 +2,7 @@ import logging
 import os
 import sys
 import sqlite3
-import json
+import time
 import pandas as pd
 
 from pydantic import ValidationError
@@ -21,6 +21,9 @@ try:
 
     from logs import log_error, log_info
     from helpers import get_settings, Settings
+    from .embedding_codec import EMBEDDING_DTYPE, encode_embedding
+    from .sqlite_pool import unwrap_connection
+    from .query_key import hash_query
 
 except ModuleNotFoundError as e:
     logging.error("Module not found: %s", e, exc_info=True)
@@ -34,14 +37,17 @@ app_setting: Settings = get_settings()
 
 def insert_chunk(conn: sqlite3.Connection, data: pd.DataFrame):
     """
-    Inserts a DataFrame of chunks (with page_counten, pages, sources, authors) into the 'chunks' table.
+    Inserts a DataFrame of chunks (with page_counten, pages, sources, authors) into the 'chunks' table,
+    then adds them to the 'chunks_fts' full-text index.
     """
 
     try:
-        data.to_sql("chunks", conn, if_exists='append', index=False)
+        # pandas only accepts a real sqlite3.Connection, not the pool proxy.
+        data.to_sql("chunks", unwrap_connection(conn), if_exists='append', index=False)
 
         conn.commit()
         log_info(f"Inserted {len(data)} chunk(s) into 'chunks' table.")
+        sync_chunks_fts(conn)
     except sqlite3.DatabaseError as db_err:
         log_error(f"Database error while inserting chunk(s): {db_err}")
         conn.rollback()
@@ -50,19 +56,47 @@ def insert_chunk(conn: sqlite3.Connection, data: pd.DataFrame):
         conn.rollback()
 
 
+def sync_chunks_fts(conn: sqlite3.Connection) -> int:
+    """
+    Adds chunks newer than the last indexed one to the 'chunks_fts' full-text index.
+
+    Chunk ids only grow (AUTOINCREMENT), so everything above the highest indexed
+    id is new. Does nothing when the index does not exist.
+
+    Returns:
+        int: Number of chunks indexed.
+    """
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chunks_fts'"
+    ).fetchone() is None:
+        return 0
+    try:
+        with conn:
+            cursor = conn.execute("""
+                INSERT INTO chunks_fts (rowid, page_contest)
+                SELECT id, page_contest FROM chunks
+                WHERE id > (SELECT COALESCE(MAX(id), 0) FROM chunks_fts_docsize)
+            """)
+        log_info(f"Indexed {cursor.rowcount} chunk(s) in 'chunks_fts'.")
+        return cursor.rowcount
+    except sqlite3.DatabaseError as db_err:
+        log_error(f"Database error while indexing chunk(s) for full-text search: {db_err}")
+        return 0
+
+
 def insert_embedding(conn: sqlite3.Connection, embedding: list, chunk_id: str):
     """
-    Inserts an embedding into the 'embeddings' table after validation.
+    Inserts an embedding into the 'embeddings' table as raw little-endian float32
+    bytes, recording its dimension and dtype alongside.
     """
     cursor = conn.cursor()
     try:
-        # Serialize embedding list to JSON string
-        embedding_json = json.dumps(embedding)
-        
+        embedding_bytes = encode_embedding(embedding)
+
         cursor.execute("""
-            INSERT INTO embeddings (chunk_id, embedding)
-            VALUES (?, ?)
-        """, (chunk_id, embedding_json))
+            INSERT INTO embeddings (chunk_id, embedding, dim, dtype)
+            VALUES (?, ?, ?, ?)
+        """, (chunk_id, embedding_bytes, len(embedding_bytes) // 4, EMBEDDING_DTYPE))
 
         conn.commit()
         log_info(f"Inserted embedding for chunk_id: {chunk_id}")
@@ -73,9 +107,85 @@ def insert_embedding(conn: sqlite3.Connection, embedding: list, chunk_id: str):
         conn.rollback()
 
 
+def insert_embeddings(conn: sqlite3.Connection, chunk_ids: list, embeddings) -> int:
+    """
+    Inserts a batch of embeddings with a single executemany inside one transaction.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+        chunk_ids (list): Chunk id for each embedding row.
+        embeddings: 2D array-like of shape (len(chunk_ids), dim).
+
+    Returns:
+        int: Number of rows inserted (0 if the batch was rolled back).
+    """
+    if len(chunk_ids) != len(embeddings):
+        log_error(f"Got {len(chunk_ids)} chunk ids for {len(embeddings)} embeddings.")
+        return 0
+
+    rows = []
+    for chunk_id, embedding in zip(chunk_ids, embeddings):
+        embedding_bytes = encode_embedding(embedding)
+        rows.append((chunk_id, embedding_bytes, len(embedding_bytes) // 4, EMBEDDING_DTYPE))
+
+    try:
+        with conn:
+            conn.executemany("""
+                INSERT INTO embeddings (chunk_id, embedding, dim, dtype)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+        log_info(f"Inserted {len(rows)} embedding(s) in one transaction.")
+        return len(rows)
+    except sqlite3.DatabaseError as db_err:
+        log_error(f"Database error while inserting embedding batch: {db_err}")
+        return 0
+
+
+def delete_embeddings(conn: sqlite3.Connection, chunk_ids: list) -> int:
+    """
+    Deletes the stored embeddings of the given chunks without committing, so that
+    re-embedded chunks can be written by ``insert_embeddings`` in the same
+    transaction without breaking the one-embedding-per-chunk constraint.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+        chunk_ids (list): Chunks whose embeddings are replaced.
+
+    Returns:
+        int: Number of rows deleted.
+    """
+    cursor = conn.executemany(
+        "DELETE FROM embeddings WHERE chunk_id = ?", [(chunk_id,) for chunk_id in chunk_ids]
+    )
+    return max(cursor.rowcount, 0)
+
+
+def delete_orphan_embeddings(conn: sqlite3.Connection) -> int:
+    """
+    Deletes embeddings whose chunk no longer exists, e.g. after the 'chunks'
+    table was cleared on a database without the ``chunks_deleted`` trigger.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+
+    Returns:
+        int: Number of rows deleted.
+    """
+    with conn:
+        cursor = conn.execute(
+            "DELETE FROM embeddings WHERE chunk_id NOT IN (SELECT id FROM chunks)"
+        )
+    if cursor.rowcount > 0:
+        log_info(f"Deleted {cursor.rowcount} embedding(s) of deleted chunks.")
+    return max(cursor.rowcount, 0)
+
+
 def insert_query_response(conn: sqlite3.Connection, query, response, user_id: str):
     """
     Inserts a query-response pair into the 'query_responses' table after validation.
+
+    The row is stamped with the normalized query hash used for cache lookups
+    and its creation time, used for TTL expiry.
     """
     try:
         if not isinstance(query, str):
@@ -101,9 +211,9 @@ def insert_query_response(conn: sqlite3.Connection, query, response, user_id: st
     try:
         # Validate the query-response data with Pydantic
         cursor.execute("""
-            INSERT INTO query_responses (user_id, query, response)
-            VALUES (?, ?, ?)
-        """, (user_id, query, response))
+            INSERT INTO query_responses (user_id, query, response, query_hash, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (user_id, query, response, hash_query(query), time.time()))
 
         conn.commit()
 
@@ -112,3 +222,35 @@ def insert_query_response(conn: sqlite3.Connection, query, response, user_id: st
     except Exception as e:
         log_error(f"Error inserting query-response pair: {e}")
         conn.rollback()
+
+
+def insert_query_responses(conn: sqlite3.Connection, rows: list) -> int:
+    """
+    Inserts a batch of query-response rows with a single executemany inside one transaction.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+        rows (list): (user_id, query, response, created_at) tuples; rows whose
+            fields are not strings are skipped.
+
+    Returns:
+        int: Number of rows inserted.
+
+    Raises:
+        sqlite3.DatabaseError: If the transaction failed and was rolled back.
+    """
+    records = []
+    for user_id, query, response, created_at in rows:
+        if not all(isinstance(value, str) for value in (user_id, query, response)):
+            log_error("Skipped a query-response row with non-string fields.")
+            continue
+        records.append((user_id, query, response, hash_query(query), created_at))
+    if not records:
+        return 0
+
+    with conn:
+        conn.executemany("""
+            INSERT INTO query_responses (user_id, query, response, query_hash, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, records)
+    return len(records)
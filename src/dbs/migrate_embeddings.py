@@ -0,0 +1,96 @@
+"""
+One-shot migration of JSON-encoded embeddings to the binary float32 format.
+
+Older releases stored each vector as ``json.dumps(list)`` text. This module
+rewrites those rows in place as raw little-endian float32 bytes and fills in
+the ``dim``/``dtype`` columns. Rows already in the binary format are left
+untouched, so running it twice is harmless.
+
+Usage:
+    python -m src.dbs.migrate_embeddings
+"""
+
+import logging
+import os
+import sys
+import sqlite3
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    # Add to Python path only if it's not already there
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from logs import log_error, log_info
+    from .create_sqlite_engin import create_sqlite_engine
+    from .create_taples import create_embeddings_table
+    from .embedding_codec import (
+        EMBEDDING_DTYPE,
+        LEGACY_JSON_DTYPE,
+        decode_legacy_embedding,
+        encode_embedding,
+    )
+except ModuleNotFoundError as e:
+    logging.error("Module not found: %s", e, exc_info=True)
+except ImportError as e:
+    logging.error("Import error: %s", e, exc_info=True)
+except Exception as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+def migrate_json_embeddings(conn: sqlite3.Connection, batch_size: int = 1000) -> int:
+    """
+    Converts every JSON-encoded embedding row to the binary float32 format.
+
+    Each batch is rewritten inside its own transaction, so an interrupted run
+    can simply be restarted.
+
+    Args:
+        conn (sqlite3.Connection): An active database connection.
+        batch_size (int): Number of rows converted per transaction.
+
+    Returns:
+        int: Number of rows migrated.
+    """
+    create_embeddings_table(conn)
+    migrated = 0
+    try:
+        while True:
+            rows = conn.execute(
+                "SELECT id, embedding FROM embeddings WHERE dtype = ? LIMIT ?",
+                (LEGACY_JSON_DTYPE, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+
+            updates = []
+            for row_id, blob in rows:
+                vector = decode_legacy_embedding(blob)
+                updates.append((encode_embedding(vector), vector.size, EMBEDDING_DTYPE, row_id))
+
+            with conn:
+                conn.executemany(
+                    "UPDATE embeddings SET embedding = ?, dim = ?, dtype = ? WHERE id = ?",
+                    updates,
+                )
+            migrated += len(updates)
+            log_info(f"Migrated {migrated} embedding(s) to {EMBEDDING_DTYPE} so far.")
+
+        conn.execute("VACUUM")
+        log_info(f"Embedding migration finished: {migrated} row(s) converted.")
+        return migrated
+    except (sqlite3.Error, ValueError) as e:
+        log_error(f"Embedding migration failed after {migrated} row(s): {e}")
+        raise
+
+
+if __name__ == "__main__":
+    connection = create_sqlite_engine()
+    try:
+        migrate_json_embeddings(connection)
+    finally:
+        connection.close()
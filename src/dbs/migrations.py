@@ -0,0 +1,168 @@
+"""
+Schema migrations tracked with SQLite's ``user_version`` pragma.
+
+The ``create_*_table`` functions create the base tables; migrations evolve them
+afterwards. Each migration has a version number and is applied once, in order,
+when the database is older than it.
+
+``run_migrations`` applies every pending migration in a single ``BEGIN
+IMMEDIATE`` transaction and re-reads the version once the write lock is held.
+Several workers starting together therefore apply each migration exactly once:
+the others wait for the lock and then find nothing left to do. SQLite DDL is
+transactional, so a failing migration leaves both the schema and the version
+untouched.
+"""
+
+import logging
+import os
+import sys
+import sqlite3
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    # Add to Python path only if it's not already there
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from logs import log_error, log_info, log_warning
+except ModuleNotFoundError as e:
+    logging.error("Module not found: %s", e, exc_info=True)
+except ImportError as e:
+    logging.error("Import error: %s", e, exc_info=True)
+except Exception as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+# (version, description, apply); apply runs inside the migration transaction.
+Migration = Tuple[int, str, Callable[[sqlite3.Connection], None]]
+
+
+def _index_chunk_metadata(conn: sqlite3.Connection) -> None:
+    """Index the columns metadata filters select chunks by."""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_sources ON chunks (sources)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_authors ON chunks (authors)")
+
+
+def _unique_embedding_per_chunk(conn: sqlite3.Connection) -> None:
+    """
+    Keep the newest embedding of every chunk and forbid duplicates from now on.
+    The unique index also serves the ``chunk_id`` lookups of retrieval.
+    """
+    removed = conn.execute(
+        "DELETE FROM embeddings WHERE id NOT IN "
+        "(SELECT MAX(id) FROM embeddings GROUP BY chunk_id)"
+    ).rowcount
+    if removed:
+        log_warning(f"Removed {removed} duplicate embedding(s) from table 'embeddings'.")
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_embeddings_chunk_id ON embeddings (chunk_id)"
+    )
+
+
+def _drop_embeddings_of_edited_chunks(conn: sqlite3.Connection) -> None:
+    """
+    Delete a chunk's embedding when its text changes, so the next ingestion
+    re-embeds exactly the edited chunks.
+    """
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunks_text_changed
+        AFTER UPDATE OF page_contest ON chunks
+        WHEN old.page_contest IS NOT new.page_contest
+        BEGIN
+            DELETE FROM embeddings WHERE chunk_id = new.id;
+        END;
+    """)
+
+
+def _drop_embeddings_of_deleted_chunks(conn: sqlite3.Connection) -> None:
+    """
+    Delete a chunk's embedding together with the chunk, so clearing 'chunks'
+    cannot leave vectors behind under ids that no longer exist.
+    """
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS chunks_deleted
+        AFTER DELETE ON chunks
+        BEGIN
+            DELETE FROM embeddings WHERE chunk_id = old.id;
+        END;
+    """)
+
+
+MIGRATIONS: List[Migration] = [
+    (1, "index chunks by source and author", _index_chunk_metadata),
+    (2, "allow one embedding per chunk", _unique_embedding_per_chunk),
+    (3, "drop embeddings of edited chunks", _drop_embeddings_of_edited_chunks),
+    (4, "drop embeddings of deleted chunks", _drop_embeddings_of_deleted_chunks),
+]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in the database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(
+    conn: sqlite3.Connection,
+    migrations: Optional[Sequence[Migration]] = None,
+    lock_timeout: float = 60.0,
+) -> int:
+    """
+    Apply every migration newer than the database's schema version.
+
+    Args:
+        conn (sqlite3.Connection): SQLite connection; the base tables must exist.
+        migrations (Optional[Sequence[Migration]]): Migrations to apply; defaults
+            to ``MIGRATIONS``.
+        lock_timeout (float): Seconds to wait for another process to finish
+            migrating before giving up.
+
+    Returns:
+        int: The schema version after migrating.
+
+    Raises:
+        sqlite3.Error: If the write lock cannot be taken or a migration fails;
+            the database is left at its previous version.
+    """
+    migrations = sorted(MIGRATIONS if migrations is None else migrations, key=lambda m: m[0])
+    latest = migrations[-1][0] if migrations else 0
+    version = schema_version(conn)
+    if version >= latest:
+        log_info(f"Database schema is up to date (version {version}).")
+        return version
+
+    _begin_immediate(conn, lock_timeout)
+    try:
+        # Another worker may have migrated while this one waited for the lock.
+        version = schema_version(conn)
+        for number, description, apply in migrations:
+            if number <= version:
+                continue
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {int(number)}")
+            log_info(f"Applied schema migration {number}: {description}.")
+            version = number
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        log_error(f"Schema migration failed, database left at version "
+                  f"{schema_version(conn)}: {e}")
+        raise
+    return version
+
+
+def _begin_immediate(conn: sqlite3.Connection, lock_timeout: float) -> None:
+    """Open a write transaction, retrying while another connection holds the lock."""
+    deadline = time.monotonic() + lock_timeout
+    while True:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            return
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e) or time.monotonic() >= deadline:
+                raise
+            time.sleep(0.1)
@@ -2,7 +2,8 @@ import logging
 import os
 import sys
 import sqlite3
-from typing import List, Optional, Dict, Any, Union, Tuple
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 
 try:
@@ -15,6 +16,8 @@ try:
         sys.path.append(MAIN_DIR)
 
     from logs import log_debug, log_error, log_info
+    from helpers import get_settings
+    from .query_key import hash_query
 except ModuleNotFoundError as e:
     logging.error("Module not found: %s", e, exc_info=True)
 except ImportError as e:
@@ -23,6 +26,35 @@ except Exception as e:
     logging.critical("Unexpected setup error: %s", e, exc_info=True)
     raise
 
+def lookup_query_response(
+    conn: sqlite3.Connection,
+    user_id: str,
+    query: str,
+    max_age_seconds: Optional[float] = None,
+) -> Optional[Tuple[str, float]]:
+    """
+    Fetches the most recent cached response for a user's query through the
+    (user_id, query_hash) index. Queries match after case and whitespace folding.
+
+    Args:
+        conn (sqlite3.Connection): SQLite connection.
+        user_id (str): User the response was generated for.
+        query (str): The user's query.
+        max_age_seconds (Optional[float]): Ignore rows older than this many seconds.
+
+    Returns:
+        Optional[Tuple[str, float]]: (response, created_at), or None if nothing fresh is cached.
+    """
+    sql = ("SELECT response, created_at FROM query_responses "
+           "WHERE user_id = ? AND query_hash = ?")
+    params: list = [user_id, hash_query(query)]
+    if max_age_seconds:
+        sql += " AND created_at >= ?"
+        params.append(time.time() - max_age_seconds)
+    row = conn.execute(sql + " ORDER BY id DESC LIMIT 1", params).fetchone()
+    return (row[0], row[1]) if row else None
+
+
 def pull_from_table(
     conn: sqlite3.Connection,
     table_name: str,
@@ -33,6 +65,9 @@ def pull_from_table(
     """
     Pulls data from a specified table or retrieves a cached response.
 
+    The general mode builds the whole table in memory; use ``stream_from_table``
+    or ``stream_columns`` to walk large tables in bounded memory.
+
     Args:
         conn (sqlite3.Connection): SQLite connection.
         table_name (str): Target table name.
@@ -51,8 +86,9 @@ def pull_from_table(
         if cach:
             user_id, query = cach
             cursor.execute(
-                "SELECT response FROM query_responses WHERE user_id = ? AND query = ?",
-                (user_id, query)
+                "SELECT response FROM query_responses WHERE user_id = ? AND query_hash = ? "
+                "ORDER BY id DESC LIMIT 1",
+                (user_id, hash_query(query))
             )
             row = cursor.fetchone()
             log_info(f"[CACHE MODE] Queried cache for user_id={user_id}, query='{query}'. Found: {bool(row)}")
@@ -74,3 +110,99 @@ def pull_from_table(
         return None if cach else []
     finally:
         log_debug("Executed pull_from_table.")
+
+
+def stream_from_table(
+    conn: sqlite3.Connection,
+    table_name: str,
+    columns: Sequence[str],
+    batch_size: Optional[int] = None,
+    order_by: Optional[str] = None,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    Yields the rows of a table in ``fetchmany`` batches of at most ``batch_size``.
+
+    Only one batch is held in Python objects at a time, so memory stays bounded
+    whatever the size of the table. The cursor stays open until the generator is
+    exhausted or closed.
+
+    Args:
+        conn (sqlite3.Connection): SQLite connection.
+        table_name (str): Target table name.
+        columns (Sequence[str]): Column names to select, in row order.
+        batch_size (Optional[int]): Rows per batch; defaults to DB_FETCH_BATCH_SIZE.
+        order_by (Optional[str]): Column to order the rows by.
+
+    Yields:
+        List[Tuple[Any, ...]]: The next batch of rows.
+
+    Raises:
+        ValueError: If a table or column name is not a valid identifier, or
+            batch_size is not positive.
+    """
+    names = [table_name, *columns] + ([order_by] if order_by else [])
+    if not columns or not all(name.isidentifier() for name in names):
+        raise ValueError("Table and column names must be valid SQL identifiers.")
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("batch_size must be greater than zero.")
+
+    sql = f"SELECT {', '.join(columns)} FROM {table_name}"
+    if order_by:
+        sql += f" ORDER BY {order_by}"
+    yield from stream_query(conn, sql, batch_size=batch_size)
+
+
+def stream_query(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: Sequence[Any] = (),
+    batch_size: Optional[int] = None,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """
+    Yields the rows of an arbitrary SELECT in ``fetchmany`` batches, e.g. for
+    joins that ``stream_from_table`` cannot express.
+
+    Args:
+        conn (sqlite3.Connection): SQLite connection.
+        sql (str): The SELECT statement; values must be bound through ``params``.
+        params (Sequence[Any]): Parameters bound to the statement.
+        batch_size (Optional[int]): Rows per batch; defaults to DB_FETCH_BATCH_SIZE.
+
+    Yields:
+        List[Tuple[Any, ...]]: The next batch of rows.
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size is None:
+        batch_size = get_settings().DB_FETCH_BATCH_SIZE
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than zero.")
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(sql, params)
+        while rows := cursor.fetchmany(batch_size):
+            yield rows
+    finally:
+        cursor.close()
+
+
+def stream_columns(
+    conn: sqlite3.Connection,
+    table_name: str,
+    columns: Sequence[str],
+    batch_size: Optional[int] = None,
+    order_by: Optional[str] = None,
+) -> Iterator[Dict[str, Tuple[Any, ...]]]:
+    """
+    Column-wise variant of ``stream_from_table``.
+
+    Each batch maps a column name to the tuple of its values, ready for
+    ``np.fromiter``/``np.asarray`` or a list of texts for an encoder.
+
+    Yields:
+        Dict[str, Tuple[Any, ...]]: The next batch, one tuple per column.
+    """
+    for rows in stream_from_table(conn, table_name, columns, batch_size, order_by):
+        yield dict(zip(columns, zip(*rows)))
@@ -0,0 +1,35 @@
+"""
+Normalized lookup keys for the 'query_responses' cache.
+
+Queries that differ only in letter case or whitespace share one cache entry:
+the query is case-folded and its whitespace collapsed before being hashed,
+and the hash is what the composite (user_id, query_hash) index is built on.
+"""
+
+import hashlib
+
+
+def normalize_query(query: str) -> str:
+    """
+    Folds case and collapses runs of whitespace in a user query.
+
+    Args:
+        query (str): Raw user query.
+
+    Returns:
+        str: Normalized query text.
+    """
+    return " ".join(query.split()).casefold()
+
+
+def hash_query(query: str) -> str:
+    """
+    Returns the cache key for a query: the SHA-256 hex digest of its normalized form.
+
+    Args:
+        query (str): Raw user query.
+
+    Returns:
+        str: 64-character hex digest.
+    """
+    return hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
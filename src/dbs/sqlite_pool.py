@@ -0,0 +1,263 @@
+"""
+Per-thread SQLite connection pool with WAL mode and tuned pragmas.
+
+A single shared connection serializes every statement of every request: the
+cache eviction thread, the chat executor workers and the request threadpool
+all queue on the same handle. The pool instead gives each thread its own
+connection, opened on first use with:
+
+- ``journal_mode=WAL``, so readers never block the writer or each other;
+- a tuned ``synchronous`` level (NORMAL is durable across application
+  crashes in WAL mode and avoids an fsync per commit);
+- ``mmap_size`` and ``cache_size`` for the page cache;
+- a ``busy_timeout``, so writers wait for each other instead of failing.
+
+``SQLitePool.proxy`` is a drop-in stand-in for ``sqlite3.Connection``: code that
+receives it from ``app.state.conn`` keeps calling ``execute``/``commit``/``with
+conn:`` as before, and each call is routed to the calling thread's connection.
+Connections of finished threads are reclaimed, and open connections, creations
+and waits for a free slot are exported as Prometheus metrics.
+"""
+
+import logging
+import os
+import sys
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    # Add to Python path only if it's not already there
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from logs import log_debug, log_error, log_info
+    from helpers import get_settings, Settings
+    from src.logs.metrics import (
+        DB_POOL_CONNECTIONS,
+        DB_POOL_CONNECTIONS_CREATED_TOTAL,
+        DB_POOL_WAIT_SECONDS,
+    )
+except ModuleNotFoundError as e:
+    logging.error("Module not found: %s", e, exc_info=True)
+except ImportError as e:
+    logging.error("Import error: %s", e, exc_info=True)
+except Exception as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+_SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+class SQLitePool:
+    """
+    Hands every thread its own SQLite connection to the same database.
+
+    An in-memory database (``:memory:``) exists only inside one connection, so
+    for it every thread shares a single connection instead.
+
+    Attributes:
+        database (str): Path of the SQLite database file.
+        max_connections (int): Maximum number of open connections.
+        busy_timeout_ms (int): How long a statement waits for a lock held by
+            another connection, and a thread waits for a free pool slot.
+        proxy (PooledConnection): Connection-like object routing every call to
+            the calling thread's connection.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        database: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        busy_timeout_ms: Optional[int] = None,
+        synchronous: Optional[str] = None,
+        mmap_size: Optional[int] = None,
+        cache_size_kb: Optional[int] = None,
+    ):
+        app_settings: Settings = get_settings()
+        self.database = database or app_settings.DATABASE_URL
+        self.max_connections = (app_settings.DB_POOL_MAX_CONNECTIONS
+                                if max_connections is None else max_connections)
+        self.busy_timeout_ms = (app_settings.DB_BUSY_TIMEOUT_MS
+                                if busy_timeout_ms is None else busy_timeout_ms)
+        self.synchronous = (synchronous or app_settings.DB_SYNCHRONOUS).upper()
+        self.mmap_size = app_settings.DB_MMAP_SIZE if mmap_size is None else mmap_size
+        self.cache_size_kb = (app_settings.DB_CACHE_SIZE_KB
+                              if cache_size_kb is None else cache_size_kb)
+        if self.max_connections <= 0:
+            raise ValueError("max_connections must be greater than zero.")
+        if self.synchronous not in _SYNCHRONOUS_LEVELS:
+            raise ValueError(f"synchronous must be one of {', '.join(_SYNCHRONOUS_LEVELS)}.")
+
+        self._shared = self.database == ":memory:"
+        self._connections: Dict[int, Tuple[Any, sqlite3.Connection]] = {}
+        self._slot_freed = threading.Condition()
+        self._closed = False
+        self.proxy = PooledConnection(self)
+        log_info(f"SQLite pool for '{self.database}' ready (max {self.max_connections} "
+                 f"connection(s), synchronous={self.synchronous}).")
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Open connections and configured limits."""
+        with self._slot_freed:
+            open_connections = len(self._connections)
+        return {
+            "open_connections": open_connections,
+            "max_connections": self.max_connections,
+            "busy_timeout_ms": self.busy_timeout_ms,
+            "synchronous": self.synchronous,
+        }
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's connection, opening it on first use.
+
+        Raises:
+            sqlite3.OperationalError: If the pool is closed, or no slot was freed
+                within the busy timeout.
+        """
+        key = 0 if self._shared else threading.get_ident()
+        entry = self._connections.get(key)
+        if entry is not None and (self._shared or entry[0]() is threading.current_thread()):
+            return entry[1]
+        return self._open(key)
+
+    def close_all(self) -> None:
+        """Close every connection; later calls through the proxy fail."""
+        with self._slot_freed:
+            self._closed = True
+            for _, conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+            DB_POOL_CONNECTIONS.set(0)
+            self._slot_freed.notify_all()
+        log_info(f"SQLite pool for '{self.database}' closed.")
+
+    def _open(self, key: int) -> sqlite3.Connection:
+        deadline = time.monotonic() + self.busy_timeout_ms / 1000
+        waited_since: Optional[float] = None
+        with self._slot_freed:
+            while True:
+                if self._closed:
+                    raise sqlite3.OperationalError("The connection pool is closed.")
+                if self._shared and key in self._connections:
+                    return self._connections[key][1]
+                self._reclaim_finished_threads()
+                if len(self._connections) < self.max_connections:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    log_error(f"SQLite pool exhausted ({self.max_connections} connections).")
+                    raise sqlite3.OperationalError(
+                        "No database connection available, try again shortly.")
+                waited_since = waited_since or time.monotonic()
+                # Thread exits are not signalled, so poll for reclaimable slots.
+                self._slot_freed.wait(timeout=min(remaining, 0.05))
+            if waited_since is not None:
+                DB_POOL_WAIT_SECONDS.observe(time.monotonic() - waited_since)
+
+            conn = self._connect()
+            self._connections[key] = (weakref.ref(threading.current_thread()), conn)
+            DB_POOL_CONNECTIONS.set(len(self._connections))
+            DB_POOL_CONNECTIONS_CREATED_TOTAL.inc()
+            log_debug(f"Opened SQLite connection {len(self._connections)}/"
+                      f"{self.max_connections} for thread {threading.current_thread().name}.")
+            return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            database=self.database,
+            check_same_thread=False,
+            timeout=self.busy_timeout_ms / 1000,
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        if not self._shared:
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kb)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def _reclaim_finished_threads(self) -> None:
+        """Close connections whose thread has exited. Caller holds ``_slot_freed``."""
+        if self._shared:
+            return
+        finished = [key for key, (thread_ref, _) in self._connections.items()
+                    if thread_ref() is None or not thread_ref().is_alive()]
+        for key in finished:
+            self._connections.pop(key)[1].close()
+        if finished:
+            DB_POOL_CONNECTIONS.set(len(self._connections))
+            self._slot_freed.notify_all()
+
+
+class PooledConnection:
+    """
+    ``sqlite3.Connection`` look-alike that forwards to the calling thread's connection.
+
+    Attribute access (``execute``, ``commit``, ``cursor``, ``total_changes``, ...)
+    and ``with conn:`` transactions resolve to the connection the pool holds for
+    the current thread, so one object can be shared across threads safely.
+    ``close()`` closes the whole pool.
+    """
+
+    def __init__(self, pool: SQLitePool):
+        self._pool = pool
+
+    @property
+    def pool(self) -> SQLitePool:
+        """The pool this proxy draws connections from."""
+        return self._pool
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool.connection(), name)
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._pool.connection().__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        return self._pool.connection().__exit__(exc_type, exc_value, traceback)
+
+    def close(self) -> None:
+        """Close every connection of the pool, e.g. on application shutdown."""
+        self._pool.close_all()
+
+
+def unwrap_connection(conn: Any) -> Any:
+    """
+    Return the calling thread's real ``sqlite3.Connection`` behind a pool proxy.
+
+    Needed by libraries that type-check the connection, such as
+    ``DataFrame.to_sql``. Anything else is returned unchanged.
+    """
+    if isinstance(conn, PooledConnection):
+        return conn.pool.connection()
+    return conn
+
+
+def create_sqlite_pool() -> SQLitePool:
+    """
+    Creates the application's connection pool from the DB_* settings.
+
+    Returns:
+        SQLitePool: The pool; share ``pool.proxy`` as the application connection.
+    """
+    try:
+        pool = SQLitePool()
+        with pool.proxy:
+            journal_mode = pool.proxy.execute("PRAGMA journal_mode").fetchone()[0]
+        log_info(f"Successfully connected to the database: {pool.database} "
+                 f"(journal_mode={journal_mode}).")
+        return pool
+    except Exception as e:
+        log_error(f"Failed to create the database connection pool: {e}")
+        raise
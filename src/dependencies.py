@@ -8,7 +8,7 @@ import logging
 import os
 import sys
 import sqlite3
-from typing import Any
+from typing import Any, Optional
 from fastapi import Request, HTTPException
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
@@ -59,6 +59,18 @@ def get_db_conn(request: Request) -> sqlite3.Connection:
     return conn
 
 
+def get_async_db(request: Request) -> Any:
+    """Retrieve the awaitable database access layer from the app state."""
+    async_db = getattr(request.app.state, "async_db", None)
+    if not async_db:
+        log_debug("Async database access not found in application state.")
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database service unavailable."
+        )
+    return async_db
+
+
 def get_embedd(request: Request) -> Any:
     """Retrieve the embedding model from the app state."""
     embedding = getattr(request.app.state, "embedding_model", None)
@@ -71,6 +83,11 @@ def get_embedd(request: Request) -> Any:
     return embedding
 
 
+def get_optional_embedd(request: Request) -> Optional[Any]:
+    """Retrieve the embedding model from the app state, or None while it is not loaded."""
+    return getattr(request.app.state, "embedding_model", None)
+
+
 def get_chat_history(request: Request) -> Any:
     """Retrieve the chat history manager from the app state."""
     chat_history = getattr(request.app.state, "chat_manager", None)
@@ -81,3 +98,49 @@ def get_chat_history(request: Request) -> Any:
             detail="Chat history service unavailable."
         )
     return chat_history
+
+
+def get_chat_executor(request: Request) -> Any:
+    """Retrieve the bounded chat executor from the app state."""
+    chat_executor = getattr(request.app.state, "chat_executor", None)
+    if not chat_executor:
+        log_debug("Chat executor not found in application state.")
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Chat execution service unavailable."
+        )
+    return chat_executor
+
+
+def get_index_service(request: Request) -> Any:
+    """Retrieve the persistent FAISS index service from the app state."""
+    index_service = getattr(request.app.state, "index_service", None)
+    if not index_service:
+        log_debug("FAISS index service not found in application state.")
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Vector index service unavailable."
+        )
+    return index_service
+
+
+def get_response_cache(request: Request) -> Any:
+    """Retrieve the query-response cache from the app state."""
+    response_cache = getattr(request.app.state, "response_cache", None)
+    if not response_cache:
+        log_debug("Response cache not found in application state.")
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Response cache service unavailable."
+        )
+    return response_cache
+
+
+def get_reranker(request: Request) -> Optional[Any]:
+    """Retrieve the cross-encoder reranker from the app state, or None when disabled."""
+    return getattr(request.app.state, "reranker", None)
+
+
+def get_semantic_cache(request: Request) -> Optional[Any]:
+    """Retrieve the semantic response cache from the app state, or None when disabled."""
+    return getattr(request.app.state, "semantic_cache", None)
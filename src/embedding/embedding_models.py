@@ -3,8 +3,9 @@
 import logging
 import os
 import sys
+import numpy as np
 from sentence_transformers import SentenceTransformer
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 FILE_LOCATION = f"{os.path.dirname(__file__)}/sentence_model.py"
 
@@ -58,7 +59,26 @@ class EmbeddingModel:
         except Exception as e:
             log_error(f"Error generating embedding: {e}")
             return None
-        
+
+    def embed_batch(self, texts: List[str], batch_size: int = 64, normalize_embeddings: bool = False) -> np.ndarray:
+        """
+        Encode many texts in batches of ``batch_size`` and return a float32 matrix
+        of shape (len(texts), dim). Errors are raised so callers can stop ingestion.
+        """
+        try:
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=normalize_embeddings,
+                show_progress_bar=False,
+            )
+            log_info(f"Generated {len(texts)} embedding(s) in batches of {batch_size}.")
+            return np.asarray(embeddings, dtype=np.float32)
+        except Exception as e:
+            log_error(f"Error generating batch embeddings: {e}")
+            raise
+
 
 if __name__ == "__main__":
     # Example usage
@@ -15,8 +15,14 @@ from .enums_chat_history import ChatHistoryMessages
 from .enums_database_retrever import DBRetrievalMessages
 from .enums_embedding_query import EmbeddingQueryLogMessages
 from .enums_faiss_sarch import FaissSearchLogMessages
-from .enums_retrieval import RetrievalLogMessages
+from .enums_retrieval import RetrievalLogMessages, RetrievalMode
+from .enums_lexical_search import LexicalSearchLogMessages
+from .enums_reranker import RerankerLogMessages
+from .enums_index_service import IndexServiceLogMessages
+from .enums_response_cache import ResponseCacheLogMessages
+from .enums_semantic_cache import SemanticCacheLogMessages
 
 
 from .enums_main import MainAppLogMessages
 from .enums_llms_support import LLMType
+from .enums_faiss_index_type import FaissIndexType, FaissMetric
@@ -28,5 +28,9 @@ class DBRetrievalMessages(Enum):
     NO_EMBEDDINGS_FOUND = "No embeddings found in the database."
     SQLITE_ERROR = "SQLite error occurred: {}"
     DATA_ERROR = "Data processing error occurred: {}"
+    MIXED_DIMENSIONS = "Stored embeddings have inconsistent dimensions: {}"
+    LEGACY_ROWS_FOUND = ("{} embedding(s) are still JSON-encoded; run "
+                         "'python -m src.dbs.migrate_embeddings' to convert them.")
+    CHUNKS_FETCHED = "Fetched {} of {} requested chunks in one query."
     FUNCTION_COMPLETED = ("database_retrieval.load_embeddings_and_metadata:"
                            "Function execution completed.")
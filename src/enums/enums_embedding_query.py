@@ -34,6 +34,7 @@ class EmbeddingQueryLogMessages(Enum):
         INFO_STARTING_EMBED (str): Log when embedding starts for a specific query.
         INFO_EMBED_SUCCESS (str): Log when embedding completes successfully.
         INFO_EMBED_COMPLETED (str): Log when embedding operation is fully done.
+        DEBUG_CACHE_HIT (str): Log when a query embedding is served from the cache.
         WARN_DEPRECATED_FEATURE (str): Warn about usage of deprecated features.
         WARN_SLOW_EMBEDDING (str): Warn about embedding operation taking too long.
         ERR_IMPORT_FAILURE (str): Log import failures in embedding module.
@@ -54,6 +55,9 @@ class EmbeddingQueryLogMessages(Enum):
     INFO_EMBED_SUCCESS = "Embedding successful for query."
     INFO_EMBED_COMPLETED = "Embedding operation completed."
 
+    # Debug messages
+    DEBUG_CACHE_HIT = "Query embedding served from cache for query: '{}'"
+
     # Warning messages
     WARN_DEPRECATED_FEATURE = "Deprecated feature used in embedder: '{}'"
     WARN_SLOW_EMBEDDING = "Embedding operation took longer than expected: {} seconds."
@@ -0,0 +1,39 @@
+"""
+faiss_index_type module.
+
+Defines the FAISS index layouts and similarity metrics the vector index can be
+built with.
+"""
+
+from enum import Enum
+
+
+class FaissIndexType(str, Enum):
+    """
+    Enumeration of supported FAISS index types.
+
+    Members:
+        FLAT (str): Exact brute-force search; no training, best recall.
+        IVF_FLAT (str): Inverted lists over full vectors; tuned with nlist/nprobe.
+        HNSW (str): Graph-based search; tuned with M/efConstruction/efSearch.
+        IVF_PQ (str): Inverted lists over product-quantized vectors; smallest memory.
+    """
+
+    FLAT = "Flat"
+    IVF_FLAT = "IVFFlat"
+    HNSW = "HNSW"
+    IVF_PQ = "IVFPQ"
+
+
+class FaissMetric(str, Enum):
+    """
+    Enumeration of supported similarity metrics for the vector index.
+
+    Members:
+        L2 (str): Squared Euclidean distance over the raw embeddings.
+        COSINE (str): Cosine similarity; vectors are L2-normalized and searched by
+            inner product.
+    """
+
+    L2 = "l2"
+    COSINE = "cosine"
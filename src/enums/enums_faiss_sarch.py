@@ -10,9 +10,16 @@ class FaissSearchLogMessages(Enum):
 
     INFO_START_BUILD = "[FAISS_BUILD] Starting to build FAISS index."
     INFO_INDEX_SUCCESS = "[FAISS_BUILD] FAISS index successfully created."
+    INFO_TRAINING = "[FAISS_BUILD] Training {} index on {} of {} vectors."
+    INFO_INDEX_SPEC = ("[FAISS_BUILD] Using index '{}' ({} metric) for {} vectors of "
+                       "dimension {}.")
+
+    WARN_TOO_FEW_FOR_PQ = ("[FAISS_BUILD] {} vectors are too few to train IVFPQ codebooks "
+                           "(need {}); using IVFFlat until the index is rebuilt.")
 
     ERR_IMPORT_FAILURE = "[FAISS_IMPORT_ERROR] Failed to set up FAISS module: {}"
     ERR_BUILD_FAILED = "[FAISS_BUILD_ERROR] Exception occurred while building FAISS index: {}"
 
     RAISE_INVALID_EMBEDDINGS = "Invalid embeddings: expected a 2D NumPy array."
     RAISE_INDEX_BUILD_FAILED = "Failed to build FAISS index: {}"
+    RAISE_PQ_DIM = "Embedding dimension {} is not divisible by FAISS_PQ_M={}."
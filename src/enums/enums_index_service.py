@@ -0,0 +1,38 @@
+"""
+Enums for the persistent FAISS index service log messages and raised exceptions.
+"""
+
+from enum import Enum
+
+
+class IndexServiceLogMessages(Enum):
+    """Enum for log and raise messages in the index_service module."""
+
+    INFO_LOADED_FROM_DISK = "[INDEX_SERVICE] Loaded FAISS index with {} vectors from '{}'{}."
+    INFO_BUILT_FROM_DB = "[INDEX_SERVICE] Built FAISS index with {} vectors from the database."
+    INFO_SAVED = "[INDEX_SERVICE] Saved FAISS index with {} vectors to '{}'."
+    INFO_VECTORS_ADDED = "[INDEX_SERVICE] Added {} vectors to the index (total: {})."
+    INFO_RESET = "[INDEX_SERVICE] Index cleared."
+    INFO_CHANGED_ON_DISK = "[INDEX_SERVICE] Index file '{}' was replaced; reloading."
+    INFO_REMOVED_ON_DISK = "[INDEX_SERVICE] Index file was removed; dropping the in-memory index."
+    DEBUG_FILTER_BITMAP = "[INDEX_SERVICE] Filter bitmap selects {} of {} rows for {}."
+    INFO_EMPTY_CORPUS = "[INDEX_SERVICE] No embeddings stored yet; starting with an empty index."
+
+    WARN_STALE_ON_DISK = ("[INDEX_SERVICE] Index on disk holds {} vectors but the database "
+                          "has {}; rebuilding.")
+
+    WARN_TYPE_CHANGED = ("[INDEX_SERVICE] Index on disk is {} but FAISS_INDEX_TYPE is {}; "
+                         "rebuilding.")
+    WARN_METRIC_CHANGED = ("[INDEX_SERVICE] Index on disk uses the {} metric but FAISS_METRIC "
+                           "is {}; rebuilding.")
+    WARN_ID_MAP_MISMATCH = ("[INDEX_SERVICE] Saved id map has {} entries for {} index rows; "
+                            "ignoring the saved index.")
+    WARN_DANGLING_IDS = ("[INDEX_SERVICE] {} of {} index rows point at chunks that no longer "
+                         "exist.")
+
+    ERR_LOAD_FAILED = "[INDEX_SERVICE ERROR] Failed to load index from disk: {}"
+    ERR_BUILD_FAILED = "[INDEX_SERVICE ERROR] Failed to build index from the database: {}"
+    ERR_SAVE_FAILED = "[INDEX_SERVICE ERROR] Failed to save index to disk: {}"
+
+    RAISE_DIM_MISMATCH = "Embedding dimension {} does not match index dimension {}."
+    RAISE_COUNT_MISMATCH = "Got {} chunk ids for {} embeddings."
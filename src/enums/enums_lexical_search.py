@@ -0,0 +1,15 @@
+"""
+Enums for lexical (FTS5/BM25) retrieval log messages.
+"""
+
+from enum import Enum
+
+
+class LexicalSearchLogMessages(Enum):
+    """Enum for log messages in the lexical_search module."""
+
+    DEBUG_MATCH_QUERY = "[LEXICAL] FTS5 query: {}"
+    DEBUG_HITS = "[LEXICAL] {} chunk(s) matched."
+
+    WARN_NO_TERMS = "[LEXICAL] Query has no searchable terms."
+    WARN_UNAVAILABLE = "[LEXICAL] Full-text index unavailable: {}"
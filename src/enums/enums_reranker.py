@@ -0,0 +1,17 @@
+"""
+Enums for the cross-encoder reranker log messages.
+"""
+
+from enum import Enum
+
+
+class RerankerLogMessages(Enum):
+    """Enum for log messages in the reranker module."""
+
+    INFO_LOADED = "[RERANKER] Cross-encoder '{}' loaded (candidates={}, budget={} ms)."
+
+    DEBUG_RERANKED = "[RERANKER] Scored {} candidate(s) in {:.1f} ms, kept {}."
+    DEBUG_SKIPPED = ("[RERANKER] Skipped: {} candidate(s) estimated at {:.1f} ms exceed the "
+                     "{} ms budget.")
+
+    ERR_LOAD_FAILED = "[RERANKER ERROR] Failed to load cross-encoder '{}': {}"
@@ -0,0 +1,30 @@
+"""
+Enums for the query-response cache log messages.
+"""
+
+from enum import Enum
+
+
+class ResponseCacheLogMessages(Enum):
+    """Enum for log messages in the response_cache module."""
+
+    INFO_STARTED = ("[RESPONSE_CACHE] Started (ttl={}s, max_rows={}, lru_size={}, "
+                    "eviction every {}s).")
+    INFO_STOPPED = "[RESPONSE_CACHE] Background eviction stopped."
+    INFO_CLEARED = "[RESPONSE_CACHE] In-memory tier cleared."
+
+    INFO_WRITER_STARTED = ("[RESPONSE_WRITER] Started (queue={}, batch={}, "
+                           "flush every {}s).")
+    INFO_WRITER_STOPPED = "[RESPONSE_WRITER] Stopped after flushing {} queued response(s)."
+    INFO_WRITER_DISCARDED = "[RESPONSE_WRITER] Discarded {} queued response(s)."
+
+    DEBUG_MEMORY_HIT = "[RESPONSE_CACHE] Memory hit for user '{}'."
+    DEBUG_DB_HIT = "[RESPONSE_CACHE] Database hit for user '{}'."
+    DEBUG_MISS = "[RESPONSE_CACHE] Miss for user '{}'."
+    DEBUG_FLUSHED = "[RESPONSE_WRITER] Wrote {} response(s) in {:.1f} ms."
+
+    WARN_QUEUE_FULL = "[RESPONSE_WRITER] Queue full ({}); flushing on the request thread."
+
+    ERR_LOOKUP_FAILED = "[RESPONSE_CACHE ERROR] Lookup failed: {}"
+    ERR_EVICTION_FAILED = "[RESPONSE_CACHE ERROR] Background eviction failed: {}"
+    ERR_FLUSH_FAILED = "[RESPONSE_WRITER ERROR] Dropped {} response(s), write failed: {}"
@@ -5,11 +5,34 @@ Enums for retrieval module log and error messages.
 from enum import Enum
 
 
+class RetrievalMode(str, Enum):
+    """
+    Enumeration of retrieval strategies.
+
+    Members:
+        VECTOR (str): Dense nearest-neighbour search over the FAISS index.
+        LEXICAL (str): BM25 keyword search over the FTS5 chunk index.
+        HYBRID (str): Both, merged with reciprocal rank fusion.
+    """
+
+    VECTOR = "vector"
+    LEXICAL = "lexical"
+    HYBRID = "hybrid"
+
+
 class RetrievalLogMessages(Enum):
     """Enum for log and raise messages in the retrieval module."""
 
     INFO_SEARCH_START = "[RETRIEVAL] Starting search for query: {}"
     INFO_INDICES_RETRIEVED = "[RETRIEVAL] Retrieved top {} indices."
+    INFO_BELOW_MIN_SCORE = "[RETRIEVAL] Dropped {} hit(s) scoring below {}."
+    INFO_LEXICAL_FAST_PATH = ("[RETRIEVAL] Embedding model not loaded; answering with "
+                              "lexical search only.")
+    INFO_FUSED = "[RETRIEVAL] Fused {} dense and {} lexical hit(s) into {} result(s)."
+    INFO_STAGE_TIMINGS = "[RETRIEVAL] Stage timings (ms): {}"
+    INFO_BATCH_SEARCHED = "[RETRIEVAL] Batch searched {} queries; stage timings (ms): {}"
+    INFO_DIVERSIFIED = ("[RETRIEVAL] MMR kept {} of {} chunk(s), dropped {} near-duplicate(s), "
+                        "~{} prompt token(s) saved.")
 
     DEBUG_EXEC_COMPLETE = "[RETRIEVAL] Execution completed."
 
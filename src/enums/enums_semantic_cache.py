@@ -0,0 +1,15 @@
+"""
+Enums for the semantic response cache log messages.
+"""
+
+from enum import Enum
+
+
+class SemanticCacheLogMessages(Enum):
+    """Enum for log messages in the semantic_cache module."""
+
+    INFO_ENABLED = "[SEMANTIC_CACHE] Enabled (threshold={}, max_entries={})."
+    INFO_CLEARED = "[SEMANTIC_CACHE] Cleared all cached answers."
+
+    DEBUG_HIT = "[SEMANTIC_CACHE] Hit for user '{}' (similarity {:.3f})."
+    DEBUG_MISS = "[SEMANTIC_CACHE] Miss for user '{}' (best similarity {:.3f})."
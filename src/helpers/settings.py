@@ -9,6 +9,7 @@ from functools import lru_cache
 import logging
 import os
 import sys
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -34,7 +35,15 @@ class Settings(BaseSettings):
         DOC_LOCATION_SAVE: Directory to save documents
         CONFIG_DIR: Configuration directory path
         DATABASE_URL: Database connection URL
+        DB_POOL_MAX_CONNECTIONS: Maximum open SQLite connections (one per thread)
+        DB_BUSY_TIMEOUT_MS: Milliseconds to wait for a database lock or a free pool slot
+        DB_SYNCHRONOUS: SQLite synchronous pragma (OFF, NORMAL, FULL or EXTRA)
+        DB_MMAP_SIZE: Bytes of the database file SQLite may memory-map
+        DB_CACHE_SIZE_KB: Page cache size per connection in KiB
+        DB_ASYNC_WORKERS: Threads running database calls awaited by async routes
+        DB_FETCH_BATCH_SIZE: Rows fetched per batch when streaming a table
         EMBEDDING_MODEL: Name of the embedding model
+        EMBEDDING_BATCH_SIZE: Number of chunks encoded and stored per ingestion batch
         HUGGINGFACE_TOKIENS: HuggingFace API tokens
         DEFAULT_SYSTEM_PROMPT: Default system prompt for the application
         ENABLE_MEMORY: Flag to enable memory features
@@ -51,6 +60,47 @@ class Settings(BaseSettings):
         GPUs_THRESHOLD: GPU usage threshold for monitoring
         TELEGRAM_BOT_TOKEN: Telegram bot token for alerts
         TELEGRAM_CHAT_ID: Telegram chat ID for alerts
+        FAISS_INDEX_PATH: File the persistent FAISS index is saved to
+        FAISS_INDEX_TYPE: Index layout: Flat, IVFFlat, HNSW or IVFPQ
+        FAISS_NLIST: Number of inverted lists (IVF types)
+        FAISS_NPROBE: Inverted lists visited per query (IVF types)
+        FAISS_HNSW_M: Graph neighbours per node (HNSW)
+        FAISS_EF_CONSTRUCTION: Candidate list size while building the graph (HNSW)
+        FAISS_EF_SEARCH: Candidate list size per query (HNSW)
+        FAISS_PQ_M: Number of product-quantizer sub-vectors (IVFPQ)
+        FAISS_PQ_NBITS: Bits per sub-vector code (IVFPQ)
+        FAISS_TRAIN_SAMPLE: Maximum number of vectors used to train IVF types
+        FAISS_MMAP: Open the saved index memory-mapped and read-only, shared across workers
+        FAISS_RELOAD_INTERVAL: Seconds between checks for an index saved by another worker
+        FAISS_METRIC: Similarity metric: l2, or cosine (normalized vectors, inner product)
+        RETRIEVAL_MIN_SCORE: Drop retrieved chunks scoring below this value (None keeps all)
+        RETRIEVAL_MODE: Retrieval strategy: vector, lexical (FTS5 BM25) or hybrid
+        RETRIEVAL_CANDIDATES: Hits taken from each ranker before hybrid fusion
+        RRF_K: Rank offset of reciprocal rank fusion; larger values flatten the ranks
+        LIVE_RAG_BATCH_MAX_QUERIES: Maximum number of queries accepted by /live_rag/batch
+        LIVE_RAG_BATCH_CHUNK: Queries embedded and searched together per /live_rag/batch round
+        MMR_ENABLED: Diversify retrieved chunks with maximal marginal relevance
+        MMR_LAMBDA: MMR relevance weight; 1 keeps relevance order, lower favours diversity
+        MMR_CANDIDATES: Candidates retrieved for MMR to choose top_k from
+        MMR_DUPLICATE_THRESHOLD: Cosine similarity at which a chunk counts as a duplicate
+        RERANK_ENABLED: Rerank retrieved candidates with a cross-encoder
+        RERANK_MODEL: Cross-encoder model used for reranking
+        RERANK_CANDIDATES: Candidates retrieved for the reranker to choose top_k from
+        RERANK_BUDGET_MS: Skip reranking while its expected latency exceeds this (0 = never skip)
+        RERANK_MAX_LENGTH: Maximum tokens per query-chunk pair scored by the cross-encoder
+        CHAT_MAX_CONCURRENCY: Maximum number of chat generations running at once
+        CHAT_MAX_QUEUE: Maximum number of chat requests waiting for a generation slot
+        RESPONSE_CACHE_TTL_SECONDS: Age after which a cached response expires (0 = never)
+        RESPONSE_CACHE_MAX_ROWS: Maximum number of rows kept in 'query_responses' (0 = unbounded)
+        RESPONSE_CACHE_LRU_SIZE: Number of responses held in the in-memory front tier
+        RESPONSE_CACHE_EVICTION_INTERVAL: Seconds between background eviction passes
+        RESPONSE_WRITE_QUEUE_SIZE: Maximum responses queued for the background writer
+        RESPONSE_WRITE_BATCH_SIZE: Queued responses that trigger an immediate flush
+        RESPONSE_WRITE_FLUSH_INTERVAL: Seconds between background flushes of queued responses
+        SEMANTIC_CACHE_ENABLED: Reuse answers to earlier queries with similar embeddings
+        SEMANTIC_CACHE_THRESHOLD: Minimum cosine similarity for a semantic cache hit
+        SEMANTIC_CACHE_MAX_ENTRIES: Maximum number of answers held by the semantic cache
+        QUERY_EMBEDDING_CACHE_SIZE: Query embeddings kept in memory to skip re-encoding (0 = off)
     """
 
     # Application Settings
@@ -61,7 +111,15 @@ class Settings(BaseSettings):
     DOC_LOCATION_SAVE: str
     CONFIG_DIR: str
     DATABASE_URL: str
+    DB_POOL_MAX_CONNECTIONS: int = 64
+    DB_BUSY_TIMEOUT_MS: int = 5000
+    DB_SYNCHRONOUS: str = "NORMAL"
+    DB_MMAP_SIZE: int = 256 * 1024 * 1024
+    DB_CACHE_SIZE_KB: int = 64 * 1024
+    DB_ASYNC_WORKERS: int = 4
+    DB_FETCH_BATCH_SIZE: int = 1024
     EMBEDDING_MODEL: str
+    EMBEDDING_BATCH_SIZE: int = 64
 
     COHERE_API: str
     HUGGINGFACE_TOKIENS: str
@@ -90,6 +148,53 @@ class Settings(BaseSettings):
     TELEGRAM_BOT_TOKEN: str
     TELEGRAM_CHAT_ID: str
 
+    # Vector Index Settings
+    FAISS_INDEX_PATH: str = os.path.join(os.path.dirname(MAIN_DIR), "database", "faiss.index")
+    FAISS_INDEX_TYPE: str = "Flat"
+    FAISS_NLIST: int = 1024
+    FAISS_NPROBE: int = 16
+    FAISS_HNSW_M: int = 32
+    FAISS_EF_CONSTRUCTION: int = 200
+    FAISS_EF_SEARCH: int = 64
+    FAISS_PQ_M: int = 16
+    FAISS_PQ_NBITS: int = 8
+    FAISS_TRAIN_SAMPLE: int = 100000
+    FAISS_MMAP: bool = False
+    FAISS_RELOAD_INTERVAL: float = 5.0
+    FAISS_METRIC: str = "l2"
+    RETRIEVAL_MIN_SCORE: Optional[float] = None
+    RETRIEVAL_MODE: str = "vector"
+    RETRIEVAL_CANDIDATES: int = 20
+    RRF_K: int = 60
+    LIVE_RAG_BATCH_MAX_QUERIES: int = 10000
+    LIVE_RAG_BATCH_CHUNK: int = 256
+    MMR_ENABLED: bool = False
+    MMR_LAMBDA: float = 0.7
+    MMR_CANDIDATES: int = 20
+    MMR_DUPLICATE_THRESHOLD: float = 0.95
+    RERANK_ENABLED: bool = False
+    RERANK_MODEL: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    RERANK_CANDIDATES: int = 50
+    RERANK_BUDGET_MS: float = 200.0
+    RERANK_MAX_LENGTH: int = 256
+
+    # Chat Execution Settings
+    CHAT_MAX_CONCURRENCY: int = 2
+    CHAT_MAX_QUEUE: int = 32
+
+    # Response Cache Settings
+    RESPONSE_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    RESPONSE_CACHE_MAX_ROWS: int = 50000
+    RESPONSE_CACHE_LRU_SIZE: int = 1024
+    RESPONSE_CACHE_EVICTION_INTERVAL: int = 300
+    RESPONSE_WRITE_QUEUE_SIZE: int = 10000
+    RESPONSE_WRITE_BATCH_SIZE: int = 100
+    RESPONSE_WRITE_FLUSH_INTERVAL: float = 1.0
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 2048
+    QUERY_EMBEDDING_CACHE_SIZE: int = 4096
+
     # pylint: disable=too-few-public-methods
     class Config:
         """Pydantic configuration for settings."""
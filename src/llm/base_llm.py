@@ -3,7 +3,7 @@ Base LLM module: defines an abstract base class for language model interfaces.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
 
 # pylint: disable=too-many-arguments
 class BaseLLM(ABC):
@@ -49,3 +49,18 @@ class BaseLLM(ABC):
         Returns:
             str: The generated text response.
         """
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a response from the LLM piece by piece as it is generated.
+
+        Backends that support token streaming override this; the default
+        yields the full response from `generate_response` in one piece.
+
+        Args:
+            prompt (str): The input text prompt.
+
+        Yields:
+            str: Successive fragments of the generated text.
+        """
+        yield self.generate_response(prompt)
@@ -7,7 +7,7 @@ This module defines the `CohereLLM` class, which wraps the Cohere language model
 import os
 import sys
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 import cohere
 
@@ -105,3 +105,28 @@ class CohereLLM(BaseLLM):
         except Exception as e:
             log_error(CohereLogMessages.GENERATION_FAIL.value + f" Exception: {e}")
             raise RuntimeError(CohereLogMessages.GENERATION_FAIL.value) from e
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        Streams generated text from the configured Cohere model.
+        """
+        try:
+            if not hasattr(self, 'co'):
+                raise RuntimeError(CohereLogMessages.CLIENT_NOT_INITIALIZED.value)
+
+            stream = self.co.generate_stream(
+                model=self.model_name,
+                prompt=prompt,
+                max_tokens=self.max_new_tokens,
+                temperature=self.temperature,
+                p=self.top_p,
+                k=self.top_k,
+                stop_sequences=[],
+                return_likelihoods='NONE'
+            )
+            for event in stream:
+                if event.event_type == "text-generation" and event.text:
+                    yield event.text
+        except Exception as e:
+            log_error(CohereLogMessages.GENERATION_FAIL.value + f" Exception: {e}")
+            raise RuntimeError(CohereLogMessages.GENERATION_FAIL.value) from e
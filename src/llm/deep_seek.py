@@ -23,7 +23,7 @@ Dependencies:
 import os
 import sys
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     from openai import OpenAI
@@ -71,6 +71,9 @@ class DeepSeekLLM(BaseLLM):
         
         generate_response(prompt):
             Generates a text response for a given input prompt.
+
+        stream_response(prompt):
+            Streams the text response for a given input prompt as it is generated.
     """
 
     def __init__(self):
@@ -157,3 +160,38 @@ class DeepSeekLLM(BaseLLM):
         except Exception as e:
             log_error(f"{DeepSeekLogMessages.GENERATION_FAILURE.value}: {e}")
             raise RuntimeError(DeepSeekLogMessages.GENERATION_EXCEPTION.value) from e
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        Streams a text response from the configured DeepSeek model.
+
+        Args:
+            prompt (str): The input string for generation.
+
+        Yields:
+            str: Successive content fragments.
+
+        Raises:
+            RuntimeError: If generation fails or model isn't initialized.
+        """
+        try:
+            if not hasattr(self, 'client'):
+                raise RuntimeError(DeepSeekLogMessages.CLIENT_NOT_INITIALIZED.value)
+
+            stream = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": "You are a helpful assistant"},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=self.max_new_tokens,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            log_error(f"{DeepSeekLogMessages.GENERATION_FAILURE.value}: {e}")
+            raise RuntimeError(DeepSeekLogMessages.GENERATION_EXCEPTION.value) from e
@@ -17,7 +17,7 @@ Raises:
 import os
 import sys
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     import google.generativeai as genai
@@ -174,3 +174,35 @@ class GoogleLLM(BaseLLM):
             if "API key not valid" in str(e):
                 raise RuntimeError(GoogleLLMLog.API_KEY_INVALID.value) from e
             raise RuntimeError(GoogleLLMLog.RUNTIME_GEN_ERROR.value + f": {e}") from e
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        Streams a text response from the configured Google AI model.
+
+        Args:
+            prompt (str): The input prompt string.
+
+        Yields:
+            str: Successive text fragments.
+
+        Raises:
+            RuntimeError: If generation fails or model is not initialized.
+        """
+        try:
+            if not self.model or not self.generation_config:
+                raise RuntimeError(GoogleLLMLog.MODEL_NOT_INITIALIZED.value)
+
+            log_info(GoogleLLMLog.GENERATION_STARTED.value)
+            response = self.model.generate_content(
+                prompt, generation_config=self.generation_config, stream=True
+            )
+            for chunk in response:
+                for part in getattr(chunk, 'parts', []):
+                    if getattr(part, 'text', None):
+                        yield part.text
+            log_info(GoogleLLMLog.GENERATED_RESPONSE.value)
+        except Exception as e:
+            log_error(GoogleLLMLog.TEXT_GEN_FAILED.value + f": {e}")
+            if "API key not valid" in str(e):
+                raise RuntimeError(GoogleLLMLog.API_KEY_INVALID.value) from e
+            raise RuntimeError(GoogleLLMLog.RUNTIME_GEN_ERROR.value + f": {e}") from e
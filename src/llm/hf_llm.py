@@ -22,10 +22,17 @@ Dependencies:
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Iterator, Optional
 
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import (
+    AutoTokenizer,
+    AutoModelForCausalLM,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextIteratorStreamer,
+)
 from huggingface_hub import login
 
 try:
@@ -57,6 +64,17 @@ except Exception as e:
     raise
 
 
+class _EventStop(StoppingCriteria):
+    """Stops `generate` once the given event is set."""
+
+    def __init__(self, event: threading.Event):
+        self.event = event
+
+    def __call__(self, input_ids: torch.LongTensor, scores, **kwargs) -> torch.BoolTensor:
+        return torch.full((input_ids.shape[0],), self.event.is_set(),
+                          dtype=torch.bool, device=input_ids.device)
+
+
 class HuggingFaceLLM(BaseLLM):
     """
     A class that loads and manages Hugging Face transformer models with optional quantization.
@@ -213,3 +231,63 @@ class HuggingFaceLLM(BaseLLM):
             msg = HuggingFaceLogEnums.GENERATION_FAILED.value.format(error_message=e)
             log_error(msg)
             raise RuntimeError(msg) from e
+
+    def stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        Streams decoded text from the loaded model as tokens are generated.
+
+        Generation runs on a helper thread feeding a `TextIteratorStreamer`;
+        the prompt itself is not echoed back. Closing the generator early (e.g.
+        when the client disconnected) stops generation at the next token instead
+        of waiting for `max_new_tokens`.
+
+        Args:
+            prompt (str): The user input prompt.
+
+        Yields:
+            str: Successive decoded text fragments.
+
+        Raises:
+            RuntimeError if generation fails.
+        """
+        if not self.model or not self.tokenizer:
+            msg = HuggingFaceLogEnums.MODEL_NOT_INITIALIZED.value
+            log_error(msg)
+            raise RuntimeError(msg)
+
+        try:
+            inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
+        except Exception as e:
+            msg = HuggingFaceLogEnums.GENERATION_FAILED.value.format(error_message=e)
+            log_error(msg)
+            raise RuntimeError(msg) from e
+        streamer = TextIteratorStreamer(
+            self.tokenizer, skip_prompt=True, skip_special_tokens=True
+        )
+        stop = threading.Event()
+        stopping_criteria = StoppingCriteriaList(
+            list(self.generate_kwargs.get("stopping_criteria") or []) + [_EventStop(stop)]
+        )
+        generate_kwargs = {**self.generate_kwargs, "stopping_criteria": stopping_criteria}
+        errors = []
+
+        def _generate():
+            try:
+                with torch.inference_mode():
+                    self.model.generate(**inputs, **generate_kwargs, streamer=streamer)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                errors.append(e)
+                streamer.end()
+
+        worker = threading.Thread(target=_generate, daemon=True)
+        worker.start()
+        try:
+            yield from streamer
+        finally:
+            stop.set()
+            worker.join()
+
+        if errors:
+            msg = HuggingFaceLogEnums.GENERATION_FAILED.value.format(error_message=errors[0])
+            log_error(msg)
+            raise RuntimeError(msg) from errors[0]
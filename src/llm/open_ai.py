@@ -23,7 +23,7 @@ Dependencies:
 import os
 import sys
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 
 try:
     from openai import OpenAI, APIError, APITimeoutError, RateLimitError
@@ -186,3 +186,55 @@ class OpenAILLM(BaseLLM):
             msg = OpenAILogEnums.GEN_RESP_FAILED.value.format(error_message=str(e))
             log_error(msg)
             raise RuntimeError(msg) from e
+
+    def stream_response(self, prompt: str, system_message: Optional[str] = None) -> Iterator[str]:
+        """
+        Streams a chat completion from OpenAI, yielding content deltas as they arrive.
+
+        Args:
+            prompt (str): The input prompt string.
+            system_message (str, optional): System instruction prepended to the chat.
+
+        Yields:
+            str: Successive content fragments.
+
+        Raises:
+            RuntimeError: If the client is not initialized or the request fails.
+        """
+        if not self.client:
+            raise RuntimeError("OpenAI client is not initialized. Call initialize_llm first.")
+
+        messages: List[Dict[str, str]] = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                stream=True,
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except APITimeoutError as e:
+            msg = OpenAILogEnums.GEN_RESP_TIMEOUT.value.format(error_message=str(e))
+            log_error(msg)
+            raise RuntimeError(msg) from e
+        except RateLimitError as e:
+            msg = OpenAILogEnums.GEN_RESP_RATE_LIMIT.value.format(error_message=str(e))
+            log_error(msg)
+            raise RuntimeError(msg) from e
+        except APIError as e:
+            msg = OpenAILogEnums.GEN_RESP_API_ERROR.value.format(error_object=str(e))
+            log_error(msg)
+            raise RuntimeError(msg) from e
+        except Exception as e:
+            msg = OpenAILogEnums.GEN_RESP_FAILED.value.format(error_message=str(e))
+            log_error(msg)
+            raise RuntimeError(msg) from e
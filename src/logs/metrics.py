@@ -0,0 +1,127 @@
+"""Prometheus metrics for the chat and retrieval pipelines.
+
+All metrics are registered on the default ``prometheus_client`` registry, so
+they are served by the ``/metrics`` endpoint that ``Instrumentator().expose``
+mounts in ``main.py``.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Bounded chat executor
+CHAT_QUEUE_DEPTH = Gauge(
+    "rami_chat_queue_depth",
+    "Chat requests waiting for a free generation slot.",
+)
+CHAT_IN_FLIGHT = Gauge(
+    "rami_chat_in_flight",
+    "Chat generations currently running in the executor.",
+)
+CHAT_QUEUE_WAIT_SECONDS = Histogram(
+    "rami_chat_queue_wait_seconds",
+    "Time a chat request waited for a generation slot.",
+)
+CHAT_REJECTED_TOTAL = Counter(
+    "rami_chat_rejected_total",
+    "Chat requests rejected because the waiting queue was full.",
+)
+
+# Request coalescing
+SINGLE_FLIGHT_SHARED_TOTAL = Counter(
+    "rami_single_flight_shared_total",
+    "Requests served by joining an identical in-flight computation (work saved).",
+    ["flight"],
+)
+CHAT_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "rami_chat_time_to_first_token_seconds",
+    "Time from receiving a streaming chat request to its first generated token.",
+    ["backend"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0),
+)
+
+# Query-response cache
+RESPONSE_CACHE_HITS_TOTAL = Counter(
+    "rami_response_cache_hits_total",
+    "Chat queries answered from the response cache, by tier (memory or database).",
+    ["tier"],
+)
+RESPONSE_CACHE_MISSES_TOTAL = Counter(
+    "rami_response_cache_misses_total",
+    "Chat queries with no fresh cached response.",
+)
+RESPONSE_CACHE_EVICTIONS_TOTAL = Counter(
+    "rami_response_cache_evictions_total",
+    "Cached responses evicted, by reason (ttl, max_rows, lru or memory_ttl).",
+    ["reason"],
+)
+RESPONSE_WRITE_QUEUE_DEPTH = Gauge(
+    "rami_response_write_queue_depth",
+    "Generated responses waiting to be written to the query_responses table.",
+)
+RESPONSE_WRITE_FLUSH_SECONDS = Histogram(
+    "rami_response_write_flush_seconds",
+    "Time taken to write one batch of queued responses in a single transaction.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+RESPONSE_WRITE_ROWS_TOTAL = Counter(
+    "rami_response_write_rows_total",
+    "Queued responses written, by result (written, failed or discarded).",
+    ["result"],
+)
+
+# Semantic response cache
+SEMANTIC_CACHE_LOOKUPS_TOTAL = Counter(
+    "rami_semantic_cache_lookups_total",
+    "Semantic cache lookups, by result (hit or miss).",
+    ["result"],
+)
+SEMANTIC_CACHE_INVALIDATIONS_TOTAL = Counter(
+    "rami_semantic_cache_invalidations_total",
+    "Times the semantic cache was emptied because the chunk corpus changed.",
+)
+
+# SQLite connection pool
+DB_POOL_CONNECTIONS = Gauge(
+    "rami_db_pool_connections",
+    "SQLite connections currently open in the per-thread pool.",
+)
+DB_POOL_CONNECTIONS_CREATED_TOTAL = Counter(
+    "rami_db_pool_connections_created_total",
+    "SQLite connections opened by the pool.",
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "rami_db_pool_wait_seconds",
+    "Time a thread waited for a free slot in an exhausted SQLite pool.",
+)
+
+# Query embedding cache
+QUERY_EMBEDDING_CACHE_LOOKUPS_TOTAL = Counter(
+    "rami_query_embedding_cache_lookups_total",
+    "Query embedding cache lookups, by result (hit or miss).",
+    ["result"],
+)
+
+# Retrieval pipeline
+RETRIEVAL_STAGE_SECONDS = Histogram(
+    "rami_retrieval_stage_seconds",
+    "Time spent in each retrieval stage (embed, vector, lexical, fusion, fetch, rerank).",
+    ["stage"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+RETRIEVAL_CONTEXT_CHARS = Histogram(
+    "rami_retrieval_context_chars",
+    "Characters of chunk text returned by a retrieval, i.e. the context added to the prompt.",
+    buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000),
+)
+RERANK_SKIPPED_TOTAL = Counter(
+    "rami_rerank_skipped_total",
+    "Retrievals that skipped cross-encoder reranking, by reason.",
+    ["reason"],
+)
+RETRIEVAL_DUPLICATES_DROPPED_TOTAL = Counter(
+    "rami_retrieval_duplicates_dropped_total",
+    "Retrieved chunks dropped by MMR as near-duplicates of a chunk already selected.",
+)
+RETRIEVAL_TOKENS_SAVED_TOTAL = Counter(
+    "rami_retrieval_tokens_saved_total",
+    "Estimated prompt tokens saved by MMR diversification versus plain relevance order.",
+)
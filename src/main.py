@@ -39,11 +39,20 @@ try:
     )
     from src.historys import ChatHistoryManager
     from src.embedding import EmbeddingModel
+    from src.rag import CrossEncoderReranker, FaissIndexService
+    from src.cache import ResponseCache, ResponseWriter, SemanticCache
+    from src.enums import RerankerLogMessages, SemanticCacheLogMessages
+    from src.helpers import get_settings
+    from src.utils import BoundedExecutor
     from src.dbs import (
         create_chunks_table,
+        create_chunks_fts_table,
         create_embeddings_table,
+        create_embedding_cache_table,
         create_query_responses_table,
-        create_sqlite_engine,
+        create_sqlite_pool,
+        run_migrations,
+        AsyncDatabase,
     )
 except ImportError as ie:
     logging.error("Import Error setup error: %s", ie, exc_info=True)
@@ -75,14 +84,44 @@ async def startup_event():
     """Initialize application state and resources on startup."""
     log_info(MainAppLogMessages.STARTUP_BEGIN.value)
     try:
-        app.state.conn = create_sqlite_engine()
+        app.state.db_pool = create_sqlite_pool()
+        app.state.conn = app.state.db_pool.proxy
+        app.state.async_db = AsyncDatabase(conn=app.state.conn)
         create_chunks_table(conn=app.state.conn)
+        create_chunks_fts_table(conn=app.state.conn)
         create_embeddings_table(conn=app.state.conn)
+        create_embedding_cache_table(conn=app.state.conn)
         create_query_responses_table(conn=app.state.conn)
+        run_migrations(conn=app.state.conn)
 
         app.state.embedding_model = EmbeddingModel()
+        app.state.index_service = FaissIndexService()
+        app.state.index_service.load_or_build(conn=app.state.conn)
+        app.state.response_writer = ResponseWriter(conn=app.state.conn)
+        app.state.response_writer.start()
+        app.state.response_cache = ResponseCache(
+            conn=app.state.conn, writer=app.state.response_writer
+        )
+        app.state.response_cache.start()
+        app_settings = get_settings()
+        app.state.semantic_cache = None
+        if app_settings.SEMANTIC_CACHE_ENABLED:
+            app.state.semantic_cache = SemanticCache(index_service=app.state.index_service)
+            log_info(SemanticCacheLogMessages.INFO_ENABLED.value.format(
+                app.state.semantic_cache.threshold, app.state.semantic_cache.max_entries))
+        app.state.reranker = None
+        if app_settings.RERANK_ENABLED:
+            try:
+                app.state.reranker = CrossEncoderReranker()
+            except (OSError, ValueError, RuntimeError) as exc:
+                log_error(RerankerLogMessages.ERR_LOAD_FAILED.value.format(
+                    app_settings.RERANK_MODEL, exc))
         app.state.llm = None
         app.state.chat_manager = ChatHistoryManager()
+        app.state.chat_executor = BoundedExecutor(
+            max_concurrency=app_settings.CHAT_MAX_CONCURRENCY,
+            max_queue=app_settings.CHAT_MAX_QUEUE,
+        )
         app.state.RETRIEVAL_CONTEXT = "No relevant context found."
 
         log_info(MainAppLogMessages.STARTUP_SUCCESS.value)
@@ -96,6 +135,23 @@ async def shutdown_event():
     """Clean up resources on application shutdown."""
     log_info(MainAppLogMessages.SHUTDOWN_BEGIN.value)
     try:
+        chat_executor = getattr(app.state, "chat_executor", None)
+        if chat_executor:
+            chat_executor.shutdown()
+
+        response_cache = getattr(app.state, "response_cache", None)
+        if response_cache:
+            response_cache.stop()
+
+        # Write queued responses before the connection pool is closed.
+        response_writer = getattr(app.state, "response_writer", None)
+        if response_writer:
+            response_writer.stop()
+
+        async_db = getattr(app.state, "async_db", None)
+        if async_db:
+            async_db.shutdown()
+
         conn = getattr(app.state, "conn", None)
         if conn:
             conn.close()
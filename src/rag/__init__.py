@@ -1,3 +1,8 @@
 """RAG module initialization."""
 
-from .retrieval import search
+from .retrieval import search, search_batch
+from .embedding_query import embed_query
+from .index_service import FaissIndexService
+from .lexical_search import lexical_search
+from .metadata_filter import ChunkFilter
+from .reranker import CrossEncoderReranker
@@ -9,10 +9,9 @@ and logging support to ensure reliability during database operations.
 import os
 import sqlite3
 import logging
-import json
 import sys
 import traceback
-from typing import Tuple, List, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -25,8 +24,9 @@ try:
     if MAIN_DIR not in sys.path:
         sys.path.append(MAIN_DIR)
 
-    from src.logs import log_debug, log_error, log_info
-    from src.dbs import pull_from_table
+    from src.logs import log_debug, log_error, log_info, log_warning
+    from src.dbs import decode_embeddings, decode_legacy_embedding, stream_from_table
+    from src.dbs.embedding_codec import EMBEDDING_DTYPE
     from src.enums import DBRetrievalMessages
 
 except (FileNotFoundError, OSError) as e:
@@ -37,75 +37,70 @@ except (FileNotFoundError, OSError) as e:
 
 def load_embeddings_and_metadata(
     conn: sqlite3.Connection,
-) -> Tuple[List[int], np.ndarray, Dict[int, Dict[str, Any]]]:
+    with_metadata: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, Dict[int, Dict[str, Any]]]:
     """
     Load vector embeddings and their corresponding metadata from the SQLite database.
 
     This function queries two tables: 'embeddings' for vector data and 'chunks' for
-    metadata about each chunk. It deserializes the embeddings from JSON blobs,
-    converts them to numpy arrays, and aggregates metadata in a dictionary keyed
-    by chunk IDs.
+    metadata about each chunk. Embeddings are streamed in ``fetchmany`` batches and
+    decoded straight into one preallocated float32 matrix, so the raw rows of the
+    whole table are never held in memory at once. Rows still holding legacy JSON
+    blobs are decoded one by one until they are migrated. Metadata is aggregated
+    in a dictionary keyed by chunk IDs.
+
+    Row ``i`` of the embedding matrix belongs to the chunk ``ids[i]``, i.e. the
+    ``embeddings.chunk_id`` column, so the pair can be used directly as a FAISS
+    index and its row -> chunk id map.
 
     Args:
         conn (sqlite3.Connection): An active SQLite connection object.
+        with_metadata (bool): Also load the chunk metadata; callers that only
+            need the vectors pass False and get an empty dict.
 
     Returns:
         Tuple containing:
-            - List[int]: List of chunk IDs.
+            - np.ndarray: int64 array with the chunk id of each embedding row.
             - np.ndarray: 2D array of embeddings (shape: number_of_chunks x embedding_dim).
             - Dict[int, Dict[str, Any]]: Dictionary mapping chunk ID to metadata dictionary.
 
     Raises:
         sqlite3.Error: If a database access error occurs.
-        ValueError: If no embeddings are found in the database.
-        json.JSONDecodeError: If embedding JSON decoding fails.
+        ValueError: If no embeddings are found or the stored vectors are inconsistent.
     """
     log_info(DBRetrievalMessages.LOAD_START.value)
 
     try:
-        embeddings_data = pull_from_table(
-            conn,
-            table_name="embeddings",
-            columns=["id", "embedding"],
-            rely_data="embedding",
-        )
-
-        metadata_rows = pull_from_table(
-            conn,
-            table_name="chunks",
-            columns=["id", "page", "source", "author"],
-            rely_data="metadata",
-        )
-
-        ids: List[int] = []
-        embeddings_list: List[np.ndarray] = []
-
-        for record in embeddings_data:
-            id_ = record["id"]
-            embedding_blob = record["embedding"]
-
-            # Decode JSON string to list
-            embedding_list = json.loads(embedding_blob)
+        total = count_embeddings(conn)
+        ids = np.empty(total, dtype=np.int64)
+        embeddings_array: Optional[np.ndarray] = None
+        loaded = 0
+        for batch_ids, vectors in iter_embedding_batches(conn):
+            # Rows committed after the count are picked up by the next load.
+            take = min(len(batch_ids), total - loaded)
+            if embeddings_array is None:
+                embeddings_array = np.empty((total, vectors.shape[1]), dtype=np.float32)
+            elif vectors.shape[1] != embeddings_array.shape[1]:
+                raise ValueError(DBRetrievalMessages.MIXED_DIMENSIONS.value.format(
+                    sorted({vectors.shape[1], embeddings_array.shape[1]})))
+            ids[loaded:loaded + take] = batch_ids[:take]
+            embeddings_array[loaded:loaded + take] = vectors[:take]
+            loaded += take
+            if loaded == total:
+                break
 
-            # Convert list to numpy array of float32
-            embedding_array = np.array(embedding_list, dtype=np.float32)
-
-            ids.append(id_)
-            embeddings_list.append(embedding_array)
-
-        if not embeddings_list:
+        if embeddings_array is None or not loaded:
             raise ValueError(DBRetrievalMessages.NO_EMBEDDINGS_FOUND.value)
+        ids, embeddings_array = ids[:loaded], embeddings_array[:loaded]
 
-        embeddings_array = np.vstack(embeddings_list)
-
-        metadata: Dict[int, Dict[str, Any]] = {
-            row["id"]: {
-                "page": row["page"],
-                "source": row["source"],
-                "author": row["author"],
+        metadata: Dict[int, Dict[str, Any]] = {}
+        if with_metadata:
+            metadata = {
+                chunk_id: {"page": page, "source": source, "author": author}
+                for chunk_id, page, source, author in conn.execute(
+                    "SELECT id, pages, sources, authors FROM chunks"
+                )
             }
-            for row in metadata_rows
-        }
 
         log_info(DBRetrievalMessages.LOAD_SUCCESS.value.format(len(ids), len(metadata)))
         return ids, embeddings_array, metadata
@@ -113,7 +108,7 @@ def load_embeddings_and_metadata(
     except sqlite3.Error as sql_err:
         log_error(DBRetrievalMessages.SQLITE_ERROR.value.format(sql_err))
         raise
-    except (ValueError, json.JSONDecodeError) as data_err:
+    except ValueError as data_err:
         log_error(DBRetrievalMessages.DATA_ERROR.value.format(data_err))
         raise
     except Exception as exc:
@@ -121,3 +116,166 @@ def load_embeddings_and_metadata(
         raise
     finally:
         log_debug(DBRetrievalMessages.FUNCTION_COMPLETED.value)
+
+
+def count_embeddings(conn: sqlite3.Connection) -> int:
+    """Return the number of rows in the 'embeddings' table."""
+    return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+def iter_embedding_batches(
+    conn: sqlite3.Connection, batch_size: Optional[int] = None
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream the stored embeddings in insertion order, one decoded batch at a time.
+
+    Args:
+        conn (sqlite3.Connection): An active SQLite connection object.
+        batch_size (Optional[int]): Rows per batch; defaults to DB_FETCH_BATCH_SIZE.
+
+    Yields:
+        Tuple[np.ndarray, np.ndarray]: int64 chunk ids and the float32 matrix of
+            their vectors.
+
+    Raises:
+        ValueError: If the rows of a batch disagree on the embedding dimension.
+    """
+    for rows in stream_from_table(conn, "embeddings", ["chunk_id", "embedding", "dim", "dtype"],
+                                  batch_size=batch_size, order_by="id"):
+        ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        yield ids, _decode_rows(rows)
+
+
+def sample_embeddings(conn: sqlite3.Connection, max_size: int) -> np.ndarray:
+    """
+    Load a random sample of at most ``max_size`` stored embeddings, e.g. to train
+    an IVF index without loading the whole table.
+
+    Args:
+        conn (sqlite3.Connection): An active SQLite connection object.
+        max_size (int): Maximum number of vectors to return.
+
+    Returns:
+        np.ndarray: float32 matrix of the sampled vectors (empty if there are none).
+    """
+    rows = conn.execute(
+        "SELECT chunk_id, embedding, dim, dtype FROM embeddings WHERE id IN "
+        "(SELECT id FROM embeddings ORDER BY RANDOM() LIMIT ?) ORDER BY id",
+        (max_size,),
+    ).fetchall()
+    if not rows:
+        return np.empty((0, 0), dtype=np.float32)
+    return _decode_rows(rows)
+
+
+# Stay well below SQLite's bound-parameter limit (999 on older builds).
+_MAX_IN_PARAMS = 500
+
+
+def fetch_chunks(conn: sqlite3.Connection, chunk_ids: Sequence[int]) -> List[Dict[str, Any]]:
+    """
+    Fetch the content and metadata of many chunks with one ``IN (...)`` query.
+
+    Results follow the order of ``chunk_ids`` (the ranking returned by the vector
+    search); duplicate ids are returned once and ids missing from the table are
+    skipped.
+
+    Args:
+        conn (sqlite3.Connection): An active SQLite connection object.
+        chunk_ids (Sequence[int]): Chunk ids in the desired output order.
+
+    Returns:
+        List[Dict[str, Any]]: One dict per chunk with 'id', 'page_content', 'page',
+            'source' and 'author'.
+
+    Raises:
+        sqlite3.Error: If a database access error occurs.
+    """
+    ordered = list(dict.fromkeys(int(chunk_id) for chunk_id in chunk_ids))
+    rows: Dict[int, Tuple[Any, ...]] = {}
+    for start in range(0, len(ordered), _MAX_IN_PARAMS):
+        batch = ordered[start:start + _MAX_IN_PARAMS]
+        placeholders = ", ".join("?" * len(batch))
+        for row in conn.execute(
+            "SELECT id, page_contest, pages, sources, authors FROM chunks "
+            f"WHERE id IN ({placeholders})",
+            batch,
+        ):
+            rows[row[0]] = row
+
+    log_debug(DBRetrievalMessages.CHUNKS_FETCHED.value.format(len(rows), len(ordered)))
+    return [
+        {
+            "id": row[0],
+            "page_content": row[1],
+            "page": row[2],
+            "source": row[3],
+            "author": row[4],
+        }
+        for row in (rows.get(chunk_id) for chunk_id in ordered)
+        if row is not None
+    ]
+
+
+def fetch_embeddings(
+    conn: sqlite3.Connection, chunk_ids: Sequence[int]
+) -> Dict[int, np.ndarray]:
+    """
+    Fetch the stored embeddings of many chunks with one ``IN (...)`` query per batch.
+
+    Args:
+        conn (sqlite3.Connection): An active SQLite connection object.
+        chunk_ids (Sequence[int]): Chunks to look up.
+
+    Returns:
+        Dict[int, np.ndarray]: Raw (unnormalized) vector per chunk id that has one.
+
+    Raises:
+        sqlite3.Error: If a database access error occurs.
+        ValueError: If the stored vectors disagree on their dimension.
+    """
+    ordered = list(dict.fromkeys(int(chunk_id) for chunk_id in chunk_ids))
+    rows: List[Tuple[int, Any, Any, str]] = []
+    for start in range(0, len(ordered), _MAX_IN_PARAMS):
+        batch = ordered[start:start + _MAX_IN_PARAMS]
+        placeholders = ", ".join("?" * len(batch))
+        rows.extend(conn.execute(
+            "SELECT chunk_id, embedding, dim, dtype FROM embeddings "
+            f"WHERE chunk_id IN ({placeholders}) ORDER BY id",
+            batch,
+        ))
+    if not rows:
+        return {}
+    return dict(zip((row[0] for row in rows), _decode_rows(rows)))
+
+
+def _decode_rows(rows: List[Tuple[int, Any, Any, str]]) -> np.ndarray:
+    """
+    Decode (id, embedding, dim, dtype) rows into one float32 matrix.
+
+    Args:
+        rows: Rows selected from the 'embeddings' table.
+
+    Returns:
+        np.ndarray: Array of shape (len(rows), dim).
+
+    Raises:
+        ValueError: If rows disagree on the embedding dimension.
+    """
+    if all(row[3] == EMBEDDING_DTYPE for row in rows):
+        dims = {row[2] for row in rows}
+        if len(dims) != 1:
+            raise ValueError(DBRetrievalMessages.MIXED_DIMENSIONS.value.format(sorted(dims)))
+        return decode_embeddings([row[1] for row in rows], dims.pop())
+
+    log_warning(DBRetrievalMessages.LEGACY_ROWS_FOUND.value.format(
+        sum(row[3] != EMBEDDING_DTYPE for row in rows)))
+    vectors = [
+        decode_embeddings([row[1]], row[2])[0] if row[3] == EMBEDDING_DTYPE
+        else decode_legacy_embedding(row[1])
+        for row in rows
+    ]
+    if len({vector.size for vector in vectors}) != 1:
+        raise ValueError(DBRetrievalMessages.MIXED_DIMENSIONS.value.format(
+            sorted({vector.size for vector in vectors})))
+    return np.vstack(vectors)
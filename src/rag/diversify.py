@@ -0,0 +1,77 @@
+"""
+diversify module for RAG: maximal marginal relevance over retrieved chunks.
+
+Overlapping chunk windows and boilerplate repeated across crawled pages make
+the nearest neighbours of a query look alike, and near-identical chunks spend
+prompt tokens without adding information. MMR picks chunks one at a time,
+trading relevance to the query against similarity to the chunks already
+picked:
+
+    score(d) = lambda * sim(q, d) - (1 - lambda) * max(sim(d, s) for s in picked)
+
+``lambda`` = 1 keeps pure relevance order, lower values favour diversity.
+Candidates at least ``duplicate_threshold`` similar to a picked chunk are
+dropped outright.
+"""
+
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+
+def mmr_select(
+    query_vector: np.ndarray,
+    candidate_vectors: np.ndarray,
+    k: int,
+    lambda_mult: float = 0.7,
+    duplicate_threshold: float = 1.0,
+) -> Tuple[List[int], List[int]]:
+    """
+    Choose up to ``k`` diverse candidates by maximal marginal relevance.
+
+    Similarities are cosine similarities, so raw and normalized vectors give the
+    same result.
+
+    Args:
+        query_vector (np.ndarray): Query embedding, 1D or shape (1, dim).
+        candidate_vectors (np.ndarray): One row per candidate, shape (n, dim).
+        k (int): Maximum number of candidates to select.
+        lambda_mult (float): Relevance weight in [0, 1].
+        duplicate_threshold (float): Candidates at least this similar to a selected
+            one are dropped as near-duplicates; 1.0 only drops exact copies.
+
+    Returns:
+        Tuple[List[int], List[int]]: Indices of the selected candidates in pick
+            order, and indices of the candidates dropped as near-duplicates.
+    """
+    candidates = _unit_rows(np.atleast_2d(candidate_vectors))
+    if candidates.shape[0] == 0 or k <= 0:
+        return [], []
+    relevance = candidates @ _unit_rows(np.atleast_2d(query_vector))[0]
+    pairwise = candidates @ candidates.T
+
+    selected: List[int] = []
+    duplicates: List[int] = []
+    remaining = list(range(candidates.shape[0]))
+    redundancy = np.full(candidates.shape[0], -np.inf, dtype=np.float32)
+    while remaining and len(selected) < k:
+        penalty = np.where(np.isfinite(redundancy[remaining]), redundancy[remaining], 0.0)
+        scores = lambda_mult * relevance[remaining] - (1.0 - lambda_mult) * penalty
+        best = remaining.pop(int(np.argmax(scores)))
+        selected.append(best)
+        redundancy = np.maximum(redundancy, pairwise[best])
+        duplicates.extend(i for i in remaining if redundancy[i] >= duplicate_threshold)
+        remaining = [i for i in remaining if redundancy[i] < duplicate_threshold]
+    return selected, duplicates
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt-token count of ``text`` (about four characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
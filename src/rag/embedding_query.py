@@ -1,13 +1,20 @@
 """
 embedding_query module for RAG: embed user queries into vector representations
 using a pluggable embedding model interface.
+
+Embeddings are memoized in a process-wide QueryEmbeddingCache keyed by the
+model name, the normalization flag and the exact query text, so repeated
+queries skip the transformer forward pass (QUERY_EMBEDDING_CACHE_SIZE).
 """
 
 import logging
 import os
 import sys
+import threading
 import traceback
-from typing import List
+from typing import Optional
+
+import numpy as np
 
 try:
     MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
@@ -17,7 +24,8 @@ try:
     if MAIN_DIR not in sys.path:
         sys.path.append(MAIN_DIR)
 
-    from src.logs import log_error, log_info
+    from src.logs import log_debug, log_error, log_info
+    from src.cache.query_embedding_cache import QueryEmbeddingCache, freeze_vector
     from src.embedding import EmbeddingModel
     from src.enums.enums_embedding_query import EmbeddingQueryLogMessages
 
@@ -27,15 +35,31 @@ except (FileNotFoundError, OSError) as e:
     sys.exit(1)
 
 
+_query_cache: Optional[QueryEmbeddingCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Return the process-wide query embedding cache, creating it on first use."""
+    global _query_cache  # pylint: disable=global-statement
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = QueryEmbeddingCache()
+        return _query_cache
+
+
 def embed_query(
     query: str,
     embedder: EmbeddingModel,
     convert_to_tensor: bool = True,
     normalize_embeddings: bool = False,
-) -> List[float]:
+) -> np.ndarray:
     """
     Embed a query string into a vector using the provided embedding model.
 
+    A query embedded before by the same model with the same ``normalize_embeddings``
+    flag is served from the query embedding cache without calling the model.
+
     Args:
         query (str): The query text to embed.
         embedder (EmbeddingModel): The embedding model instance.
@@ -43,7 +67,8 @@ def embed_query(
         normalize_embeddings (bool): If True, normalize the output embedding.
 
     Returns:
-        List[float]: Vector representation of the embedded query.
+        np.ndarray: Read-only float32 vector of the embedded query; it is shared
+            with the query embedding cache, so copy it before modifying.
 
     Raises:
         ImportError: If embedding dependencies are missing.
@@ -51,6 +76,13 @@ def embed_query(
     """
     try:
         preview = query[:30] + "..." if len(query) > 30 else query
+        cache = get_query_embedding_cache()
+        model_key = getattr(embedder, "model_name", None) or id(embedder)
+        cached = cache.get(model_key, normalize_embeddings, query)
+        if cached is not None:
+            log_debug(EmbeddingQueryLogMessages.DEBUG_CACHE_HIT.value.format(preview))
+            return cached
+
         log_info(EmbeddingQueryLogMessages.INFO_STARTING_EMBED.value.format(preview))
 
         embedding = embedder.embed(
@@ -61,10 +93,12 @@ def embed_query(
 
         log_info(EmbeddingQueryLogMessages.INFO_EMBED_SUCCESS.value)
 
-        if hasattr(embedding, "tolist"):
-            return embedding.tolist()  # type: ignore[attr-defined]
+        if hasattr(embedding, "cpu"):
+            embedding = embedding.cpu().numpy()  # type: ignore[attr-defined]
+        vector = freeze_vector(embedding)
 
-        return list(embedding)  # type: ignore
+        cache.put(model_key, normalize_embeddings, query, vector)
+        return vector
 
     except ImportError as imp_err:
         log_error(EmbeddingQueryLogMessages.ERR_IMPORT_FAILURE.value.format(str(imp_err)))
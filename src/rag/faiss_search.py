@@ -1,12 +1,30 @@
 """
 faiss_search module for RAG: provides functionality to build a FAISS index
 from a set of vector embeddings for efficient similarity search.
+
+The index layout is chosen with the FAISS_INDEX_TYPE setting:
+
+- ``Flat``: exact search, O(N·d) per query.
+- ``IVFFlat``: k-means inverted lists; ``nprobe`` lists are scanned per query.
+- ``HNSW``: navigable small-world graph; ``efSearch`` trades recall for speed.
+- ``IVFPQ``: inverted lists over product-quantized codes for large corpora.
+
+With FAISS_METRIC=cosine the vectors are L2-normalized and searched by inner
+product, so index scores are cosine similarities; the default ``l2`` metric
+searches raw vectors by squared Euclidean distance.
+
+IVF types are trained on a random sample of the vectors before they are added.
+``build_faiss_index_from_batches`` adds the vectors batch by batch, so an index
+can be built from a streamed table without materializing the whole matrix.
+The recall/speed knobs (``nprobe``, ``efSearch``) get their defaults from the
+settings and can be overridden per query through ``search_parameters``.
 """
 
 import logging
 import os
 import sys
 import traceback
+from typing import Callable, Iterable, Optional, Union
 
 import faiss
 import numpy as np
@@ -19,8 +37,9 @@ try:
     if MAIN_DIR not in sys.path:
         sys.path.append(MAIN_DIR)
 
-    from src.logs import log_error, log_info
-    from src.enums import FaissSearchLogMessages
+    from src.logs import log_error, log_info, log_warning
+    from src.enums import FaissIndexType, FaissMetric, FaissSearchLogMessages
+    from src.helpers import get_settings, Settings
 
 except (FileNotFoundError, OSError) as e:
     logging.error("Fatal error setting up project directory: %s", str(e))
@@ -28,17 +47,29 @@ except (FileNotFoundError, OSError) as e:
     sys.exit(1)
 
 
-def build_faiss_index(embeddings: np.ndarray) -> faiss.IndexFlatL2:
+# FAISS warns when k-means gets fewer points than this per centroid.
+MIN_POINTS_PER_CENTROID = 39
+
+
+def build_faiss_index(
+    embeddings: np.ndarray,
+    index_type: Optional[Union[str, FaissIndexType]] = None,
+    metric: Optional[Union[str, FaissMetric]] = None,
+) -> faiss.Index:
     """
-    Build a FAISS IndexFlatL2 index from the provided vector embeddings.
+    Build a FAISS index of the configured type from the provided vector embeddings.
 
     Args:
         embeddings (np.ndarray): A 2D numpy array of shape (n_vectors, dim),
                                  where n_vectors is the number of vectors
                                  and dim is the dimensionality.
+        index_type (Optional[Union[str, FaissIndexType]]): Index layout; defaults
+            to the FAISS_INDEX_TYPE setting.
+        metric (Optional[Union[str, FaissMetric]]): Similarity metric; defaults to
+            the FAISS_METRIC setting. Cosine normalizes a copy of the embeddings.
 
     Returns:
-        faiss.IndexFlatL2: A FAISS index with the input vectors.
+        faiss.Index: A trained FAISS index holding the input vectors.
 
     Raises:
         ValueError: If the embeddings array is not valid or indexing fails.
@@ -49,10 +80,24 @@ def build_faiss_index(embeddings: np.ndarray) -> faiss.IndexFlatL2:
         if not isinstance(embeddings, np.ndarray) or len(embeddings.shape) != 2:
             raise ValueError(FaissSearchLogMessages.RAISE_INVALID_EMBEDDINGS.value)
 
-        dim = embeddings.shape[1]
-        index = faiss.IndexFlatL2(dim)
-        n_vectors = embeddings.shape[0]
-        index.add(embeddings, n_vectors)
+        app_settings: Settings = get_settings()
+        metric = FaissMetric(metric or app_settings.FAISS_METRIC)
+        vectors = prepare_vectors(embeddings, metric)
+        index = create_faiss_index(
+            dim=vectors.shape[1],
+            n_vectors=vectors.shape[0],
+            index_type=index_type or app_settings.FAISS_INDEX_TYPE,
+            metric=metric,
+        )
+
+        if not index.is_trained:
+            sample = _training_sample(vectors, app_settings.FAISS_TRAIN_SAMPLE)
+            log_info(FaissSearchLogMessages.INFO_TRAINING.value.format(
+                index_type_of(index).value, sample.shape[0], vectors.shape[0]))
+            index.train(sample)
+
+        index.add(vectors)
+        apply_search_defaults(index)
 
         log_info(FaissSearchLogMessages.INFO_INDEX_SUCCESS.value)
         return index
@@ -62,3 +107,223 @@ def build_faiss_index(embeddings: np.ndarray) -> faiss.IndexFlatL2:
         raise ValueError(FaissSearchLogMessages.RAISE_INDEX_BUILD_FAILED.value.format(
             str(err)
             )) from err
+
+
+def build_faiss_index_from_batches(
+    batches: Iterable[np.ndarray],
+    n_vectors: int,
+    training_sample: Callable[[int], np.ndarray],
+    index_type: Optional[Union[str, FaissIndexType]] = None,
+    metric: Optional[Union[str, FaissMetric]] = None,
+) -> faiss.Index:
+    """
+    Build a FAISS index from vectors delivered in batches.
+
+    Only one batch is prepared at a time. Types that need training are trained on
+    ``training_sample(FAISS_TRAIN_SAMPLE)`` before the first batch is added.
+
+    Args:
+        batches (Iterable[np.ndarray]): 2D arrays of shape (batch_size, dim).
+        n_vectors (int): Total number of vectors, used to size the index.
+        training_sample (Callable[[int], np.ndarray]): Returns a random sample of at
+            most the given number of vectors; only called for trainable types.
+        index_type (Optional[Union[str, FaissIndexType]]): Index layout; defaults
+            to the FAISS_INDEX_TYPE setting.
+        metric (Optional[Union[str, FaissMetric]]): Similarity metric; defaults to
+            the FAISS_METRIC setting.
+
+    Returns:
+        faiss.Index: A trained FAISS index holding every batch.
+
+    Raises:
+        ValueError: If there are no vectors or indexing fails.
+    """
+    try:
+        log_info(FaissSearchLogMessages.INFO_START_BUILD.value)
+        app_settings: Settings = get_settings()
+        metric = FaissMetric(metric or app_settings.FAISS_METRIC)
+        index = None
+        for batch in batches:
+            vectors = prepare_vectors(batch, metric)
+            if index is None:
+                index = create_faiss_index(
+                    dim=vectors.shape[1],
+                    n_vectors=n_vectors,
+                    index_type=index_type or app_settings.FAISS_INDEX_TYPE,
+                    metric=metric,
+                )
+                if not index.is_trained:
+                    sample = prepare_vectors(
+                        training_sample(app_settings.FAISS_TRAIN_SAMPLE), metric)
+                    log_info(FaissSearchLogMessages.INFO_TRAINING.value.format(
+                        index_type_of(index).value, sample.shape[0], n_vectors))
+                    index.train(sample)
+            index.add(vectors)
+
+        if index is None:
+            raise ValueError(FaissSearchLogMessages.RAISE_INVALID_EMBEDDINGS.value)
+        apply_search_defaults(index)
+
+        log_info(FaissSearchLogMessages.INFO_INDEX_SUCCESS.value)
+        return index
+
+    except Exception as err:
+        log_error(FaissSearchLogMessages.ERR_BUILD_FAILED.value.format(str(err)))
+        raise ValueError(FaissSearchLogMessages.RAISE_INDEX_BUILD_FAILED.value.format(
+            str(err)
+            )) from err
+
+
+def create_faiss_index(
+    dim: int,
+    n_vectors: int,
+    index_type: Union[str, FaissIndexType],
+    metric: Union[str, FaissMetric] = FaissMetric.L2,
+) -> faiss.Index:
+    """
+    Create an empty (possibly untrained) index sized for ``n_vectors`` vectors.
+
+    ``nlist`` is capped so every centroid gets enough training points, and
+    IVFPQ falls back to IVFFlat while there are too few vectors to train its
+    codebooks; rebuilding the index once the corpus has grown picks the
+    configured layout again.
+
+    Args:
+        dim (int): Vector dimensionality.
+        n_vectors (int): Number of vectors the index will be trained on.
+        index_type (Union[str, FaissIndexType]): Requested index layout.
+        metric (Union[str, FaissMetric]): Similarity metric the index ranks by.
+
+    Returns:
+        faiss.Index: The new index.
+
+    Raises:
+        ValueError: If the type is unknown or its parameters do not fit ``dim``.
+    """
+    app_settings: Settings = get_settings()
+    index_type = FaissIndexType(index_type)
+    metric = FaissMetric(metric)
+    nlist = max(1, min(app_settings.FAISS_NLIST, n_vectors // MIN_POINTS_PER_CENTROID))
+
+    if index_type is FaissIndexType.IVF_PQ:
+        if dim % app_settings.FAISS_PQ_M:
+            raise ValueError(FaissSearchLogMessages.RAISE_PQ_DIM.value.format(
+                dim, app_settings.FAISS_PQ_M))
+        needed = 2 ** app_settings.FAISS_PQ_NBITS
+        if n_vectors < needed:
+            log_warning(FaissSearchLogMessages.WARN_TOO_FEW_FOR_PQ.value.format(
+                n_vectors, needed))
+            index_type = FaissIndexType.IVF_FLAT
+
+    spec = {
+        FaissIndexType.FLAT: "Flat",
+        FaissIndexType.IVF_FLAT: f"IVF{nlist},Flat",
+        FaissIndexType.HNSW: f"HNSW{app_settings.FAISS_HNSW_M}",
+        FaissIndexType.IVF_PQ: (f"IVF{nlist},PQ{app_settings.FAISS_PQ_M}"
+                                f"x{app_settings.FAISS_PQ_NBITS}"),
+    }[index_type]
+    log_info(FaissSearchLogMessages.INFO_INDEX_SPEC.value.format(
+        spec, metric.value, n_vectors, dim))
+
+    faiss_metric = (faiss.METRIC_INNER_PRODUCT if metric is FaissMetric.COSINE
+                    else faiss.METRIC_L2)
+    index = faiss.index_factory(dim, spec, faiss_metric)
+    if index_type is FaissIndexType.HNSW:
+        index.hnsw.efConstruction = app_settings.FAISS_EF_CONSTRUCTION
+    return index
+
+
+def index_type_of(index: faiss.Index) -> FaissIndexType:
+    """Return the layout of an existing index."""
+    index = faiss.downcast_index(index)
+    if isinstance(index, faiss.IndexIVFPQ):
+        return FaissIndexType.IVF_PQ
+    if isinstance(index, faiss.IndexIVF):
+        return FaissIndexType.IVF_FLAT
+    if isinstance(index, faiss.IndexHNSW):
+        return FaissIndexType.HNSW
+    return FaissIndexType.FLAT
+
+
+def metric_of(index: faiss.Index) -> FaissMetric:
+    """Return the similarity metric an existing index ranks by."""
+    if index.metric_type == faiss.METRIC_INNER_PRODUCT:
+        return FaissMetric.COSINE
+    return FaissMetric.L2
+
+
+def prepare_vectors(vectors: np.ndarray, metric: Union[str, FaissMetric]) -> np.ndarray:
+    """
+    Return ``vectors`` as a contiguous float32 2D array ready for an index of ``metric``.
+
+    For cosine the rows are L2-normalized in a copy; normalizing already unit-length
+    vectors is a no-op, so embeddings normalized at ingest time pass through unchanged.
+    """
+    prepared = np.array(np.atleast_2d(vectors), dtype=np.float32, order="C")
+    if FaissMetric(metric) is FaissMetric.COSINE:
+        faiss.normalize_L2(prepared)
+    return prepared
+
+
+def distances_to_scores(distances: np.ndarray, metric: Union[str, FaissMetric]) -> np.ndarray:
+    """
+    Convert raw FAISS distances into similarity scores where higher is better.
+
+    Cosine scores are the inner products themselves (in [-1, 1]); L2 scores are the
+    negated squared distances, so one ``min_score`` comparison works for both metrics.
+    """
+    if FaissMetric(metric) is FaissMetric.COSINE:
+        return distances
+    return -distances
+
+
+def apply_search_defaults(index: faiss.Index) -> None:
+    """Set the configured default ``nprobe``/``efSearch`` on an index."""
+    app_settings: Settings = get_settings()
+    index = faiss.downcast_index(index)
+    if isinstance(index, faiss.IndexIVF):
+        index.nprobe = min(app_settings.FAISS_NPROBE, index.nlist)
+    elif isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = app_settings.FAISS_EF_SEARCH
+
+
+def search_parameters(
+    index: faiss.Index,
+    nprobe: Optional[int] = None,
+    ef_search: Optional[int] = None,
+    selector: Optional[faiss.IDSelector] = None,
+) -> Optional[faiss.SearchParameters]:
+    """
+    Build per-query search parameters overriding the index defaults.
+
+    Knobs that do not apply to the index type are ignored. With a ``selector``,
+    rows it rejects are skipped during the search itself, and the index's own
+    ``nprobe``/``efSearch`` are kept unless overridden.
+
+    Args:
+        index (faiss.Index): Index the query will run against.
+        nprobe (Optional[int]): Inverted lists to scan (IVF types).
+        ef_search (Optional[int]): Candidate list size (HNSW).
+        selector (Optional[faiss.IDSelector]): Restricts the searchable rows.
+
+    Returns:
+        Optional[faiss.SearchParameters]: Parameters for ``index.search``, or None
+            to use the index defaults.
+    """
+    index = faiss.downcast_index(index)
+    if isinstance(index, faiss.IndexIVF) and (nprobe or selector is not None):
+        nprobe = min(int(nprobe), index.nlist) if nprobe else index.nprobe
+        return faiss.SearchParametersIVF(sel=selector, nprobe=nprobe)
+    if isinstance(index, faiss.IndexHNSW) and (ef_search or selector is not None):
+        return faiss.SearchParametersHNSW(sel=selector,
+                                          efSearch=int(ef_search or index.hnsw.efSearch))
+    if selector is not None:
+        return faiss.SearchParameters(sel=selector)
+    return None
+
+
+def _training_sample(vectors: np.ndarray, max_size: int) -> np.ndarray:
+    if vectors.shape[0] <= max_size:
+        return vectors
+    rows = np.random.default_rng(0).choice(vectors.shape[0], size=max_size, replace=False)
+    return vectors[np.sort(rows)]
@@ -0,0 +1,573 @@
+"""
+index_service module for RAG: keeps a long-lived FAISS index in memory.
+
+The index is built once at application startup (or loaded from disk when a
+saved copy matches the database), persisted next to the SQLite database and
+extended in place whenever new embeddings are stored. Per-query retrieval
+then only pays for the vector search itself.
+
+With FAISS_MMAP enabled the index and its id map are opened memory-mapped and
+read-only, so every uvicorn worker serving the same files shares one page-cache
+copy instead of holding a private one. Saves write to temporary files and
+``os.replace`` them into place; workers notice the new files (checked at most
+every FAISS_RELOAD_INTERVAL seconds) and map them, while searches already in
+progress keep using the old mapping.
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import faiss
+import numpy as np
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_debug, log_error, log_info, log_warning
+    from src.helpers import get_settings, Settings
+    from src.enums import FaissIndexType, FaissMetric, IndexServiceLogMessages
+    from .database_retrieval import count_embeddings, iter_embedding_batches, sample_embeddings
+    from .metadata_filter import ChunkFilter, RowBitmap
+    from .faiss_search import (
+        apply_search_defaults,
+        build_faiss_index,
+        build_faiss_index_from_batches,
+        distances_to_scores,
+        index_type_of,
+        metric_of,
+        prepare_vectors,
+        search_parameters,
+    )
+
+except (FileNotFoundError, OSError) as e:
+    logging.error("Fatal error setting up project directory: %s", str(e))
+    logging.error(traceback.format_exc())
+    sys.exit(1)
+
+
+_EMPTY_IDS = np.empty(0, dtype=np.int64)
+
+# Zero-copy mapping of the index payload (flat codes, graph storage, inverted lists).
+_MMAP_FLAGS = faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+
+# Filter bitmaps kept per id map; each costs one bit per indexed vector.
+_MAX_FILTER_BITMAPS = 64
+
+
+class FaissIndexService:
+    """
+    Thread-safe owner of the application's FAISS index.
+
+    Row ``i`` of the FAISS index holds the embedding of chunk ``ids[i]``; the
+    mapping is an int64 numpy array saved next to the index as ``.ids.npy``.
+
+    Attributes:
+        index_path (str): File the FAISS index is persisted to.
+        ids_path (str): File holding the index-row -> chunk id mapping.
+        mmap (bool): Open saved files memory-mapped and read-only.
+        reload_interval (float): Minimum seconds between checks for a newer index
+            file written by another process; 0 disables the check.
+    """
+
+    def __init__(self, index_path: Optional[str] = None):
+        app_settings: Settings = get_settings()
+        self.index_path = index_path or app_settings.FAISS_INDEX_PATH
+        self.index_type = FaissIndexType(app_settings.FAISS_INDEX_TYPE)
+        self.metric = FaissMetric(app_settings.FAISS_METRIC)
+        self.ids_path = f"{self.index_path}.ids.npy"
+        self.mmap = app_settings.FAISS_MMAP
+        self.reload_interval = app_settings.FAISS_RELOAD_INTERVAL
+        # IVFPQ codebooks need this many training vectors; below it the index
+        # is built as IVFFlat (see ``create_faiss_index``).
+        self._pq_min_vectors = 2 ** app_settings.FAISS_PQ_NBITS
+        self._index: Optional[faiss.Index] = None
+        self._ids: np.ndarray = _EMPTY_IDS
+        self._lock = threading.RLock()
+        self._version = 0
+        self._trained_on = 0
+        self._mapped = False
+        self._id_order: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._bitmaps: "OrderedDict[ChunkFilter, RowBitmap]" = OrderedDict()
+        self._bitmaps_ids: Optional[np.ndarray] = None
+        self._file_signature: Optional[Tuple[int, int, int]] = None
+        self._next_reload_check = 0.0
+
+    @property
+    def ntotal(self) -> int:
+        """Number of vectors currently held by the index."""
+        with self._lock:
+            return 0 if self._index is None else int(self._index.ntotal)
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the indexed corpus changes; caches derived from
+        retrieval results compare it to detect staleness."""
+        return self._version
+
+    @property
+    def needs_retraining(self) -> bool:
+        """True when the index should be rebuilt from the database: it is not of the
+        configured type (an IVFPQ that fell back to IVFFlat only once the corpus is
+        large enough to train PQ), or it is an IVF index that has since grown to
+        twice the size it was trained on."""
+        with self._lock:
+            if self._index is None:
+                return False
+            if (index_type_of(self._index) is not self.index_type
+                    and not self._is_pq_fallback(self._index)):
+                return True
+            trainable = self.index_type in (FaissIndexType.IVF_FLAT, FaissIndexType.IVF_PQ)
+            return trainable and self._index.ntotal >= 2 * max(self._trained_on, 1)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Read-only view of the index-row -> chunk id map."""
+        with self._lock:
+            view = self._ids.view()
+            view.flags.writeable = False
+            return view
+
+    @property
+    def mapped(self) -> bool:
+        """True while the index is a read-only memory mapping of the saved file."""
+        return self._mapped
+
+    def load_or_build(self, conn: sqlite3.Connection) -> None:
+        """
+        Load the saved index if its id map matches the database row for row,
+        otherwise rebuild it from the stored embeddings and save it. The result
+        is then checked against the 'chunks' table.
+
+        Args:
+            conn (sqlite3.Connection): Active SQLite connection.
+        """
+        stored = np.fromiter(
+            (row[0] for row in conn.execute("SELECT chunk_id FROM embeddings ORDER BY id")),
+            dtype=np.int64,
+        )
+        if self._load() and np.array_equal(self._ids, stored):
+            if metric_of(self._index) is not self.metric:
+                log_warning(IndexServiceLogMessages.WARN_METRIC_CHANGED.value.format(
+                    metric_of(self._index).value, self.metric.value))
+            elif (index_type_of(self._index) is not self.index_type
+                  and not self._is_pq_fallback(self._index)):
+                log_warning(IndexServiceLogMessages.WARN_TYPE_CHANGED.value.format(
+                    index_type_of(self._index).value, self.index_type.value))
+            else:
+                self.validate(conn)
+                return
+        elif self._index is not None:
+            log_warning(IndexServiceLogMessages.WARN_STALE_ON_DISK.value.format(
+                self.ntotal, stored.size))
+        self.build(conn)
+        self.validate(conn)
+
+    def validate(self, conn: sqlite3.Connection) -> int:
+        """
+        Check that every chunk id in the id map exists in the 'chunks' table.
+
+        Dangling ids (chunks deleted after being embedded) are logged; searches
+        simply return fewer results for them.
+
+        Args:
+            conn (sqlite3.Connection): Active SQLite connection.
+
+        Returns:
+            int: Number of index rows pointing at a missing chunk.
+        """
+        with self._lock:
+            ids = self._ids
+        if ids.size == 0:
+            return 0
+        chunk_ids = np.fromiter(
+            (row[0] for row in conn.execute("SELECT id FROM chunks")), dtype=np.int64
+        )
+        dangling = int(np.count_nonzero(~np.isin(ids, chunk_ids)))
+        if dangling:
+            log_warning(IndexServiceLogMessages.WARN_DANGLING_IDS.value.format(
+                dangling, ids.size))
+        return dangling
+
+    def build(self, conn: sqlite3.Connection) -> None:
+        """
+        Rebuild the index from every embedding stored in the database.
+
+        Embeddings are streamed in batches, so building needs memory for the index
+        itself plus one batch, not a second copy of the corpus.
+
+        Args:
+            conn (sqlite3.Connection): Active SQLite connection.
+        """
+        with self._lock:
+            self._index, self._ids, self._mapped = None, _EMPTY_IDS, False
+            self._version += 1
+            try:
+                n_vectors = count_embeddings(conn)
+            except sqlite3.Error as err:
+                log_error(IndexServiceLogMessages.ERR_BUILD_FAILED.value.format(err))
+                return
+            if not n_vectors:
+                log_info(IndexServiceLogMessages.INFO_EMPTY_CORPUS.value)
+                self._remove_files()
+                return
+
+            # Vectors are streamed into the index; only the chunk ids are collected.
+            id_batches: List[np.ndarray] = []
+
+            def vector_batches():
+                for batch_ids, vectors in iter_embedding_batches(conn):
+                    id_batches.append(batch_ids)
+                    yield vectors
+
+            self._index = build_faiss_index_from_batches(
+                vector_batches(), n_vectors, lambda size: sample_embeddings(conn, size),
+                self.index_type, self.metric,
+            )
+            self._ids = np.concatenate(id_batches)
+            self._trained_on = self.ntotal
+            log_info(IndexServiceLogMessages.INFO_BUILT_FROM_DB.value.format(self.ntotal))
+            self.save()
+
+    def add(self, chunk_ids: Sequence[int], embeddings: np.ndarray, persist: bool = True) -> None:
+        """
+        Append freshly stored embeddings to the index and persist it.
+
+        Args:
+            chunk_ids (Sequence[int]): Chunk id for each embedding row.
+            embeddings (np.ndarray): 2D array of shape (len(chunk_ids), dim).
+            persist (bool): Save the index afterwards. Batched ingestion passes False
+                and calls ``save`` once at the end.
+
+        Raises:
+            ValueError: If the shapes do not line up with the index.
+        """
+        vectors = np.ascontiguousarray(np.atleast_2d(embeddings), dtype=np.float32)
+        if len(chunk_ids) != vectors.shape[0]:
+            raise ValueError(IndexServiceLogMessages.RAISE_COUNT_MISMATCH.value.format(
+                len(chunk_ids), vectors.shape[0]))
+        if vectors.shape[0] == 0:
+            return
+
+        with self._lock:
+            self._make_writable()
+            if self._index is None:
+                self._index = build_faiss_index(vectors, self.index_type, self.metric)
+                self._trained_on = vectors.shape[0]
+            else:
+                if vectors.shape[1] != self._index.d:
+                    raise ValueError(IndexServiceLogMessages.RAISE_DIM_MISMATCH.value.format(
+                        vectors.shape[1], self._index.d))
+                self._index.add(prepare_vectors(vectors, self.metric))
+            self._ids = np.concatenate([self._ids, np.asarray(chunk_ids, dtype=np.int64)])
+            self._version += 1
+            log_info(IndexServiceLogMessages.INFO_VECTORS_ADDED.value.format(
+                vectors.shape[0], self.ntotal))
+            if persist:
+                self.save()
+
+    def search(
+        self,
+        vector: np.ndarray,
+        top_k: int,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Return the chunk ids of the ``top_k`` nearest neighbours of ``vector``.
+
+        Args:
+            vector (np.ndarray): Query embedding, 1D or shape (1, dim).
+            top_k (int): Number of neighbours to return.
+            nprobe (Optional[int]): Per-query override of the IVF lists scanned.
+            ef_search (Optional[int]): Per-query override of the HNSW candidate list size.
+
+        Returns:
+            List[int]: Chunk ids, best match first.
+        """
+        return [chunk_id for chunk_id, _ in self.search_with_scores(
+            vector, top_k, nprobe=nprobe, ef_search=ef_search)]
+
+    def search_with_scores(
+        self,
+        vector: np.ndarray,
+        top_k: int,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        chunk_filter: Optional[ChunkFilter] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Return the ``top_k`` nearest chunks of ``vector`` with their similarity scores.
+
+        Scores are higher-is-better: cosine similarity for the cosine metric and the
+        negated squared distance for L2 (see ``distances_to_scores``).
+
+        A ``chunk_filter`` is applied inside FAISS through a row bitmap. Bitmaps are
+        cached per filter until the index changes, so repeated filtered queries cost
+        no more than unfiltered ones.
+
+        Args:
+            vector (np.ndarray): Query embedding, 1D or shape (1, dim). It is
+                normalized here for the cosine metric.
+            top_k (int): Number of neighbours to return.
+            nprobe (Optional[int]): Per-query override of the IVF lists scanned.
+            ef_search (Optional[int]): Per-query override of the HNSW candidate list size.
+            chunk_filter (Optional[ChunkFilter]): Only return chunks matching it.
+            conn (Optional[sqlite3.Connection]): Connection used to resolve a filter
+                that has no cached bitmap yet; required with ``chunk_filter``.
+
+        Returns:
+            List[Tuple[int, float]]: (chunk id, score) pairs, best match first.
+        """
+        return self.search_batch_with_scores(
+            np.atleast_2d(vector)[:1], top_k, nprobe=nprobe, ef_search=ef_search,
+            chunk_filter=chunk_filter, conn=conn,
+        )[0]
+
+    def search_batch_with_scores(
+        self,
+        vectors: np.ndarray,
+        top_k: int,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        chunk_filter: Optional[ChunkFilter] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Batched ``search_with_scores``: one FAISS search over a matrix of queries.
+
+        Args:
+            vectors (np.ndarray): Query embeddings, shape (n, dim).
+            top_k (int): Number of neighbours to return per query.
+            nprobe (Optional[int]): Per-query override of the IVF lists scanned.
+            ef_search (Optional[int]): Per-query override of the HNSW candidate list size.
+            chunk_filter (Optional[ChunkFilter]): Applied to every query in the batch.
+            conn (Optional[sqlite3.Connection]): Resolves an uncached ``chunk_filter``.
+
+        Returns:
+            List[List[Tuple[int, float]]]: (chunk id, score) pairs per query, in the
+                order of ``vectors``.
+        """
+        queries = prepare_vectors(vectors, self.metric)
+        self.reload_if_changed()
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return [[] for _ in range(len(queries))]
+            bitmap = None if chunk_filter is None else self._filter_bitmap(chunk_filter, conn)
+            if bitmap is not None and bitmap.count == 0:
+                return [[] for _ in range(len(queries))]
+            params = search_parameters(
+                self._index, nprobe=nprobe, ef_search=ef_search,
+                selector=None if bitmap is None else bitmap.selector,
+            )
+            distances, indices = self._index.search(queries, top_k, params=params)
+            results = []
+            for row_distances, row_indices in zip(distances, indices):
+                found = row_indices >= 0
+                scores = distances_to_scores(row_distances[found], self.metric)
+                results.append(list(zip(self._ids[row_indices[found]].tolist(),
+                                        scores.tolist())))
+            return results
+
+    def reconstruct(self, chunk_ids: Sequence[int]) -> Dict[int, np.ndarray]:
+        """
+        Return the stored vectors of the given chunks straight from the index.
+
+        Vectors come back as the index holds them (L2-normalized for the cosine
+        metric). IVF layouts keep no row -> list mapping and cannot reconstruct;
+        they return an empty dict and callers read the vectors from the database.
+
+        Args:
+            chunk_ids (Sequence[int]): Chunks to look up.
+
+        Returns:
+            Dict[int, np.ndarray]: Vector per chunk id found in the index.
+        """
+        with self._lock:
+            if self._index is None or self._ids.size == 0 or not len(chunk_ids):
+                return {}
+            wanted = np.asarray(chunk_ids, dtype=np.int64)
+            order = self._sorted_id_order()
+            positions = np.minimum(np.searchsorted(self._ids, wanted, sorter=order),
+                                   order.size - 1)
+            rows = order[positions]
+            found = self._ids[rows] == wanted
+            try:
+                vectors = self._index.reconstruct_batch(rows[found])
+            except RuntimeError:
+                return {}
+            return dict(zip(wanted[found].tolist(), vectors))
+
+    def reset(self) -> None:
+        """Drop the in-memory index and its files, e.g. after the embeddings table is cleared."""
+        with self._lock:
+            self._index, self._ids, self._mapped = None, _EMPTY_IDS, False
+            self._version += 1
+            self._remove_files()
+            self._file_signature = None
+            log_info(IndexServiceLogMessages.INFO_RESET.value)
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """
+        Pick up index files replaced by another process (e.g. the worker that ran
+        ingestion), at most once per ``reload_interval`` unless ``force`` is set.
+
+        Args:
+            force (bool): Check the files now, ignoring the interval.
+
+        Returns:
+            bool: True if the in-memory index was replaced or dropped.
+        """
+        if not force:
+            if self.reload_interval <= 0:
+                return False
+            now = time.monotonic()
+            if now < self._next_reload_check:
+                return False
+            self._next_reload_check = now + self.reload_interval
+
+        signature = self._signature()
+        with self._lock:
+            if signature == self._file_signature:
+                return False
+            if signature is None:
+                log_info(IndexServiceLogMessages.INFO_REMOVED_ON_DISK.value)
+                self._index, self._ids, self._mapped = None, _EMPTY_IDS, False
+                self._file_signature = None
+            else:
+                log_info(IndexServiceLogMessages.INFO_CHANGED_ON_DISK.value.format(
+                    self.index_path))
+                if not self._load():
+                    return False
+            self._version += 1
+            return True
+
+    def save(self) -> None:
+        """
+        Persist the index and its id mapping, replacing the previous files atomically.
+
+        The id map is swapped in before the index, and readers reload when the index
+        file changes, so a reader never pairs a new index with an old id map; one
+        that catches the swap half done sees mismatched sizes and keeps its current
+        index until the next check. With ``mmap`` enabled the saved files are then
+        mapped in place of the private in-memory copy.
+        """
+        with self._lock:
+            if self._index is None or self._mapped:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+                # Per-process names, so workers saving at the same time cannot clash.
+                suffix = f"{os.getpid()}.tmp"
+                tmp_index, tmp_ids = f"{self.index_path}.{suffix}", f"{self.ids_path}.{suffix}"
+                faiss.write_index(self._index, tmp_index)
+                with open(tmp_ids, "wb") as ids_file:
+                    np.save(ids_file, self._ids)
+                os.replace(tmp_ids, self.ids_path)
+                os.replace(tmp_index, self.index_path)
+                self._file_signature = self._signature()
+                log_info(IndexServiceLogMessages.INFO_SAVED.value.format(
+                    self.ntotal, self.index_path))
+            except (OSError, RuntimeError) as err:
+                log_error(IndexServiceLogMessages.ERR_SAVE_FAILED.value.format(err))
+                return
+            if self.mmap:
+                self._load()
+
+    def _load(self) -> bool:
+        """Load the index and id mapping from disk; return False if unavailable."""
+        signature = self._signature()
+        if signature is None or not os.path.exists(self.ids_path):
+            return False
+        with self._lock:
+            try:
+                if self.mmap:
+                    index = faiss.read_index(self.index_path, _MMAP_FLAGS)
+                    ids = np.load(self.ids_path, mmap_mode="r")
+                else:
+                    index = faiss.read_index(self.index_path)
+                    ids = np.load(self.ids_path)
+                ids = ids.astype(np.int64, copy=False)
+                if ids.ndim != 1 or ids.size != index.ntotal:
+                    log_warning(IndexServiceLogMessages.WARN_ID_MAP_MISMATCH.value.format(
+                        ids.size, index.ntotal))
+                    return False
+                apply_search_defaults(index)
+                self._index, self._ids, self._mapped = index, ids, self.mmap
+                self._trained_on = int(index.ntotal)
+                self._file_signature = signature
+                log_info(IndexServiceLogMessages.INFO_LOADED_FROM_DISK.value.format(
+                    self.ntotal, self.index_path, " (memory-mapped)" if self.mmap else ""))
+                return True
+            except (OSError, RuntimeError, ValueError) as err:
+                log_error(IndexServiceLogMessages.ERR_LOAD_FAILED.value.format(err))
+                return False
+
+    def _filter_bitmap(
+        self, chunk_filter: ChunkFilter, conn: Optional[sqlite3.Connection]
+    ) -> RowBitmap:
+        """Cached row bitmap of ``chunk_filter``, rebuilt whenever the id map is replaced."""
+        if self._bitmaps_ids is not self._ids:
+            self._bitmaps.clear()
+            self._bitmaps_ids = self._ids
+        bitmap = self._bitmaps.get(chunk_filter)
+        if bitmap is not None:
+            self._bitmaps.move_to_end(chunk_filter)
+            return bitmap
+        if conn is None:
+            raise ValueError("A connection is required to resolve a chunk filter.")
+
+        bitmap = RowBitmap(self._ids, chunk_filter.matching_ids(conn))
+        self._bitmaps[chunk_filter] = bitmap
+        while len(self._bitmaps) > _MAX_FILTER_BITMAPS:
+            self._bitmaps.popitem(last=False)
+        log_debug(IndexServiceLogMessages.DEBUG_FILTER_BITMAP.value.format(
+            bitmap.count, self._ids.size, chunk_filter))
+        return bitmap
+
+    def _sorted_id_order(self) -> np.ndarray:
+        """Argsort of the id map, recomputed whenever the map is replaced."""
+        if self._id_order is None or self._id_order[0] is not self._ids:
+            self._id_order = (self._ids, np.argsort(self._ids, kind="stable"))
+        return self._id_order[1]
+
+    def _is_pq_fallback(self, index: faiss.Index) -> bool:
+        """True for the IVFFlat stand-in of an IVFPQ index whose corpus is still
+        too small to train PQ; rebuilding it would only fall back again."""
+        return (self.index_type is FaissIndexType.IVF_PQ
+                and index_type_of(index) is FaissIndexType.IVF_FLAT
+                and index.ntotal < self._pq_min_vectors)
+
+    def _make_writable(self) -> None:
+        """Swap a read-only mapping for a private copy before the index is modified."""
+        if not self._mapped:
+            return
+        self._index = faiss.deserialize_index(faiss.serialize_index(self._index))
+        apply_search_defaults(self._index)
+        self._ids = np.array(self._ids, dtype=np.int64)
+        self._mapped = False
+
+    def _signature(self) -> Optional[Tuple[int, int, int]]:
+        """Identity of the index file on disk; changes whenever it is replaced."""
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _remove_files(self) -> None:
+        for path in (self.index_path, self.ids_path):
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,105 @@
+"""
+lexical_search module for RAG: BM25 keyword search over the FTS5 chunk index.
+
+Dense retrieval is weak on exact tokens such as product codes, branch names
+and phone numbers. This module ranks chunks by BM25 over the 'chunks_fts'
+table instead. It needs no embedding model, so it also serves queries while
+the model is still loading.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import sys
+import traceback
+from typing import List, Optional, Tuple
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_debug, log_warning
+    from src.enums import LexicalSearchLogMessages
+    from .metadata_filter import ChunkFilter
+
+except (FileNotFoundError, OSError) as e:
+    logging.error("Fatal error setting up project directory: %s", str(e))
+    logging.error(traceback.format_exc())
+    sys.exit(1)
+
+
+_TERM = re.compile(r"\w+")
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word becomes a quoted term, so user input cannot inject FTS5 syntax.
+    Terms are OR-ed: BM25 ranks chunks containing more of them, and rarer ones,
+    higher, without requiring every word to be present.
+
+    Args:
+        query (str): The user query.
+
+    Returns:
+        str: The MATCH expression, or "" if the query has no word characters.
+    """
+    terms = dict.fromkeys(term.casefold() for term in _TERM.findall(query))
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+def lexical_search(
+    conn: sqlite3.Connection,
+    query: str,
+    top_k: int,
+    chunk_filter: Optional[ChunkFilter] = None,
+) -> List[Tuple[int, float]]:
+    """
+    Return the ``top_k`` chunks that best match ``query`` by BM25.
+
+    Args:
+        conn (sqlite3.Connection): Active SQLite connection.
+        query (str): The user query.
+        top_k (int): Number of chunks to return.
+        chunk_filter (Optional[ChunkFilter]): Only rank chunks matching it; applied in
+            the same query, before the ``LIMIT``.
+
+    Returns:
+        List[Tuple[int, float]]: (chunk id, score) pairs, best match first. Scores
+            are negated BM25 values, so higher is better as for vector search. The
+            list is empty if nothing matched or the full-text index is unavailable.
+    """
+    match = build_match_query(query)
+    if not match:
+        log_warning(LexicalSearchLogMessages.WARN_NO_TERMS.value)
+        return []
+    log_debug(LexicalSearchLogMessages.DEBUG_MATCH_QUERY.value.format(match))
+
+    try:
+        if chunk_filter is None:
+            rows = conn.execute(
+                "SELECT rowid, bm25(chunks_fts) FROM chunks_fts WHERE chunks_fts MATCH ? "
+                "ORDER BY bm25(chunks_fts) LIMIT ?",
+                (match, top_k),
+            ).fetchall()
+        else:
+            condition, params = chunk_filter.where_clause()
+            rows = conn.execute(
+                "SELECT chunks_fts.rowid, bm25(chunks_fts) FROM chunks_fts "
+                "JOIN chunks ON chunks.id = chunks_fts.rowid "
+                f"WHERE chunks_fts MATCH ? AND {condition} "
+                "ORDER BY bm25(chunks_fts) LIMIT ?",
+                (match, *params, top_k),
+            ).fetchall()
+    except sqlite3.OperationalError as err:
+        log_warning(LexicalSearchLogMessages.WARN_UNAVAILABLE.value.format(err))
+        return []
+
+    log_debug(LexicalSearchLogMessages.DEBUG_HITS.value.format(len(rows)))
+    return [(int(chunk_id), -float(score)) for chunk_id, score in rows]
@@ -0,0 +1,121 @@
+"""
+metadata_filter module for RAG: restrict retrieval to chunks matching metadata.
+
+A ``ChunkFilter`` selects chunks by source, author and page range. The
+matching chunk ids come from one indexed query on the ``chunks`` table and are
+turned into a FAISS ``IDSelectorBitmap`` over the index rows, so the vector
+search itself skips non-matching rows instead of over-fetching and discarding
+results afterwards. Lexical search applies the same filter as a SQL ``WHERE``
+clause.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ChunkFilter:
+    """
+    Metadata constraints on retrieved chunks; all given constraints must hold.
+
+    Instances are hashable, so they can key caches of precomputed bitmaps.
+
+    Attributes:
+        sources (Tuple[str, ...]): Accepted ``sources`` values; empty accepts any.
+        authors (Tuple[str, ...]): Accepted ``authors`` values; empty accepts any.
+        page_min (Optional[int]): Lowest accepted page number, inclusive.
+        page_max (Optional[int]): Highest accepted page number, inclusive.
+    """
+
+    sources: Tuple[str, ...] = ()
+    authors: Tuple[str, ...] = ()
+    page_min: Optional[int] = None
+    page_max: Optional[int] = None
+
+    @classmethod
+    def of(
+        cls,
+        sources: Optional[Iterable[str]] = None,
+        authors: Optional[Iterable[str]] = None,
+        page_min: Optional[int] = None,
+        page_max: Optional[int] = None,
+    ) -> Optional["ChunkFilter"]:
+        """
+        Build a filter from optional request fields.
+
+        Returns:
+            Optional[ChunkFilter]: The filter, or None when no constraint is given.
+        """
+        chunk_filter = cls(
+            sources=tuple(sorted(set(sources or ()))),
+            authors=tuple(sorted(set(authors or ()))),
+            page_min=page_min,
+            page_max=page_max,
+        )
+        return None if chunk_filter.is_empty else chunk_filter
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the filter accepts every chunk."""
+        return (not self.sources and not self.authors
+                and self.page_min is None and self.page_max is None)
+
+    def where_clause(self, table: str = "chunks") -> Tuple[str, List[object]]:
+        """
+        SQL condition and parameters selecting the matching rows of ``table``.
+
+        Pages are stored as text, so they are compared as integers.
+
+        Returns:
+            Tuple[str, List[object]]: The condition (``1`` for an empty filter) and
+                its bound parameters.
+        """
+        conditions: List[str] = []
+        params: List[object] = []
+        if self.sources:
+            conditions.append(f"{table}.sources IN ({', '.join('?' * len(self.sources))})")
+            params.extend(self.sources)
+        if self.authors:
+            conditions.append(f"{table}.authors IN ({', '.join('?' * len(self.authors))})")
+            params.extend(self.authors)
+        if self.page_min is not None:
+            conditions.append(f"CAST({table}.pages AS INTEGER) >= ?")
+            params.append(self.page_min)
+        if self.page_max is not None:
+            conditions.append(f"CAST({table}.pages AS INTEGER) <= ?")
+            params.append(self.page_max)
+        return " AND ".join(conditions) or "1", params
+
+    def matching_ids(self, conn: sqlite3.Connection) -> np.ndarray:
+        """
+        Ids of all chunks matching the filter.
+
+        Raises:
+            sqlite3.Error: If a database access error occurs.
+        """
+        condition, params = self.where_clause()
+        rows = conn.execute(f"SELECT id FROM chunks WHERE {condition}", params).fetchall()
+        return np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+
+
+class RowBitmap:
+    """
+    Packed bitmap over index rows and the FAISS selector reading it.
+
+    The selector only holds a pointer into ``bits``, so both live together.
+
+    Attributes:
+        bits (np.ndarray): uint8 array, bit ``i`` set when row ``i`` may be returned.
+        count (int): Number of rows selected.
+        selector (faiss.IDSelectorBitmap): Selector for ``SearchParameters.sel``.
+    """
+
+    def __init__(self, row_ids: np.ndarray, allowed_ids: np.ndarray):
+        mask = np.isin(row_ids, allowed_ids)
+        self.bits = np.packbits(mask, bitorder="little")
+        self.count = int(mask.sum())
+        self.selector = faiss.IDSelectorBitmap(mask.size, faiss.swig_ptr(self.bits))
@@ -0,0 +1,30 @@
+"""
+rank_fusion module for RAG: merges rankings from different retrievers.
+
+Reciprocal rank fusion scores every item by ``sum(1 / (k + rank))`` over the
+rankings it appears in. It only uses ranks, so BM25 scores and vector
+similarities never have to be put on a common scale.
+"""
+
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]], k: int = 60
+) -> List[Tuple[Hashable, float]]:
+    """
+    Fuse several best-first rankings into one.
+
+    Args:
+        rankings (Sequence[Sequence[Hashable]]): Item ids, best first, per retriever.
+        k (int): Rank offset; larger values reduce the weight of the top ranks.
+
+    Returns:
+        List[Tuple[Hashable, float]]: (item, fused score) pairs, best first. Ties keep
+            the order in which items were first seen.
+    """
+    scores: Dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda pair: pair[1], reverse=True)
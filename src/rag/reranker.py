@@ -0,0 +1,149 @@
+"""
+reranker module for RAG: reorders retrieved chunks with a cross-encoder.
+
+Bi-encoder retrieval scores the query and each chunk independently. A
+cross-encoder reads them together and ranks far more precisely, but costs a
+forward pass per pair. The reranker therefore scores a bounded candidate set
+(RERANK_CANDIDATES) in one batched pass on CPU and keeps the best ``top_n``.
+The prompt then carries fewer, better chunks.
+
+The reranker tracks its own per-pair latency. When the expected cost of a
+batch exceeds RERANK_BUDGET_MS (typically because the machine is under load),
+the retrieval order is used as is. Every ``probe_every``-th skipped call is
+reranked anyway, so the estimate recovers once the load drops.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_debug, log_info
+    from src.logs.metrics import RERANK_SKIPPED_TOTAL, RETRIEVAL_STAGE_SECONDS
+    from src.helpers import get_settings, Settings
+    from src.enums import RerankerLogMessages
+
+except (FileNotFoundError, OSError) as e:
+    logging.error("Fatal error setting up project directory: %s", str(e))
+    logging.error(traceback.format_exc())
+    sys.exit(1)
+
+
+class CrossEncoderReranker:
+    """
+    Batched cross-encoder reranking with a latency budget.
+
+    Attributes:
+        model_name (str): Cross-encoder model identifier.
+        candidates (int): Number of chunks retrieval should hand to the reranker.
+        budget_ms (float): Latency above which reranking is skipped; 0 never skips.
+        probe_every (int): Rerank after this many consecutive skips to refresh the
+            latency estimate.
+    """
+
+    # Weight of the newest measurement in the per-pair latency estimate.
+    _EWMA_ALPHA = 0.2
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        candidates: Optional[int] = None,
+        budget_ms: Optional[float] = None,
+        probe_every: int = 20,
+        model: Any = None,
+    ):
+        app_settings: Settings = get_settings()
+        self.model_name = model_name or app_settings.RERANK_MODEL
+        self.candidates = app_settings.RERANK_CANDIDATES if candidates is None else candidates
+        self.budget_ms = app_settings.RERANK_BUDGET_MS if budget_ms is None else budget_ms
+        self.probe_every = probe_every
+        if model is None:
+            # Imported here so the application starts without the reranker's weights
+            # when reranking is disabled.
+            from sentence_transformers import CrossEncoder  # pylint: disable=import-outside-toplevel
+            model = CrossEncoder(
+                self.model_name, max_length=app_settings.RERANK_MAX_LENGTH, device="cpu"
+            )
+        self.model = model
+        self._per_pair_ms: Optional[float] = None
+        self._skipped = 0
+        self._lock = threading.Lock()
+        log_info(RerankerLogMessages.INFO_LOADED.value.format(
+            self.model_name, self.candidates, self.budget_ms))
+
+    @property
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Current per-pair latency estimate and budget."""
+        return {"per_pair_ms": self._per_pair_ms, "budget_ms": self.budget_ms}
+
+    def rerank(
+        self, query: str, chunks: List[Dict[str, Any]], top_n: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the ``top_n`` chunks most relevant to ``query``.
+
+        Reranked chunks gain a 'rerank_score'. When the budget forces a skip, the
+        first ``top_n`` chunks are returned in retrieval order.
+
+        Args:
+            query (str): The user query.
+            chunks (List[Dict[str, Any]]): Retrieved candidates with 'page_content'.
+            top_n (int): Number of chunks to keep.
+
+        Returns:
+            List[Dict[str, Any]]: The kept chunks, best first.
+        """
+        if len(chunks) <= 1:
+            return chunks[:top_n]
+        if self._over_budget(len(chunks)):
+            return chunks[:top_n]
+
+        start = time.perf_counter()
+        scores = self.model.predict(
+            [(query, chunk["page_content"]) for chunk in chunks],
+            batch_size=len(chunks),
+            show_progress_bar=False,
+        )
+        elapsed = time.perf_counter() - start
+        RETRIEVAL_STAGE_SECONDS.labels(stage="rerank").observe(elapsed)
+        self._record(elapsed * 1000 / len(chunks))
+
+        for chunk, score in zip(chunks, scores):
+            chunk["rerank_score"] = float(score)
+        ranked = sorted(chunks, key=lambda chunk: chunk["rerank_score"], reverse=True)
+        log_debug(RerankerLogMessages.DEBUG_RERANKED.value.format(
+            len(chunks), elapsed * 1000, min(top_n, len(ranked))))
+        return ranked[:top_n]
+
+    def _over_budget(self, n_pairs: int) -> bool:
+        with self._lock:
+            if self.budget_ms <= 0 or self._per_pair_ms is None:
+                return False
+            estimate = self._per_pair_ms * n_pairs
+            if estimate <= self.budget_ms or self._skipped >= self.probe_every:
+                self._skipped = 0
+                return False
+            self._skipped += 1
+        RERANK_SKIPPED_TOTAL.labels(reason="budget").inc()
+        log_debug(RerankerLogMessages.DEBUG_SKIPPED.value.format(
+            n_pairs, estimate, self.budget_ms))
+        return True
+
+    def _record(self, per_pair_ms: float) -> None:
+        with self._lock:
+            if self._per_pair_ms is None:
+                self._per_pair_ms = per_pair_ms
+            else:
+                self._per_pair_ms += self._EWMA_ALPHA * (per_pair_ms - self._per_pair_ms)
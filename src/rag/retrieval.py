@@ -1,13 +1,36 @@
 """
 retrieval module for RAG: performs similarity search over stored embeddings.
+
+Every returned chunk carries the similarity ``score`` it was retrieved with
+(higher is better), so callers can drop weak matches with ``min_score``
+instead of padding the prompt with irrelevant context.
+
+Three modes are supported (RETRIEVAL_MODE, or per call):
+
+- ``vector``: nearest neighbours in the FAISS index.
+- ``lexical``: BM25 over the FTS5 chunk index; used automatically when no
+  embedding model is available yet.
+- ``hybrid``: both rankings merged with reciprocal rank fusion, so exact-term
+  matches (codes, names, phone numbers) surface next to semantic ones.
+
+Optional maximal marginal relevance (MMR_ENABLED, or ``mmr_lambda`` per call)
+drops near-duplicate chunks, e.g. overlapping windows or headers repeated
+across crawled pages, and reports the prompt tokens this saved. An optional
+cross-encoder reranker widens the candidate set and picks the final
+``top_k``. Metadata filters (source, author, page range) are applied inside
+the FAISS search and the FTS5 query rather than by over-fetching. Each
+stage's duration goes to the ``rami_retrieval_stage_seconds`` histogram, and
+the amount of context returned goes to ``rami_retrieval_context_chars``.
 """
 
 import logging
 import os
 import sqlite3
 import sys
+import time
 import traceback
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -21,10 +44,32 @@ try:
 
     from src.embedding import EmbeddingModel
     from src.logs import log_debug, log_error, log_info
-    from src.enums import RetrievalLogMessages
-    from .database_retrieval import load_embeddings_and_metadata
+    from src.logs.metrics import (
+        RETRIEVAL_CONTEXT_CHARS,
+        RETRIEVAL_DUPLICATES_DROPPED_TOTAL,
+        RETRIEVAL_STAGE_SECONDS,
+        RETRIEVAL_TOKENS_SAVED_TOTAL,
+    )
+    from src.helpers import get_settings
+    from src.enums import FaissMetric, RetrievalLogMessages, RetrievalMode
+    from .database_retrieval import (
+        fetch_chunks,
+        fetch_embeddings,
+        load_embeddings_and_metadata,
+    )
+    from .diversify import estimate_tokens, mmr_select
     from .embedding_query import embed_query
-    from .faiss_search import build_faiss_index
+    from .faiss_search import (
+        build_faiss_index,
+        distances_to_scores,
+        prepare_vectors,
+        search_parameters,
+    )
+    from .index_service import FaissIndexService
+    from .lexical_search import lexical_search
+    from .metadata_filter import ChunkFilter, RowBitmap
+    from .rank_fusion import reciprocal_rank_fusion
+    from .reranker import CrossEncoderReranker
 
 except (FileNotFoundError, OSError) as e:
     logging.error("Fatal error setting up project directory: %s", str(e))
@@ -34,21 +79,53 @@ except (FileNotFoundError, OSError) as e:
 
 def search(
     query: str,
-    embedder: EmbeddingModel,
+    embedder: Optional[EmbeddingModel],
     conn: sqlite3.Connection,
     top_k: int = 5,
+    index_service: Optional[FaissIndexService] = None,
+    query_vector: Optional[np.ndarray] = None,
+    nprobe: Optional[int] = None,
+    ef_search: Optional[int] = None,
+    min_score: Optional[float] = None,
+    mode: Optional[str] = None,
+    reranker: Optional[CrossEncoderReranker] = None,
+    mmr_lambda: Optional[float] = None,
+    filters: Optional[ChunkFilter] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search for the most relevant page contents based on a given query.
 
     Args:
         query (str): The input user query.
-        embedder (EmbeddingModel): The embedding model instance to encode the query.
+        embedder (Optional[EmbeddingModel]): The embedding model instance to encode the
+            query. When it is None and no ``query_vector`` is given, the search falls
+            back to lexical mode.
         conn (sqlite3.Connection): SQLite DB connection to retrieve chunked documents.
         top_k (int): Number of top matching results to return.
+        index_service (Optional[FaissIndexService]): Long-lived index to search. When
+            omitted, a throwaway index is built from the database for this call.
+        query_vector (Optional[np.ndarray]): Embedding of ``query`` if the caller has
+            already computed it; otherwise the query is embedded here.
+        nprobe (Optional[int]): Per-query override of the IVF lists scanned.
+        ef_search (Optional[int]): Per-query override of the HNSW candidate list size.
+        min_score (Optional[float]): Drop vector hits scoring below this value. Scores
+            are cosine similarities with FAISS_METRIC=cosine and negated squared L2
+            distances otherwise. Lexical hits are not filtered.
+        mode (Optional[str]): 'vector', 'lexical' or 'hybrid'; defaults to the
+            RETRIEVAL_MODE setting.
+        reranker (Optional[CrossEncoderReranker]): When given, ``reranker.candidates``
+            chunks are retrieved and the reranker keeps the best ``top_k``.
+        mmr_lambda (Optional[float]): Diversify the candidates with maximal marginal
+            relevance using this relevance weight in [0, 1]. Defaults to MMR_LAMBDA
+            when MMR_ENABLED is set; otherwise no diversification happens.
+        filters (Optional[ChunkFilter]): Only return chunks matching these sources,
+            authors and page range.
 
     Returns:
-        List[Dict[str, Any]]: List of matching chunks with 'id' and 'page_content'.
+        List[Dict[str, Any]]: Matching chunks in rank order, each with 'id',
+            'page_content', the chunk's 'page', 'source' and 'author', and its 'score'
+            (vector similarity, negated BM25, or fused RRF score depending on the mode),
+            plus a 'rerank_score' when they were reranked.
 
     Raises:
         ImportError: If a dependency import fails.
@@ -58,39 +135,70 @@ def search(
         preview = query[:30] + "..." if len(query) > 30 else query
         log_info(RetrievalLogMessages.INFO_SEARCH_START.value.format(preview))
 
-        ids, embeddings_array, _ = load_embeddings_and_metadata(conn)
-        if not ids:
-            log_error(RetrievalLogMessages.ERR_NO_EMBEDDINGS.value)
-            return []
+        app_settings = get_settings()
+        mode = RetrievalMode(mode or app_settings.RETRIEVAL_MODE)
+        if mode is not RetrievalMode.LEXICAL and embedder is None and query_vector is None:
+            log_info(RetrievalLogMessages.INFO_LEXICAL_FAST_PATH.value)
+            mode = RetrievalMode.LEXICAL
 
-        index = build_faiss_index(embeddings_array)
+        if mmr_lambda is None and app_settings.MMR_ENABLED:
+            mmr_lambda = app_settings.MMR_LAMBDA
+        timings: Dict[str, float] = {}
+        fetch_k = top_k if reranker is None else max(top_k, reranker.candidates)
+        if mmr_lambda is not None:
+            fetch_k = max(fetch_k, app_settings.MMR_CANDIDATES)
+        if mmr_lambda is not None and (embedder is not None or query_vector is not None):
+            query_vector = _query_vector(query, embedder, query_vector, timings)
+        if mode is RetrievalMode.LEXICAL:
+            with _stage("lexical", timings):
+                hits = lexical_search(conn, query, fetch_k, chunk_filter=filters)
+        else:
+            candidates = (max(fetch_k, app_settings.RETRIEVAL_CANDIDATES)
+                          if mode is RetrievalMode.HYBRID else fetch_k)
+            dense = _vector_hits(query, embedder, conn, candidates, index_service,
+                                 query_vector, nprobe, ef_search, timings, filters)
+            if dense is None and mode is RetrievalMode.VECTOR:
+                log_error(RetrievalLogMessages.ERR_NO_EMBEDDINGS.value)
+                return []
+            dense = _above_min_score(dense or [], min_score)
 
-        vector = embed_query(
-            query,
-            embedder,
-            convert_to_tensor=False,
-            normalize_embeddings=False,
-        )
-        if isinstance(vector, list):
-            vector = np.array(vector, dtype=np.float32)
+            if mode is RetrievalMode.HYBRID:
+                with _stage("lexical", timings):
+                    lexical = lexical_search(conn, query, candidates, chunk_filter=filters)
+                with _stage("fusion", timings):
+                    hits = reciprocal_rank_fusion(
+                        [[chunk_id for chunk_id, _ in dense],
+                         [chunk_id for chunk_id, _ in lexical]],
+                        k=app_settings.RRF_K,
+                    )[:fetch_k]
+                log_info(RetrievalLogMessages.INFO_FUSED.value.format(
+                    len(dense), len(lexical), len(hits)))
+            else:
+                hits = dense
+        log_info(RetrievalLogMessages.INFO_INDICES_RETRIEVED.value.format(len(hits)))
 
-        indices = index.search(np.expand_dims(vector, axis=0), top_k)[1][0]
-        log_info(RetrievalLogMessages.INFO_INDICES_RETRIEVED.value.format(len(indices)))
+        scores = dict(hits)
+        with _stage("fetch", timings):
+            chunks = fetch_chunks(conn, [chunk_id for chunk_id, _ in hits])
+        for chunk in chunks:
+            chunk["score"] = scores[chunk["id"]]
 
-        cursor = conn.cursor()
-        results: List[Dict[str, Any]] = []
+        if mmr_lambda is not None and query_vector is not None:
+            with _stage("mmr", timings):
+                chunks = _diversify(chunks, query_vector, index_service, conn, mmr_lambda,
+                                    top_k if reranker is None else len(chunks))
+        if reranker is None:
+            chunks = chunks[:top_k]
+        else:
+            start = time.perf_counter()
+            chunks = reranker.rerank(query, chunks, top_k)
+            timings["rerank"] = time.perf_counter() - start
 
-        for idx in indices:
-            if idx < 0:
-                continue
-            cursor.execute(
-                "SELECT id, page_contest FROM chunks WHERE id = ?", (ids[idx],)
-            )
-            row = cursor.fetchone()
-            if row:
-                results.append({"id": row[0], "page_content": row[1]})
-
-        return results
+        RETRIEVAL_CONTEXT_CHARS.observe(
+            sum(len(str(chunk["page_content"])) for chunk in chunks))
+        log_info(RetrievalLogMessages.INFO_STAGE_TIMINGS.value.format(", ".join(
+            f"{stage}={seconds * 1000:.1f}" for stage, seconds in timings.items())))
+        return chunks
 
     except ImportError as imp_err:
         log_error(RetrievalLogMessages.ERR_IMPORT_ERROR.value.format(str(imp_err)))
@@ -110,3 +218,207 @@ def search(
 
     finally:
         log_debug(RetrievalLogMessages.DEBUG_EXEC_COMPLETE.value)
+
+
+# pylint: disable=too-many-arguments
+def search_batch(
+    queries: Sequence[str],
+    embedder: EmbeddingModel,
+    conn: sqlite3.Connection,
+    index_service: FaissIndexService,
+    top_k: int = 5,
+    nprobe: Optional[int] = None,
+    ef_search: Optional[int] = None,
+    min_score: Optional[float] = None,
+    filters: Optional[ChunkFilter] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Vector search for many queries, yielding each query's chunks as soon as they are ready.
+
+    Queries are processed in rounds of ``chunk_size``. Each round is embedded with
+    one batched ``encode`` call, searched with one FAISS search over the query
+    matrix, and resolved to chunks with one database query, so per-query overhead
+    is paid once per round instead of once per query.
+
+    Args:
+        queries (Sequence[str]): The queries, answered in order.
+        embedder (EmbeddingModel): Model used to embed the queries.
+        conn (sqlite3.Connection): SQLite DB connection to retrieve chunked documents.
+        index_service (FaissIndexService): Index to search.
+        top_k (int): Number of chunks per query.
+        nprobe (Optional[int]): Per-query override of the IVF lists scanned.
+        ef_search (Optional[int]): Per-query override of the HNSW candidate list size.
+        min_score (Optional[float]): Drop hits scoring below this value.
+        filters (Optional[ChunkFilter]): Only return chunks matching these constraints.
+        chunk_size (Optional[int]): Queries per round; defaults to LIVE_RAG_BATCH_CHUNK.
+
+    Yields:
+        List[Dict[str, Any]]: For each query, its chunks in rank order, shaped as
+            the results of ``search``.
+    """
+    app_settings = get_settings()
+    chunk_size = chunk_size or app_settings.LIVE_RAG_BATCH_CHUNK
+    normalize = FaissMetric(app_settings.FAISS_METRIC) is FaissMetric.COSINE
+    for start in range(0, len(queries), chunk_size):
+        batch = list(queries[start:start + chunk_size])
+        timings: Dict[str, float] = {}
+        with _stage("batch_embed", timings):
+            vectors = embedder.embed_batch(
+                batch,
+                batch_size=app_settings.EMBEDDING_BATCH_SIZE,
+                normalize_embeddings=normalize,
+            )
+        with _stage("batch_vector", timings):
+            hits = index_service.search_batch_with_scores(
+                vectors, top_k, nprobe=nprobe, ef_search=ef_search,
+                chunk_filter=filters, conn=conn,
+            )
+        hits = [_above_min_score(query_hits, min_score) for query_hits in hits]
+        with _stage("batch_fetch", timings):
+            chunks = {chunk["id"]: chunk for chunk in fetch_chunks(
+                conn, [chunk_id for query_hits in hits for chunk_id, _ in query_hits])}
+        log_info(RetrievalLogMessages.INFO_BATCH_SEARCHED.value.format(len(batch), ", ".join(
+            f"{stage}={seconds * 1000:.1f}" for stage, seconds in timings.items())))
+
+        for query_hits in hits:
+            yield [dict(chunks[chunk_id], score=score)
+                   for chunk_id, score in query_hits if chunk_id in chunks]
+
+
+# pylint: disable=too-many-arguments
+def _vector_hits(
+    query: str,
+    embedder: Optional[EmbeddingModel],
+    conn: sqlite3.Connection,
+    top_k: int,
+    index_service: Optional[FaissIndexService],
+    query_vector: Optional[np.ndarray],
+    nprobe: Optional[int],
+    ef_search: Optional[int],
+    timings: Dict[str, float],
+    filters: Optional[ChunkFilter] = None,
+) -> Optional[List[Tuple[int, float]]]:
+    """Nearest-neighbour (chunk id, score) pairs, or None if nothing is embedded yet."""
+    if index_service is not None and index_service.ntotal == 0:
+        return None
+
+    metric = FaissMetric(get_settings().FAISS_METRIC)
+    vector = _query_vector(query, embedder, query_vector, timings)
+
+    if index_service is not None:
+        with _stage("vector", timings):
+            return index_service.search_with_scores(
+                vector, top_k, nprobe=nprobe, ef_search=ef_search,
+                chunk_filter=filters, conn=conn,
+            )
+
+    ids, embeddings_array, _ = load_embeddings_and_metadata(conn, with_metadata=False)
+    if ids.size == 0:
+        return None
+    bitmap = None if filters is None else RowBitmap(ids, filters.matching_ids(conn))
+    if bitmap is not None and bitmap.count == 0:
+        return []
+    with _stage("vector", timings):
+        index = build_faiss_index(embeddings_array, metric=metric)
+        distances, indices = index.search(
+            prepare_vectors(vector, metric), top_k,
+            params=search_parameters(index, nprobe=nprobe, ef_search=ef_search,
+                                     selector=None if bitmap is None else bitmap.selector),
+        )
+    found = indices[0] >= 0
+    return list(zip(ids[indices[0][found]].tolist(),
+                    distances_to_scores(distances[0][found], metric).tolist()))
+
+
+def _query_vector(
+    query: str,
+    embedder: Optional[EmbeddingModel],
+    query_vector: Optional[np.ndarray],
+    timings: Dict[str, float],
+) -> np.ndarray:
+    """Return ``query_vector`` as an array, embedding ``query`` if it is missing."""
+    vector = query_vector
+    if vector is None:
+        with _stage("embed", timings):
+            vector = embed_query(
+                query,
+                embedder,
+                convert_to_tensor=False,
+                normalize_embeddings=FaissMetric(get_settings().FAISS_METRIC)
+                is FaissMetric.COSINE,
+            )
+    if isinstance(vector, list):
+        vector = np.array(vector, dtype=np.float32)
+    return vector
+
+
+# pylint: disable=too-many-arguments
+def _diversify(
+    chunks: List[Dict[str, Any]],
+    query_vector: np.ndarray,
+    index_service: Optional[FaissIndexService],
+    conn: sqlite3.Connection,
+    lambda_mult: float,
+    keep: int,
+) -> List[Dict[str, Any]]:
+    """
+    Reorder ``chunks`` by MMR, dropping near-duplicates, and keep at most ``keep``.
+
+    Candidate vectors come from the in-memory index when it can reconstruct them
+    and from the embeddings table otherwise. Chunks without a stored vector are
+    kept after the diversified ones. The tokens saved are those of the chunks the
+    plain relevance order would have put in the prompt but MMR dropped as
+    near-duplicates.
+    """
+    ids = [chunk["id"] for chunk in chunks]
+    vectors = index_service.reconstruct(ids) if index_service is not None else {}
+    if len(vectors) < len(ids):
+        vectors.update(fetch_embeddings(conn, [i for i in ids if i not in vectors]))
+    with_vectors = [chunk for chunk in chunks if chunk["id"] in vectors]
+    if not with_vectors:
+        return chunks[:keep]
+
+    selected, duplicates = mmr_select(
+        query_vector,
+        np.stack([vectors[chunk["id"]] for chunk in with_vectors]),
+        keep,
+        lambda_mult=lambda_mult,
+        duplicate_threshold=get_settings().MMR_DUPLICATE_THRESHOLD,
+    )
+    diversified = [with_vectors[i] for i in selected]
+    diversified += [chunk for chunk in chunks if chunk["id"] not in vectors]
+    diversified = diversified[:keep]
+
+    dropped = {with_vectors[i]["id"] for i in duplicates}
+    tokens_saved = sum(estimate_tokens(str(chunk["page_content"]))
+                       for chunk in chunks[:keep] if chunk["id"] in dropped)
+    RETRIEVAL_DUPLICATES_DROPPED_TOTAL.inc(len(dropped))
+    RETRIEVAL_TOKENS_SAVED_TOTAL.inc(tokens_saved)
+    log_info(RetrievalLogMessages.INFO_DIVERSIFIED.value.format(
+        len(diversified), len(chunks), len(dropped), tokens_saved))
+    return diversified
+
+
+@contextmanager
+def _stage(name: str, timings: Dict[str, float]) -> Iterator[None]:
+    """Time a retrieval stage into ``timings`` and the stage histogram."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings[name] = elapsed
+        RETRIEVAL_STAGE_SECONDS.labels(stage=name).observe(elapsed)
+
+
+def _above_min_score(
+    hits: List[Tuple[int, float]], min_score: Optional[float]
+) -> List[Tuple[int, float]]:
+    if min_score is None:
+        return hits
+    kept = [(chunk_id, score) for chunk_id, score in hits if score >= min_score]
+    if len(kept) < len(hits):
+        log_info(RetrievalLogMessages.INFO_BELOW_MIN_SCORE.value.format(
+            len(hits) - len(kept), min_score))
+    return kept
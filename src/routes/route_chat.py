@@ -2,8 +2,9 @@
 Route module for handling chat generation requests using a Large Language Model (LLM) integrated
 with Retrieval-Augmented Generation (RAG) context.
 
-This module defines a FastAPI router that exposes a single POST endpoint `/chat` which receives a
-user query and returns an AI-generated response. The response generation pipeline leverages
+This module defines a FastAPI router that exposes a POST endpoint `/chat` which receives a
+user query and returns an AI-generated response, plus a `/chat/stream` variant that sends the
+response token by token as Server-Sent Events. The response generation pipeline leverages
 retrieved relevant context from a vector search (RAG), a prompt builder, and a HuggingFace-based
 LLM for generating coherent and context-aware answers.
 
@@ -21,12 +22,19 @@ Main Features and Workflow:
    - Accepts a POST request with a JSON body conforming to the `Generate` schema, including the
      user's query.
    - Validates the query, ensuring it is not empty.
-   - Checks for a cached response in the database to optimize latency and resource usage.
-   - If a cached response exists, it is returned immediately.
+   - Checks the response cache (an in-memory LRU in front of the indexed `query_responses`
+     table, keyed on the case- and whitespace-normalized query) to optimize latency and
+     resource usage.
+   - If a fresh cached response exists, it is returned immediately.
+   - When `SEMANTIC_CACHE_ENABLED` is set, a miss falls through to the semantic cache, which
+     returns the answer to an earlier query whose embedding is similar enough. The query
+     embedding computed there is reused for retrieval.
 
 3. Retrieval-Augmented Generation (RAG):
    - When no cached response is found, it performs a similarity search over stored documents
      (via the `search` function) to gather the most relevant context for the query.
+   - Optional `filters` in the request body (sources, authors, page range) restrict the
+     search to matching chunks. Filtered requests bypass both response caches.
    - The retrieved context enriches the prompt, providing the LLM with domain-specific or
      user-specific information to improve response quality.
 
@@ -40,14 +48,32 @@ Main Features and Workflow:
    - Calls the LLM to generate a raw text response based on the constructed prompt.
    - Extracts the core answer from the full LLM output (using `extract_llm_answer_from_full`).
    - Updates the chat history by recording the user query and AI-generated response.
-   - Persists the query-response pair into the database cache for future reuse.
-
-6. Monitoring and Logging:
+   - Persists the query-response pair into the response cache for future reuse.
+
+6. Streaming:
+   - `/chat/stream` runs the same pipeline but drives `llm.stream_response`, forwarding each
+     token to the client as an SSE `data:` event as soon as it is produced. A final `done`
+     event carries the extracted answer; failures are reported as an `error` event.
+   - The cache write and chat-history update happen once the stream has completed.
+   - Time from request receipt to the first token is recorded per LLM backend in the
+     `rami_chat_time_to_first_token_seconds` histogram.
+
+7. Concurrency:
+   - The whole pipeline (cache lookup, retrieval, generation, persistence) is blocking, so it
+     runs on the bounded chat executor held in `app.state`. The event loop keeps serving
+     other routes while generations are in flight; excess requests wait in a bounded queue
+     and are rejected with 503 once it is full.
+   - Concurrent `/chat` requests with the same normalized query, the same retrieved
+     context and the same chat history are coalesced: one LLM generation runs and every
+     waiting request shares its output (counted by `rami_single_flight_shared_total`). Each request still records the
+     exchange in its own user's cache and chat history.
+
+8. Monitoring and Logging:
    - Tracks memory usage during generation using `tracemalloc`.
    - Logs key events such as cache hits/misses, prompt details, errors, and memory stats
      for observability and debugging.
 
-7. Error Handling:
+9. Error Handling:
    - Raises appropriate HTTP exceptions (400 Bad Request for empty queries).
    - Logs and returns 500 Internal Server Error on unexpected failures while shielding
      internal details from the client.
@@ -94,20 +120,29 @@ Author: Alrashid Issa
 Date: 2025-05-15
 """
 
+import asyncio
+import contextlib
+import hashlib
+import json
 import logging
 import os
 import sys
+import threading
+import time
 import traceback
 import tracemalloc
 from sqlite3 import Connection
-from typing import Tuple
+from typing import Any, AsyncIterator, Callable, Optional, Tuple
+
+import numpy as np
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.status import (
     HTTP_200_OK,
     HTTP_400_BAD_REQUEST,
     HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
     HTTP_507_INSUFFICIENT_STORAGE
 )
 
@@ -122,18 +157,42 @@ try:
     if MAIN_DIR not in sys.path:
         sys.path.append(MAIN_DIR)
 
-    from src.dbs import insert_query_response, pull_from_table
-    from src.dependencies import get_chat_history, get_db_conn, get_embedd, get_llm
+    from src.cache import ResponseCache, SemanticCache
+    from src.dbs import hash_query
+    from src.dependencies import (
+        get_chat_executor,
+        get_chat_history,
+        get_db_conn,
+        get_embedd,
+        get_index_service,
+        get_llm,
+        get_reranker,
+        get_response_cache,
+        get_semantic_cache,
+    )
     from src.embedding import EmbeddingModel
+    from src.helpers import get_settings
     from src.historys import ChatHistoryManager
     from src.llm import HuggingFaceLLM
 
     # Import internal modules
     from src.logs import log_debug, log_error, log_info
+    from src.logs.metrics import CHAT_TIME_TO_FIRST_TOKEN_SECONDS
     from src.prompt import PromptBuilder
-    from src.rag import search
+    from src.rag import (
+        ChunkFilter,
+        CrossEncoderReranker,
+        FaissIndexService,
+        embed_query,
+        search,
+    )
     from src.schemes import Generate
-    from src.utils import extract_llm_answer_from_full
+    from src.utils import (
+        BoundedExecutor,
+        ExecutorSaturatedError,
+        SingleFlight,
+        extract_llm_answer_from_full,
+    )
 
 except ImportError as ie:
     logging.error("Import Error setup error: %s", ie, exc_info=True)
@@ -144,19 +203,166 @@ except Exception as e:
 # Initialize router and memory profiler
 generate_routes = APIRouter()
 prompt_builder = PromptBuilder()
+chat_single_flight = SingleFlight(name="chat")
 tracemalloc.start()
 
+# Ranking scores attached by retrieval; kept out of the prompt.
+_SCORE_KEYS = ("score", "rerank_score")
+
+# Marks the end of the token queue feeding a `/chat/stream` response.
+_END_OF_STREAM = object()
+
+
+def _retrieve_context(
+    query: str, dependencies: dict, query_vector: Optional[np.ndarray] = None
+) -> Any:
+    """
+    Retrieves the knowledge-base context for the query.
+
+    Args:
+        query (str): The user's input question or message.
+        dependencies (dict): Same keys as for `_prepare_answer`.
+        query_vector (Optional[np.ndarray]): Query embedding, if already computed.
+
+    Chunks scoring below the RETRIEVAL_MIN_SCORE setting or outside the request's
+    metadata filters are left out, and the reranker (when enabled) picks the final
+    chunks from a wider candidate set. The scores themselves are not passed on to
+    the prompt.
+
+    Returns:
+        Any: The retrieved chunks, or "Empty" when nothing matched.
+    """
+    chunks = search(
+        query=query,
+        conn=dependencies["conn"],
+        embedder=dependencies["embedd"],
+        top_k=5,
+        index_service=dependencies["index_service"],
+        query_vector=query_vector,
+        min_score=get_settings().RETRIEVAL_MIN_SCORE,
+        reranker=dependencies.get("reranker"),
+        filters=dependencies.get("filters"),
+    )
+    context = [
+        {key: value for key, value in chunk.items() if key not in _SCORE_KEYS}
+        for chunk in chunks
+    ] or "Empty"
+    log_debug(f"[LLM GENERATION] Context retrieved: {context}")
+    return context
+
+
+def _build_prompt(
+    user_id: str, query: str, dependencies: dict, context: Any, history: Optional[list] = None
+) -> str:
+    """
+    Builds the full LLM prompt from the retrieved context and the user's history.
+    The history is looked up when not passed in.
+    """
+    if history is None:
+        history = dependencies["chat_history"].get_chat_history(user_id)
+    return prompt_builder.build_prompt(
+        prompt_name="rami_issa",
+        history=history,
+        context=context,
+        user_message=query,
+    )
+
+
+def _coalescing_key(query: str, context: Any, history: list) -> str:
+    """
+    Single-flight key: the normalized query hash plus a hash of the retrieved context
+    and of the chat history that goes into the prompt. Requests only share a
+    generation when their prompts agree, so no user gets an answer built on
+    another user's conversation.
+    """
+    prompt_inputs = hashlib.sha256(
+        json.dumps([context, [_message_text(message) for message in history]],
+                   sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{hash_query(query)}:{prompt_inputs}"
+
+
+def _message_text(message: Any) -> str:
+    """Role and text of a chat history message, for hashing."""
+    return f"{type(message).__name__}:{getattr(message, 'content', message)}"
+
 
-def _generate_new_response(user_id: str, query: str, dependencies: dict) -> str:
+def _store_response(
+    user_id: str,
+    query: str,
+    raw_response: str,
+    dependencies: dict,
+    query_vector: Optional[np.ndarray] = None,
+) -> str:
     """
-    Generates a response from the LLM based on a user's query and conversation history.
+    Caches the raw LLM output and records the exchange in the user's chat history.
+
+    Returns:
+        str: The answer extracted from the raw output.
+    """
+    response = extract_llm_answer_from_full(raw_response)
+    if dependencies.get("filters") is None:
+        dependencies["response_cache"].put(user_id, query, raw_response)
+        semantic_cache = dependencies.get("semantic_cache")
+        if semantic_cache is not None and query_vector is not None:
+            semantic_cache.put(user_id, query_vector, raw_response)
+    chat_history = dependencies["chat_history"]
+    chat_history.add_user_message(user_id, query)
+    chat_history.add_ai_message(user_id, response)
+    return response
+
+
+def _cached_answer(
+    user_id: str, query: str, dependencies: dict
+) -> Tuple[Optional[str], Optional[np.ndarray]]:
+    """
+    Looks the query up in the exact-match cache, then in the semantic cache if enabled.
+
+    The semantic lookup needs the query embedding; it is returned alongside the
+    answer so retrieval and the later cache insert can reuse it. Both caches are
+    keyed on the query alone, so requests with metadata filters bypass them.
+
+    Returns:
+        Tuple[Optional[str], Optional[np.ndarray]]: The cached answer (None on a miss)
+            and the query embedding (None if it was not computed).
+    """
+    if dependencies.get("filters") is not None:
+        log_info(f"[CACHE BYPASS] Filtered request, skipping caches for query: {query}")
+        return None, None
+
+    cached_response = dependencies["response_cache"].get(user_id, query)
 
-    This function performs the following steps:
-      - Retrieves relevant context from the knowledge base using semantic search.
-      - Builds a prompt using the context, query, and chat history.
-      - Generates a response using the specified LLM.
-      - Stores the full response in the database.
-      - Updates the chat history for the user.
+    if cached_response:
+        response = extract_llm_answer_from_full(cached_response)
+        if response:
+            log_info(f"[CACHED HIT] Returning cached response for query: {query}")
+            return response, None
+
+    semantic_cache = dependencies.get("semantic_cache")
+    if semantic_cache is None:
+        log_info(f"[CACHED MISS] No cached response found for query: {query}")
+        return None, None
+
+    query_vector = np.asarray(embed_query(
+        query, dependencies["embedd"], convert_to_tensor=False, normalize_embeddings=False
+    ), dtype=np.float32)
+    cached_response = semantic_cache.get(user_id, query_vector)
+    if cached_response:
+        response = extract_llm_answer_from_full(cached_response)
+        if response:
+            log_info(f"[SEMANTIC CACHE HIT] Returning similar cached response for query: {query}")
+            return response, query_vector
+
+    log_info(f"[CACHED MISS] No cached response found for query: {query}")
+    return None, query_vector
+
+
+def _prepare_answer(
+    user_id: str, query: str, dependencies: dict
+) -> Tuple[Optional[str], Any, Optional[np.ndarray]]:
+    """
+    Looks the query up in the caches and, on a miss, retrieves its context.
+    Blocking; runs on the chat executor.
 
     Args:
         user_id (str): Unique identifier for the user.
@@ -166,60 +372,131 @@ def _generate_new_response(user_id: str, query: str, dependencies: dict) -> str:
             - "chat_history" (ChatHistoryManager): Manages chat memory.
             - "embedd" (EmbeddingModel): Embedding model for vector search.
             - "llm" (HuggingFaceLLMs): The LLM used to generate the response.
+            - "index_service" (FaissIndexService): Persistent vector index.
+            - "response_cache" (ResponseCache): Cache of generated responses.
+            - "semantic_cache" (Optional[SemanticCache]): Similar-query cache, if enabled.
+            - "reranker" (Optional[CrossEncoderReranker]): Cross-encoder reranker, if enabled.
+            - "filters" (Optional[ChunkFilter]): Metadata filters of the request, if any.
 
     Returns:
-        str: The final extracted response generated by the LLM.
+        Tuple[Optional[str], Any, Optional[np.ndarray]]: The cached answer (None on a
+            miss), the retrieved context (None on a hit) and the query embedding if it
+            was computed.
     """
-    conn = dependencies["conn"]
-    chat_history = dependencies["chat_history"]
-    embedd = dependencies["embedd"]
-    llm = dependencies["llm"]
+    cached, query_vector = _cached_answer(user_id, query, dependencies)
+    if cached is not None:
+        return cached, None, query_vector
+    return None, _retrieve_context(query, dependencies, query_vector), query_vector
 
-    context = search(query=query, conn=conn, embedder=embedd, top_k=5) or "Empty"
-    log_debug(f"[LLM GENERATION] Context retrieved: {context}")
 
-    formatted_prompt = prompt_builder.build_prompt(
-        prompt_name="rami_issa",
-        history=chat_history.get_chat_history(user_id),
-        context=context,
-        user_message=query,
-    )
+def _generate_raw(
+    user_id: str, query: str, context: Any, dependencies: dict, history: Optional[list] = None
+) -> str:
+    """
+    Builds the prompt for the retrieved context and generates the raw LLM output.
+    Blocking; runs on the chat executor.
 
-    raw_response = llm.generate_response(prompt=formatted_prompt)
-    response = extract_llm_answer_from_full(raw_response)
+    Returns:
+        str: The full, unextracted LLM output.
+    """
+    formatted_prompt = _build_prompt(user_id, query, dependencies, context, history)
+    return dependencies["llm"].generate_response(prompt=formatted_prompt)
 
-    insert_query_response(
-        conn=conn, query=query, response=raw_response, user_id=user_id
-    )
-    chat_history.add_user_message(user_id, query)
-    chat_history.add_ai_message(user_id, response)
 
-    return response
+def _stream_answer(
+    user_id: str,
+    query: str,
+    dependencies: dict,
+    emit: Callable[[str], None],
+    started_at: float,
+    cancelled: Optional[threading.Event] = None,
+) -> str:
+    """
+    Streaming counterpart of the `/chat` pipeline. Blocking; runs on the chat executor.
+
+    A cached answer is emitted in one piece. Otherwise every token produced by
+    `llm.stream_response` is passed to `emit` as it arrives, and the response is
+    cached and added to the chat history only after the stream has completed.
+    Once `cancelled` is set the LLM stream is closed, which stops generation,
+    and nothing is stored.
+
+    Args:
+        user_id (str): Unique identifier for the user.
+        query (str): The user's input question or message.
+        dependencies (dict): Same keys as for `_prepare_answer`.
+        emit (Callable[[str], None]): Called with each token, from the worker thread.
+        started_at (float): `time.perf_counter()` value when the request was received,
+            used for the time-to-first-token metric.
+        cancelled (Optional[threading.Event]): Set when the client has gone away.
+
+    Returns:
+        str: The final extracted response, or the partial text if cancelled.
+    """
+    cached, context, query_vector = _prepare_answer(user_id, query, dependencies)
+    if cached is not None:
+        emit(cached)
+        return cached
+
+    llm = dependencies["llm"]
+    formatted_prompt = _build_prompt(user_id, query, dependencies, context)
+
+    tokens = []
+    with contextlib.closing(llm.stream_response(formatted_prompt)) as stream:
+        for token in stream:
+            if cancelled is not None and cancelled.is_set():
+                log_info(f"[LLM STREAM] Client disconnected after {len(tokens)} token(s); "
+                         "generation stopped.")
+                return "".join(tokens)
+            if not tokens:
+                ttft = time.perf_counter() - started_at
+                CHAT_TIME_TO_FIRST_TOKEN_SECONDS.labels(backend=type(llm).__name__).observe(ttft)
+                log_debug(f"[LLM STREAM] First token after {ttft:.3f}s")
+            tokens.append(token)
+            emit(token)
+
+    return _store_response(user_id, query, "".join(tokens), dependencies, query_vector)
+
+
+def _sse_event(payload: dict, event: Optional[str] = None) -> str:
+    """Formats one Server-Sent Event carrying a JSON payload."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(payload, ensure_ascii=False)}\n\n"
 
 
 def get_all_dependencies(
     request: Request,
-) -> Tuple[Connection, ChatHistoryManager, EmbeddingModel, HuggingFaceLLM]:
+) -> Tuple[Connection, ChatHistoryManager, EmbeddingModel, HuggingFaceLLM, FaissIndexService,
+           BoundedExecutor, ResponseCache, Optional[SemanticCache],
+           Optional[CrossEncoderReranker]]:
     """
     Dependency injector for FastAPI routes to provide required LLM tools and services.
 
     This function fetches and returns the necessary components for LLM-based response
     generation, including the database connection, chat history manager, embedding model,
-    and language model.
+    language model, persistent vector index, bounded chat executor, response cache and
+    (when enabled) semantic cache and cross-encoder reranker.
 
     Args:
         request (Request): The current FastAPI request, used to extract context
                            for dependency resolution.
 
     Returns:
-        Tuple[Connection, ChatHistoryManager, EmbeddingModel, HuggingFaceLLMs]: 
-            A tuple containing the database connection, chat memory, embedder, and LLM.
+        Tuple[Connection, ChatHistoryManager, EmbeddingModel, HuggingFaceLLMs,
+              FaissIndexService, BoundedExecutor, ResponseCache, Optional[SemanticCache],
+           Optional[CrossEncoderReranker]]:
+            A tuple containing the database connection, chat memory, embedder, LLM,
+            vector index, chat executor, response cache and semantic cache.
     """
     return (
         get_db_conn(request),
         get_chat_history(request),
         get_embedd(request),
         get_llm(request),
+        get_index_service(request),
+        get_chat_executor(request),
+        get_response_cache(request),
+        get_semantic_cache(request),
+        get_reranker(request),
     )
 
 
@@ -228,14 +505,20 @@ async def generate_response(
     body: Generate,
     user_id: str,
     deps: Tuple[
-        Connection, ChatHistoryManager, EmbeddingModel, HuggingFaceLLM
+        Connection, ChatHistoryManager, EmbeddingModel, HuggingFaceLLM, FaissIndexService,
+        BoundedExecutor, ResponseCache, Optional[SemanticCache], Optional[CrossEncoderReranker]
     ] = Depends(get_all_dependencies),
 ):
     """
     Generate a response from the LLM based on the user query with context retrieval.
+
+    The blocking pipeline runs on the bounded chat executor so the event loop stays free.
+    Identical concurrent requests (same normalized query, retrieved context and chat
+    history) share a single LLM generation.
     """
     try:
-        conn, chat_history, embedd, llm = deps
+        (conn, chat_history, embedd, llm, index_service, chat_executor, response_cache,
+         semantic_cache, reranker) = deps
         query = body.query
 
         if not query:
@@ -243,30 +526,40 @@ async def generate_response(
                 status_code=HTTP_400_BAD_REQUEST, detail="Query cannot be empty."
             )
 
-        cached_response = pull_from_table(
-            conn=conn, table_name="query_responses", columns=[], cach=(user_id, query)
+        dependencies = {
+            "conn": conn,
+            "chat_history": chat_history,
+            "embedd": embedd,
+            "llm": llm,
+            "index_service": index_service,
+            "response_cache": response_cache,
+            "semantic_cache": semantic_cache,
+            "reranker": reranker,
+            "filters": ChunkFilter.of(**body.filters.model_dump()) if body.filters else None,
+        }
+        response, context, query_vector = await chat_executor.run(
+            _prepare_answer, user_id=user_id, query=query, dependencies=dependencies
         )
 
-        if cached_response:
-            response = extract_llm_answer_from_full(cached_response)
-            if response:
-                log_info(f"[CACHED HIT] Returning cached response for query: {query}")
-                return JSONResponse(
-                    content={"status": "success", "response": response},
-                    status_code=HTTP_200_OK,
-                )
-
-        log_info(f"[CACHED MISS] No cached response found for query: {query}")
-        response = _generate_new_response(
-            user_id=user_id,
-            query=query,
-            dependencies={
-                "conn": conn,
-                "chat_history": chat_history,
-                "embedd": embedd,
-                "llm": llm,
-            },
-        )
+        if response is None:
+            history = chat_history.get_chat_history(user_id)
+            raw_response, shared = await chat_single_flight.do(
+                _coalescing_key(query, context, history),
+                lambda: chat_executor.run(
+                    _generate_raw,
+                    user_id=user_id,
+                    query=query,
+                    context=context,
+                    dependencies=dependencies,
+                    history=history,
+                ),
+            )
+            if shared:
+                log_info(f"[SINGLE FLIGHT] Shared an in-flight generation for query: {query}")
+            # The answer already exists; storing it must not be refused by admission control.
+            response = await asyncio.to_thread(
+                _store_response, user_id, query, raw_response, dependencies, query_vector
+            )
 
         current, peak = tracemalloc.get_traced_memory()
         log_debug(
@@ -282,6 +575,13 @@ async def generate_response(
         log_error(f"[LLM GENERATION HTTP ERROR] {http_exc.detail}")
         raise http_exc
 
+    except ExecutorSaturatedError as busy_err:
+        log_error(f"[LLM GENERATION BUSY] {busy_err}")
+        return JSONResponse(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "error", "message": str(busy_err)},
+        )
+
     except MemoryError as mem_err:
         log_error(f"[LLM GENERATION MEMORY ERROR] {mem_err}")
         return JSONResponse(
@@ -298,3 +598,85 @@ async def generate_response(
                 "message": "An unexpected error occurred while generating the response.",
             },
         )
+
+
+@generate_routes.post("/chat/stream")
+async def stream_response(
+    body: Generate,
+    user_id: str,
+    deps: Tuple[
+        Connection, ChatHistoryManager, EmbeddingModel, HuggingFaceLLM, FaissIndexService,
+        BoundedExecutor, ResponseCache, Optional[SemanticCache], Optional[CrossEncoderReranker]
+    ] = Depends(get_all_dependencies),
+):
+    """
+    Stream the LLM response to the user query as Server-Sent Events.
+
+    Each token is sent as a `data: {"token": ...}` event; the stream ends with an
+    `event: done` carrying the extracted response, or an `event: error` if
+    generation fails. A full chat queue is rejected with 503 before streaming starts.
+    """
+    started_at = time.perf_counter()
+    (conn, chat_history, embedd, llm, index_service, chat_executor, response_cache,
+     semantic_cache, reranker) = deps
+    query = body.query
+
+    if not query:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST, detail="Query cannot be empty."
+        )
+
+    loop = asyncio.get_running_loop()
+    tokens: asyncio.Queue = asyncio.Queue()
+    cancelled = threading.Event()
+    try:
+        job = chat_executor.submit(
+            _stream_answer,
+            user_id=user_id,
+            query=query,
+            dependencies={
+                "conn": conn,
+                "chat_history": chat_history,
+                "embedd": embedd,
+                "llm": llm,
+                "index_service": index_service,
+                "response_cache": response_cache,
+                "semantic_cache": semantic_cache,
+                "reranker": reranker,
+                "filters": ChunkFilter.of(**body.filters.model_dump()) if body.filters else None,
+            },
+            emit=lambda token: loop.call_soon_threadsafe(tokens.put_nowait, token),
+            started_at=started_at,
+            cancelled=cancelled,
+        )
+    except ExecutorSaturatedError as busy_err:
+        log_error(f"[LLM STREAM BUSY] {busy_err}")
+        return JSONResponse(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "error", "message": str(busy_err)},
+        )
+    job.add_done_callback(lambda _: tokens.put_nowait(_END_OF_STREAM))
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            while (token := await tokens.get()) is not _END_OF_STREAM:
+                yield _sse_event({"token": token})
+
+            try:
+                yield _sse_event({"response": job.result()}, event="done")
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                log_error(f"[LLM STREAM UNKNOWN ERROR] {exc} {traceback.format_exc()}")
+                yield _sse_event(
+                    {"message": "An unexpected error occurred while generating the response."},
+                    event="error",
+                )
+        finally:
+            # Cancelled or closed on client disconnect: stop generating into an unread
+            # queue so the job frees its executor slot.
+            cancelled.set()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
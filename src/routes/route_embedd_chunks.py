@@ -2,13 +2,33 @@
 Chunks to Embedding Conversion API Endpoint
 
 This module provides FastAPI routes for converting text chunks to embeddings
-and storing them in the database.
+and storing them in the database. Chunks are streamed from the table and encoded
+in batches, so memory stays bounded whatever the corpus size; each batch is
+written with a single transaction and newly stored vectors are appended to the
+persistent FAISS index held in the application state.
+
+Vectors are also kept in the content-addressed 'embedding_cache' table, keyed by
+the model name and the SHA-256 of the chunk text. Re-ingesting documents only
+runs the encoder on chunks whose text is new or changed; the others reuse their
+cached vectors.
+
+Only chunks without an embedding are streamed, so ingesting a new document
+costs work proportional to that document, not to the corpus. Editing a chunk's
+text drops its embedding (see the ``chunks_text_changed`` trigger), so edited
+chunks are picked up again; their old vectors are still in the FAISS index,
+which is then rebuilt instead of appended to. The same happens when chunks were
+deleted (e.g. by a ``/to_chunks`` reset): their embeddings are removed and the
+index is rebuilt, so stale copies cannot shadow the re-ingested chunks.
 """
 
 import logging
 import os
 import sys
-from fastapi import APIRouter, HTTPException, Request
+import time
+from typing import Optional
+
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 from starlette.status import (
     HTTP_200_OK,
@@ -26,9 +46,19 @@ try:
     if MAIN_DIR not in sys.path:
         sys.path.append(MAIN_DIR)
 
-    from dbs import pull_from_table, insert_embedding
+    from dbs import (
+        delete_embeddings,
+        delete_orphan_embeddings,
+        hash_chunk_text,
+        insert_embeddings,
+        lookup_cached_embeddings,
+        store_cached_embeddings,
+        stream_query,
+    )
     from logs import log_error, log_info
     from embedding import EmbeddingModel
+    from helpers import get_settings
+    from enums import FaissMetric
 
 except ImportError as ie:
     logging.error("Import Error setup error: %s", ie, exc_info=True)
@@ -38,21 +68,49 @@ except Exception as e:
 
 chunks_to_embedding_routes = APIRouter()
 
+_PENDING_CHUNKS_SQL = """
+    SELECT c.id, c.page_contest FROM chunks c
+    LEFT JOIN embeddings e ON e.chunk_id = c.id
+    WHERE e.chunk_id IS NULL
+    ORDER BY c.id
+"""
+_COUNT_PENDING_SQL = """
+    SELECT COUNT(*) FROM chunks c
+    LEFT JOIN embeddings e ON e.chunk_id = c.id
+    WHERE e.chunk_id IS NULL
+"""
+
+
+def _contains_any(sorted_ids: np.ndarray, chunk_ids: list) -> bool:
+    """True if any of ``chunk_ids`` occurs in the sorted id array."""
+    if sorted_ids.size == 0:
+        return False
+    wanted = np.asarray(chunk_ids, dtype=np.int64)
+    positions = np.minimum(np.searchsorted(sorted_ids, wanted), sorted_ids.size - 1)
+    return bool(np.any(sorted_ids[positions] == wanted))
+
 
 @chunks_to_embedding_routes.post("/chunks_to_embedding", response_class=JSONResponse)
-async def chunks_to_embedding(request: Request):
+def chunks_to_embedding(request: Request, batch_size: Optional[int] = Query(None, gt=0)):
     """
     Convert text chunks to embeddings and store them in the database.
 
+    Declared as a plain function so FastAPI runs it on its threadpool: encoding
+    and SQLite writes take the whole ingestion and must not block the event loop.
+
     Args:
         request (Request): FastAPI request object with app state.
+        batch_size (Optional[int]): Chunks encoded and stored per batch; must be
+            positive. Defaults to the EMBEDDING_BATCH_SIZE setting.
 
     Returns:
-        JSONResponse: Success or error status message.
+        JSONResponse: Success status with ingestion throughput and the number of
+            chunks encoded versus reused from the embedding cache, or an error message.
     """
     try:
         conn = getattr(request.app.state, "conn", None)
         embedding_model: EmbeddingModel = getattr(request.app.state, "embedding_model", None)
+        index_service = getattr(request.app.state, "index_service", None)
 
         if conn is None or embedding_model is None:
             raise HTTPException(
@@ -60,20 +118,91 @@ async def chunks_to_embedding(request: Request):
                 detail="Database connection or embedding model not initialized.",
             )
 
-        chunks = pull_from_table(conn=conn, table_name="chunks", columns=["page_contest", "id"])
-        if not chunks:
+        if conn.execute("SELECT 1 FROM chunks LIMIT 1").fetchone() is None:
             raise HTTPException(
                 status_code=HTTP_404_NOT_FOUND,
                 detail="No chunks found in the database.",
             )
-
-        log_info(f"Pulled {len(chunks)} chunk(s) from the database.")
-
-        for chunk in chunks:
-            embedding = embedding_model.embed(text=chunk["text"])
-            insert_embedding(conn=conn, embedding=embedding.tolist(), chunk_id=chunk["id"])
-
-        return JSONResponse(content={"status": "success"}, status_code=HTTP_200_OK)
+        # Vectors of deleted chunks must not stay in the table or in the index,
+        # where they would shadow re-ingested copies of the same text.
+        orphaned = delete_orphan_embeddings(conn)
+        total = conn.execute(_COUNT_PENDING_SQL).fetchone()[0]
+        log_info(f"Streaming {total} chunk(s) without an embedding from the database.")
+
+        app_settings = get_settings()
+        if batch_size is None:
+            batch_size = app_settings.EMBEDDING_BATCH_SIZE
+        # Cosine retrieval searches unit vectors; normalize once here rather than per query.
+        normalize = app_settings.FAISS_METRIC == FaissMetric.COSINE.value
+
+        model_name = embedding_model.model_name
+        embedded = encoded = reused = 0
+        rebuild_index = False
+        indexed_ids = None
+        if index_service is not None:
+            indexed_ids = np.sort(index_service.ids)
+            # The index still holds vectors the table no longer has (removed above
+            # or by the ``chunks_deleted`` trigger).
+            stored = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            rebuild_index = orphaned > 0 or indexed_ids.size != stored
+        start_time = time.perf_counter()
+        for rows in stream_query(conn, _PENDING_CHUNKS_SQL, batch_size=batch_size):
+            chunk_ids = [row[0] for row in rows]
+            chunk_texts = [row[1] for row in rows]
+            hashes = [hash_chunk_text(text) for text in chunk_texts]
+            cached = lookup_cached_embeddings(conn, model_name, normalize, hashes)
+            missing = list(dict.fromkeys(h for h in hashes if h not in cached))
+            if missing:
+                texts = dict(zip(hashes, chunk_texts))
+                fresh = embedding_model.embed_batch(
+                    [texts[h] for h in missing],
+                    batch_size=batch_size,
+                    normalize_embeddings=normalize,
+                )
+                store_cached_embeddings(conn, model_name, normalize, missing, fresh)
+                cached.update(zip(missing, fresh))
+            vectors = np.stack([cached[h] for h in hashes]).astype(np.float32, copy=False)
+            encoded += len(missing)
+            reused += len(chunk_ids) - len(missing)
+
+            # Rows written by a concurrent run are replaced; the delete is committed
+            # together with the insert below.
+            replaced = delete_embeddings(conn, chunk_ids)
+            if insert_embeddings(conn=conn, chunk_ids=chunk_ids, embeddings=vectors) == 0:
+                raise ValueError(
+                    f"Failed to store embedding batch starting at chunk {chunk_ids[0]}.")
+            if indexed_ids is not None:
+                rebuild_index = (rebuild_index or replaced > 0
+                                 or _contains_any(indexed_ids, chunk_ids))
+                if not rebuild_index:
+                    index_service.add(chunk_ids, vectors, persist=False)
+
+            embedded += len(chunk_ids)
+            elapsed = time.perf_counter() - start_time
+            log_info(f"Embedded {embedded}/{total} chunk(s) "
+                     f"({embedded / elapsed:.1f} chunks/sec, {reused} reused from cache).")
+
+        if index_service is not None and (embedded or rebuild_index):
+            # Edited or deleted chunks still have their old vectors in the index,
+            # so rebuild it.
+            if rebuild_index or index_service.needs_retraining:
+                index_service.build(conn)
+            else:
+                index_service.save()
+
+        elapsed = time.perf_counter() - start_time
+        return JSONResponse(
+            content={
+                "status": "success",
+                "embedded_chunks": embedded,
+                "encoded_chunks": encoded,
+                "reused_embeddings": reused,
+                "batch_size": batch_size,
+                "elapsed_seconds": round(elapsed, 3),
+                "chunks_per_second": round(embedded / elapsed, 2) if elapsed else None,
+            },
+            status_code=HTTP_200_OK,
+        )
 
     except HTTPException as http_exc:
         log_error(f"HTTPException in chunks_to_embedding: {http_exc.detail}")
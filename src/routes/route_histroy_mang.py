@@ -3,6 +3,8 @@ Chat History Management API Endpoint.
 
 This module provides a FastAPI route for managing user chat history and
 clearing database tables such as chunks, embeddings, and query responses.
+The embedding cache is cleared together with the embeddings table, so it
+never outgrows the corpus that was last embedded.
 It supports both full and selective reset options via HTTP POST requests.
 """
 
@@ -12,7 +14,7 @@ import sys
 import sqlite3
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
 from starlette.status import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
 
@@ -29,7 +31,8 @@ try:
     from src.schemes import ChatManager
     from src.historys import ChatHistoryManager
     from src.controllers import clear_table
-    from src.dependencies import get_chat_history, get_db_conn
+    from src.dbs import AsyncDatabase
+    from src.dependencies import get_async_db, get_chat_history
 
 except ImportError as ie:
     logging.error("Import setup error: %s", ie, exc_info=True)
@@ -40,15 +43,44 @@ except Exception as e:
 chat_manage_routes = APIRouter()
 
 
+def _reset_index(request: Request) -> None:
+    """Drop the persistent FAISS index once the embeddings it mirrors are gone."""
+    index_service = getattr(request.app.state, "index_service", None)
+    if index_service is not None:
+        index_service.reset()
+
+
+def _reset_semantic_cache(request: Request) -> None:
+    """Drop semantically cached answers once the corpus they were built from is gone."""
+    semantic_cache = getattr(request.app.state, "semantic_cache", None)
+    if semantic_cache is not None:
+        semantic_cache.clear()
+
+
+def _discard_pending_responses(request: Request) -> None:
+    """Drop answers still waiting to be written so they cannot outlive a table reset."""
+    response_writer = getattr(request.app.state, "response_writer", None)
+    if response_writer is not None:
+        response_writer.discard()
+
+
+def _reset_response_cache(request: Request) -> None:
+    """Drop the in-memory response cache once the query_responses table is cleared."""
+    response_cache = getattr(request.app.state, "response_cache", None)
+    if response_cache is not None:
+        response_cache.clear()
+
+
 @chat_manage_routes.post("/chat/manage")
 # pylint: disable=too-many-arguments
 async def manage_chat_history(
     body: ChatManager,
+    request: Request,
     reset_all: bool = False,
     remove_chunks: bool = False,
     remove_embeddings: bool = False,
     remove_query_response: bool = False,
-    conn: sqlite3.Connection = Depends(get_db_conn),
+    async_db: AsyncDatabase = Depends(get_async_db),
     chat_manager: ChatHistoryManager = Depends(get_chat_history),
     user_id: Optional[str] = None
 ) -> JSONResponse:
@@ -60,11 +92,14 @@ async def manage_chat_history(
 
     Args:
         body (ChatManager): Request body with memory/chat reset flags.
+        request (Request): FastAPI request, used to reach the vector index and
+            response cache services.
         reset_all (bool): If True, resets everything (memory, chat, and DB tables).
         remove_chunks (bool): If True, clears the 'chunks' table.
-        remove_embeddings (bool): If True, clears the 'embeddings' table.
+        remove_embeddings (bool): If True, clears the 'embeddings' table and the
+            'embedding_cache' table of content-addressed vectors.
         remove_query_response (bool): If True, clears the 'query_responses' table.
-        conn (sqlite3.Connection): Dependency-injected DB connection.
+        async_db (AsyncDatabase): Dependency-injected awaitable database access.
         chat_manager (ChatHistoryManager): Dependency-injected chat history manager.
         user_id (str): Optional user identifier.
 
@@ -88,10 +123,14 @@ async def manage_chat_history(
                 log_info("User chat history cleared.")
                 actions.extend(["memory_reset", "chat_clear"])
 
-            for table in ["chunks", "embeddings", "query_responses"]:
-                clear_table(conn, table)
+            _discard_pending_responses(request)
+            for table in ["chunks", "embeddings", "embedding_cache", "query_responses"]:
+                await async_db.run(clear_table, table)
                 log_info(f"{table.capitalize()} table cleared.")
                 actions.append(f"{table}_clear")
+            _reset_index(request)
+            _reset_response_cache(request)
+            _reset_semantic_cache(request)
 
             message = "Full reset completed successfully."
 
@@ -108,18 +147,24 @@ async def manage_chat_history(
                 actions.append("chat_clear")
 
             if remove_chunks:
-                clear_table(conn, "chunks")
+                await async_db.run(clear_table, "chunks")
                 log_info("Chunks table cleared.")
+                _reset_semantic_cache(request)
                 actions.append("chunks_clear")
 
             if remove_embeddings:
-                clear_table(conn, "embeddings")
-                log_info("Embeddings table cleared.")
+                await async_db.run(clear_table, "embeddings")
+                await async_db.run(clear_table, "embedding_cache")
+                log_info("Embeddings and embedding cache tables cleared.")
+                _reset_index(request)
                 actions.append("embeddings_clear")
 
             if remove_query_response:
-                clear_table(conn, "query_responses")
+                _discard_pending_responses(request)
+                await async_db.run(clear_table, "query_responses")
                 log_info("Query responses table cleared.")
+                _reset_response_cache(request)
+                _reset_semantic_cache(request)
                 actions.append("query_responses_clear")
 
             if actions:
@@ -3,14 +3,19 @@ Live RAG (Retrieval-Augmented Generation) API Endpoint
 
 This module provides FastAPI routes for performing real-time RAG queries,
 including query processing, embedding generation, and database retrieval.
+`/live_rag/batch` retrieves for many queries at once and streams the results
+back as NDJSON, one JSON object per query.
 """
 
+import json
 import logging
 import os
 import sys
 import sqlite3 as sql3
+from typing import Iterator, Optional
+
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.status import (
     HTTP_200_OK,
     HTTP_400_BAD_REQUEST,
@@ -30,10 +35,23 @@ try:
         sys.path.append(MAIN_DIR)
 
     from src.logs import log_error, log_info
+    from src.helpers import get_settings
     from src.embedding import EmbeddingModel
-    from src.rag import search
-    from src.schemes import LiveRAG
-    from src.dependencies import get_db_conn, get_embedd
+    from src.rag import (
+        ChunkFilter,
+        CrossEncoderReranker,
+        FaissIndexService,
+        search,
+        search_batch,
+    )
+    from src.schemes import LiveRAG, LiveRAGBatch
+    from src.dependencies import (
+        get_db_conn,
+        get_embedd,
+        get_index_service,
+        get_optional_embedd,
+        get_reranker,
+    )
 
 except ImportError as ie:
     logging.error("Import Error setup error: %s", ie, exc_info=True)
@@ -45,17 +63,25 @@ live_rag_route = APIRouter()
 
 
 @live_rag_route.post("/live_rag")
-async def live_rag(
+def live_rag(
     request: LiveRAG,
-    embedd: EmbeddingModel = Depends(get_embedd),
-    conn: sql3.Connection = Depends(get_db_conn)
+    embedd: Optional[EmbeddingModel] = Depends(get_optional_embedd),
+    conn: sql3.Connection = Depends(get_db_conn),
+    index_service: FaissIndexService = Depends(get_index_service),
+    reranker: Optional[CrossEncoderReranker] = Depends(get_reranker),
 ):
     """Handle live RAG query.
+
+    Declared as a plain function so FastAPI runs it on its threadpool: query
+    embedding, the cross-encoder rerank and MMR must not block the event loop.
     
     Args:
         request: LiveRAG request parameters
-        embedd: Embedding model instance
+        embedd: Embedding model instance; while it is not loaded the query is
+            answered by lexical search alone
         conn: Database connection
+        index_service: Persistent FAISS index
+        reranker: Cross-encoder reranker, when enabled
         
     Returns:
         JSONResponse: Query results or error message
@@ -87,7 +113,15 @@ async def live_rag(
             query=query,
             embedder=embedd,
             conn=conn,
-            top_k=top_k
+            top_k=top_k,
+            index_service=index_service,
+            nprobe=request.nprobe,
+            ef_search=request.ef_search,
+            min_score=request.min_score,
+            mode=request.mode,
+            reranker=reranker,
+            mmr_lambda=request.mmr_lambda,
+            filters=ChunkFilter.of(**request.filters.model_dump()) if request.filters else None,
         )
         log_info(f"RAG query results: {retriever_result}")
 
@@ -103,7 +137,8 @@ async def live_rag(
             content={
                 "Retriever Results": [
                     one_ret["page_content"] for one_ret in retriever_result
-                ]
+                ],
+                "Scores": [one_ret["score"] for one_ret in retriever_result],
             }
         )
 
@@ -119,3 +154,78 @@ async def live_rag(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while processing the query."
         ) from e
+
+
+@live_rag_route.post("/live_rag/batch")
+async def live_rag_batch(
+    request: LiveRAGBatch,
+    embedd: EmbeddingModel = Depends(get_embedd),
+    conn: sql3.Connection = Depends(get_db_conn),
+    index_service: FaissIndexService = Depends(get_index_service),
+):
+    """Handle a batch of live RAG queries.
+
+    Queries are embedded with batched encode calls and searched with one FAISS
+    search per round of LIVE_RAG_BATCH_CHUNK queries. Each query produces one
+    NDJSON line with its position, the query, its results and their scores, as
+    soon as its round finishes. A failure after streaming has started ends the
+    stream with a line carrying an "error" message.
+
+    Args:
+        request: LiveRAGBatch request parameters
+        embedd: Embedding model instance
+        conn: Database connection
+        index_service: Persistent FAISS index
+
+    Returns:
+        StreamingResponse: application/x-ndjson stream of per-query results
+
+    Raises:
+        HTTPException:
+            400 for empty queries or too many queries
+    """
+    queries = request.queries
+    max_queries = get_settings().LIVE_RAG_BATCH_MAX_QUERIES
+    if len(queries) > max_queries:
+        log_error(f"Batch of {len(queries)} queries exceeds the limit of {max_queries}.")
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=f"At most {max_queries} queries can be sent in one batch."
+        )
+    if any(not query.strip() for query in queries):
+        log_error("Batch contains an empty query.")
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="Queries cannot be empty."
+        )
+
+    def ndjson_lines() -> Iterator[str]:
+        results = search_batch(
+            queries,
+            embedder=embedd,
+            conn=conn,
+            index_service=index_service,
+            top_k=request.top_k,
+            nprobe=request.nprobe,
+            ef_search=request.ef_search,
+            min_score=request.min_score,
+            filters=ChunkFilter.of(**request.filters.model_dump()) if request.filters else None,
+        )
+        sent = 0
+        try:
+            for chunks in results:
+                yield json.dumps({
+                    "index": sent,
+                    "query": queries[sent],
+                    "Retriever Results": [chunk["page_content"] for chunk in chunks],
+                    "Scores": [chunk["score"] for chunk in chunks],
+                }, ensure_ascii=False) + "\n"
+                sent += 1
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            log_error(f"Batch retrieval failed after {sent} queries: {e}")
+            yield json.dumps({
+                "error": "An unexpected error occurred while processing the batch."
+            }) + "\n"
+
+    log_info(f"Starting batch retrieval for {len(queries)} queries.")
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
@@ -6,12 +6,13 @@ Provides endpoints for monitoring system resources including:
 - Memory utilization
 - Disk space
 - GPU metrics (when available)
+- Chat executor queue depth
 """
 
 import logging
 import os
 import sys
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 from starlette.status import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
 
@@ -27,6 +28,7 @@ try:
         sys.path.append(MAIN_DIR)
 
     from src.logs import log_error, SystemMonitor
+    from src.rag.embedding_query import get_query_embedding_cache
 
 except ImportError as ie:
     logging.error("Import Error setup error: %s", ie, exc_info=True)
@@ -145,3 +147,60 @@ def get_gpu_usage():
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             content={"error": "GPU monitoring service unavailable"}
         )
+
+@monitor_router.get("/health/chat_queue", summary="Get chat executor queue depth and load")
+def get_chat_queue(request: Request):
+    """Retrieve the bounded chat executor's queue depth and in-flight generations.
+
+    Returns:
+        dict: Queued and running generations with the configured limits
+
+    Raises:
+        JSONResponse: 500 error if the executor is not initialized
+    """
+    chat_executor = getattr(request.app.state, "chat_executor", None)
+    if chat_executor is None:
+        log_error("Chat executor monitoring error: executor not initialized")
+        return JSONResponse(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"error": "Chat executor unavailable"}
+        )
+    return chat_executor.stats
+
+@monitor_router.get("/health/db_pool", summary="Get SQLite connection pool usage")
+def get_db_pool(request: Request):
+    """Retrieve the number of open SQLite connections and the pool limits.
+
+    Returns:
+        dict: Open connections with the configured limits
+
+    Raises:
+        JSONResponse: 500 error if the pool is not initialized
+    """
+    db_pool = getattr(request.app.state, "db_pool", None)
+    if db_pool is None:
+        log_error("Database pool monitoring error: pool not initialized")
+        return JSONResponse(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"error": "Database pool unavailable"}
+        )
+    return db_pool.stats
+
+@monitor_router.get("/health/cache", summary="Get cache statistics")
+def get_cache_stats(request: Request):
+    """Retrieve response cache limits, write queue depth and semantic and query
+    embedding cache hit rates.
+
+    Returns:
+        dict: Stats for the response cache and its write-behind queue, the query
+            embedding cache and, when enabled, the semantic cache
+    """
+    response_cache = getattr(request.app.state, "response_cache", None)
+    response_writer = getattr(request.app.state, "response_writer", None)
+    semantic_cache = getattr(request.app.state, "semantic_cache", None)
+    return {
+        "response_cache": response_cache.stats if response_cache else None,
+        "response_writer": response_writer.stats if response_writer else None,
+        "semantic_cache": semantic_cache.stats if semantic_cache else None,
+        "query_embedding_cache": get_query_embedding_cache().stats,
+    }
@@ -3,13 +3,14 @@ Document Chunking API Endpoint.
 
 This module provides FastAPI routes for converting documents into text chunks
 and storing them in a SQLite database. It handles document processing,
-chunking, and database operations.
+chunking, and database operations. Document loading and all database work run
+off the event loop.
 """
 
+import asyncio
 import logging
 import os
 import sys
-import sqlite3
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 
@@ -26,8 +27,8 @@ try:
     from src.logs import log_error, log_info
     from src.controllers import load_and_chunk, clear_table
     from src.schemes import ChunkRequest
-    from src.dbs import insert_chunk
-    from src.dependencies import get_db_conn
+    from src.dbs import AsyncDatabase
+    from src.dependencies import get_async_db
 
 except ImportError as ie:
     logging.error("Import Error setup error: %s", ie, exc_info=True)
@@ -41,7 +42,7 @@ to_chunks_route = APIRouter()
 @to_chunks_route.post("/to_chunks")
 async def to_chunks(
     body: ChunkRequest,
-    conn: sqlite3.Connection = Depends(get_db_conn)
+    async_db: AsyncDatabase = Depends(get_async_db)
 ):
     """
     Converts documents into text chunks and stores them in the SQLite database.
@@ -63,11 +64,11 @@ async def to_chunks(
     try:
         # Reset DB if requested (expected as int: 0 or 1)
         if do_reset == 1:
-            clear_table(conn=conn, table_name="chunks")
+            await async_db.run(clear_table, table_name="chunks")
             log_info("Chunks table cleared.")
 
         # Process files to DataFrame
-        df = load_and_chunk(file_path=file_path)
+        df = await asyncio.to_thread(load_and_chunk, file_path=file_path)
 
         if df.empty:
             msg = "No valid documents found to process."
@@ -75,7 +76,7 @@ async def to_chunks(
             return JSONResponse(content={"status": "error", "message": msg}, status_code=404)
 
         # Insert into DB
-        insert_chunk(conn=conn, data=df)
+        await async_db.insert_chunk(df)
         log_info(f"Inserted {len(df)} chunks into the database.")
 
         return JSONResponse(
@@ -11,4 +11,5 @@ from .response import Generate
 from .chat_config import ChatManager
 from .llama_cpp import LlamaCPP
 from .web_crawler import CrawlRequest
-from .live_rag import LiveRAG
+from .retrieval_filters import RetrievalFilters
+from .live_rag import LiveRAG, LiveRAGBatch
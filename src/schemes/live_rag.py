@@ -5,7 +5,11 @@ This module defines Pydantic models for live RAG operations,
 including query handling and retrieval parameters.
 """
 
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from .retrieval_filters import RetrievalFilters
 
 class LiveRAG(BaseModel):
     """Configuration model for Live RAG operations.
@@ -13,6 +17,40 @@ class LiveRAG(BaseModel):
     Attributes:
         query: The input query/question for RAG system
         top_k: Number of top documents to retrieve (default: 1)
+        nprobe: Inverted lists scanned for this query (IVF index types only)
+        ef_search: HNSW candidate list size for this query (HNSW index only)
+        min_score: Drop results scoring below this similarity (default: keep all)
+        mode: Retrieval strategy: vector, lexical or hybrid (default: RETRIEVAL_MODE)
+        mmr_lambda: MMR relevance weight; set to diversify the results (default: MMR settings)
+        filters: Restrict results to given sources, authors or page range (default: none)
     """
     query: str
     top_k: int = 1
+    nprobe: Optional[int] = Field(default=None, gt=0)
+    ef_search: Optional[int] = Field(default=None, gt=0)
+    min_score: Optional[float] = None
+    mode: Optional[Literal["vector", "lexical", "hybrid"]] = None
+    mmr_lambda: Optional[float] = Field(default=None, ge=0, le=1)
+    filters: Optional[RetrievalFilters] = None
+
+
+class LiveRAGBatch(BaseModel):
+    """Configuration model for batched Live RAG retrieval.
+
+    All queries share the retrieval parameters; results are streamed back as
+    NDJSON, one line per query.
+
+    Attributes:
+        queries: The queries to retrieve context for, answered in order
+        top_k: Number of top documents to retrieve per query (default: 1)
+        nprobe: Inverted lists scanned per query (IVF index types only)
+        ef_search: HNSW candidate list size per query (HNSW index only)
+        min_score: Drop results scoring below this similarity (default: keep all)
+        filters: Restrict results to given sources, authors or page range (default: none)
+    """
+    queries: List[str] = Field(..., min_length=1)
+    top_k: int = Field(default=1, gt=0)
+    nprobe: Optional[int] = Field(default=None, gt=0)
+    ef_search: Optional[int] = Field(default=None, gt=0)
+    min_score: Optional[float] = None
+    filters: Optional[RetrievalFilters] = None
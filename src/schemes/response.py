@@ -5,12 +5,18 @@ This module defines Pydantic models for handling and validating
 query inputs for response generation.
 """
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
+from .retrieval_filters import RetrievalFilters
+
 class Generate(BaseModel):
     """Model for validating and processing generation queries.
 
     Attributes:
         query: The user input query with length constraints (1-2048 characters)
+        filters: Restrict the retrieved context to given sources, authors or page range
     """
     query: str = Field(..., min_length=1, max_length=2048, description="The user input query.")
+    filters: Optional[RetrievalFilters] = None
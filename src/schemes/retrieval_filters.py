@@ -0,0 +1,32 @@
+"""
+Retrieval filter schema module.
+
+This module defines the Pydantic model used to restrict retrieval to chunks
+from given sources, authors or page ranges.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+class RetrievalFilters(BaseModel):
+    """Metadata constraints applied during retrieval; all given constraints must hold.
+
+    Attributes:
+        sources: Only use chunks from these source documents (default: any)
+        authors: Only use chunks by these authors (default: any)
+        page_min: Lowest page number to use, inclusive (default: no lower bound)
+        page_max: Highest page number to use, inclusive (default: no upper bound)
+    """
+    sources: Optional[List[str]] = Field(default=None, min_length=1)
+    authors: Optional[List[str]] = Field(default=None, min_length=1)
+    page_min: Optional[int] = None
+    page_max: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_page_range(self) -> "RetrievalFilters":
+        """Reject an empty page range."""
+        if (self.page_min is not None and self.page_max is not None
+                and self.page_min > self.page_max):
+            raise ValueError("page_min must not be greater than page_max.")
+        return self
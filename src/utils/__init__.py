@@ -5,7 +5,11 @@ This package contains utility functions for the application including:
 - YAML configuration file handling
 - LLM response processing and extraction
 - Bootstrap Handling Dublicate code 
+- Bounded thread-pool execution of blocking work from async routes
+- Single-flight coalescing of identical concurrent requests
 """
 
 from .read_yaml import load_last_yaml
 from .extract_response import extract_llm_answer_from_full
+from .bounded_executor import BoundedExecutor, ExecutorSaturatedError
+from .single_flight import SingleFlight
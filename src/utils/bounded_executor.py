@@ -0,0 +1,147 @@
+"""
+Bounded thread-pool executor for running blocking work from async routes.
+
+Route handlers await ``BoundedExecutor.run`` instead of calling blocking
+functions (SQLite, embedding, LLM generation) directly, so the event loop
+keeps serving other requests. At most ``max_concurrency`` jobs run at once;
+further callers wait in a queue of at most ``max_queue`` entries and are
+rejected beyond that. Queue depth, in-flight jobs and queue wait time are
+exported as Prometheus metrics.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_info, log_warning
+    from src.logs.metrics import (
+        CHAT_IN_FLIGHT,
+        CHAT_QUEUE_DEPTH,
+        CHAT_QUEUE_WAIT_SECONDS,
+        CHAT_REJECTED_TOTAL,
+    )
+
+except ImportError as ie:
+    logging.error("Import error during setup: %s", ie, exc_info=True)
+except (ValueError, KeyError, RuntimeError) as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when the waiting queue of a BoundedExecutor is full."""
+
+
+class BoundedExecutor:
+    """
+    Runs blocking callables on a dedicated thread pool with a concurrency cap.
+
+    Attributes:
+        name (str): Label used for thread names and log messages.
+        max_concurrency (int): Maximum number of jobs running at once.
+        max_queue (int): Maximum number of jobs waiting for a slot.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, name: str = "chat"):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than zero.")
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix=f"{name}-worker"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queued = 0
+        self._in_flight = 0
+        log_info(f"[EXECUTOR] '{name}' started with {max_concurrency} worker(s), "
+                 f"queue limit {max_queue}.")
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Current queue depth, running jobs and configured limits."""
+        return {
+            "queued": self._queued,
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+        }
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` on the pool once a slot is free.
+
+        Raises:
+            ExecutorSaturatedError: If ``max_queue`` callers are already waiting.
+        """
+        enqueued_at = self._admit()
+        return await self._execute(enqueued_at, func, *args, **kwargs)
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> "asyncio.Task":
+        """
+        Admit ``func(*args, **kwargs)`` now and run it as a background task.
+
+        Unlike :meth:`run`, admission is decided before this returns, so callers
+        can reject a request before they start responding to it.
+
+        Raises:
+            ExecutorSaturatedError: If ``max_queue`` callers are already waiting.
+        """
+        enqueued_at = self._admit()
+        return asyncio.ensure_future(self._execute(enqueued_at, func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop accepting work and cancel jobs that have not started yet."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        log_info(f"[EXECUTOR] '{self.name}' shut down.")
+
+    def _admit(self) -> float:
+        """Reserve a queue slot or reject the job; returns the enqueue time."""
+        # Count admitted jobs rather than the semaphore: jobs admitted by
+        # ``submit`` may not have reached it yet.
+        if self._queued + self._in_flight >= self.max_concurrency + self.max_queue:
+            CHAT_REJECTED_TOTAL.inc()
+            log_warning(f"[EXECUTOR] '{self.name}' queue full ({self._queued} waiting).")
+            raise ExecutorSaturatedError(f"The {self.name} queue is full, try again shortly.")
+        self._set_queued(self._queued + 1)
+        return time.perf_counter()
+
+    async def _execute(
+        self, enqueued_at: float, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._set_queued(self._queued - 1)
+        CHAT_QUEUE_WAIT_SECONDS.observe(time.perf_counter() - enqueued_at)
+
+        self._set_in_flight(self._in_flight + 1)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            self._set_in_flight(self._in_flight - 1)
+            self._semaphore.release()
+
+    def _set_queued(self, value: int) -> None:
+        self._queued = value
+        CHAT_QUEUE_DEPTH.set(value)
+
+    def _set_in_flight(self, value: int) -> None:
+        self._in_flight = value
+        CHAT_IN_FLIGHT.set(value)
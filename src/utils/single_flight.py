@@ -0,0 +1,82 @@
+"""
+In-process request coalescing ("single flight") for async routes.
+
+When several coroutines ask for the same key at once, only the first one
+(the leader) runs the work; the others await the leader's result instead of
+repeating it. The work runs in its own task, so a leader whose client goes
+away does not cancel the result the followers are waiting for. Keys are
+forgotten as soon as the work finishes, so later callers start afresh.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+try:
+    MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
+    if not os.path.exists(MAIN_DIR):
+        raise FileNotFoundError(f"Project directory not found at: {MAIN_DIR}")
+
+    if MAIN_DIR not in sys.path:
+        sys.path.append(MAIN_DIR)
+
+    from src.logs import log_debug
+    from src.logs.metrics import SINGLE_FLIGHT_SHARED_TOTAL
+
+except ImportError as ie:
+    logging.error("Import error during setup: %s", ie, exc_info=True)
+except (ValueError, KeyError, RuntimeError) as e:
+    logging.critical("Unexpected setup error: %s", e, exc_info=True)
+    raise
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key onto one in-flight task.
+
+    Attributes:
+        name (str): Label used for metrics and log messages.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being computed."""
+        return len(self._in_flight)
+
+    async def do(
+        self, key: Hashable, work: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run ``work()`` for ``key`` unless a call for the same key is already running.
+
+        Args:
+            key (Hashable): Identity of the work; equal keys are coalesced.
+            work (Callable[[], Awaitable[Any]]): Starts the work; only called by the leader.
+
+        Returns:
+            Tuple[Any, bool]: The result, and whether it was shared from another caller.
+
+        Raises:
+            Exception: Whatever ``work`` raised, for the leader and every follower.
+        """
+        task = self._in_flight.get(key)
+        shared = task is not None
+        if shared:
+            SINGLE_FLIGHT_SHARED_TOTAL.labels(flight=self.name).inc()
+            log_debug(f"[SINGLE FLIGHT] '{self.name}' joined in-flight work for key {key}.")
+        else:
+            task = asyncio.ensure_future(work())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
@@ -0,0 +1,55 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from src.controllers import clear_table
+from src.dbs import AsyncDatabase, SQLitePool, create_query_responses_table
+
+
+class TestAsyncDatabase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.pool = SQLitePool(database=os.path.join(self.tmp_dir.name, "app.db"),
+                               max_connections=4, busy_timeout_ms=200)
+        create_query_responses_table(self.pool.proxy)
+        self.db = AsyncDatabase(self.pool.proxy, max_workers=2)
+
+    def tearDown(self):
+        self.db.shutdown()
+        self.pool.close_all()
+        self.tmp_dir.cleanup()
+
+    def test_calls_run_off_the_event_loop_thread(self):
+        async def scenario():
+            return await self.db.run(lambda conn: threading.current_thread().name)
+
+        self.assertTrue(asyncio.run(scenario()).startswith("db-worker"))
+
+    def test_insert_lookup_and_clear(self):
+        async def scenario():
+            await self.db.insert_query_response("What is RAG?", "Retrieval.", "u1")
+            found = await self.db.lookup_query_response("u1", "  what is rag? ")
+            await self.db.run(clear_table, "query_responses")
+            cleared = await self.db.lookup_query_response("u1", "What is RAG?")
+            return found, cleared
+
+        found, cleared = asyncio.run(scenario())
+        self.assertEqual(found[0], "Retrieval.")
+        self.assertIsNone(cleared)
+
+    def test_exceptions_propagate_to_the_caller(self):
+        async def scenario():
+            await self.db.run(clear_table, "not a table")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(scenario())
+
+    def test_rejects_non_positive_worker_count(self):
+        with self.assertRaises(ValueError):
+            AsyncDatabase(self.pool.proxy, max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
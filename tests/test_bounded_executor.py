@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.utils import BoundedExecutor, ExecutorSaturatedError
+
+
+class TestBoundedExecutor(unittest.TestCase):
+
+    def test_runs_blocking_function_off_the_event_loop(self):
+        executor = BoundedExecutor(max_concurrency=1, max_queue=4, name="test")
+        loop_thread = threading.get_ident()
+
+        async def scenario():
+            return await executor.run(threading.get_ident)
+
+        worker_thread = asyncio.run(scenario())
+        executor.shutdown()
+        self.assertNotEqual(worker_thread, loop_thread)
+
+    def test_limits_concurrency_and_keeps_loop_responsive(self):
+        executor = BoundedExecutor(max_concurrency=2, max_queue=8, name="test")
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def job():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        async def scenario():
+            jobs = asyncio.gather(*(executor.run(job) for _ in range(6)))
+            await asyncio.sleep(0.01)
+            # The loop is still free while generations are in flight.
+            stats = executor.stats
+            await jobs
+            return stats
+
+        stats = asyncio.run(scenario())
+        executor.shutdown()
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(stats["in_flight"], 2)
+        self.assertEqual(stats["queued"], 4)
+        self.assertEqual(executor.stats["queued"], 0)
+
+    def test_rejects_when_queue_is_full(self):
+        executor = BoundedExecutor(max_concurrency=1, max_queue=1, name="test")
+
+        async def scenario():
+            first = asyncio.ensure_future(executor.run(time.sleep, 0.05))
+            second = asyncio.ensure_future(executor.run(time.sleep, 0.05))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(ExecutorSaturatedError):
+                await executor.run(time.sleep, 0)
+            await asyncio.gather(first, second)
+
+        asyncio.run(scenario())
+        executor.shutdown()
+
+    def test_submit_decides_admission_before_returning(self):
+        executor = BoundedExecutor(max_concurrency=1, max_queue=1, name="test")
+
+        async def scenario():
+            first = executor.submit(time.sleep, 0.05)
+            second = executor.submit(time.sleep, 0.05)
+            # No await in between: the reserved queue slot already counts.
+            with self.assertRaises(ExecutorSaturatedError):
+                executor.submit(time.sleep, 0)
+            await asyncio.gather(first, second)
+
+        asyncio.run(scenario())
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
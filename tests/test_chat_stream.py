@@ -0,0 +1,135 @@
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.llm.base_llm import BaseLLM
+from src.routes import route_chat
+from src.utils import BoundedExecutor, ExecutorSaturatedError
+
+
+class _FakeLLM(BaseLLM):
+
+    def initialize_llm(self, *args, **kwargs):
+        pass
+
+    def generate_response(self, prompt):
+        return "Answer: full"
+
+    def stream_response(self, prompt):
+        yield from ["Hello", ", ", "world"]
+
+
+def _parse_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = "message", None
+        for line in block.splitlines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        events.append((event, data))
+    return events
+
+
+class TestChatStream(unittest.TestCase):
+
+    def setUp(self):
+        self.chat_history = MagicMock()
+        self.chat_history.get_chat_history.return_value = []
+        self.executor = BoundedExecutor(max_concurrency=1, max_queue=2, name="test")
+        self.response_cache = MagicMock()
+        self.response_cache.get.return_value = None
+
+        app = FastAPI()
+        app.include_router(route_chat.generate_routes)
+        app.dependency_overrides[route_chat.get_all_dependencies] = lambda: (
+            MagicMock(), self.chat_history, MagicMock(), _FakeLLM(), MagicMock(), self.executor,
+            self.response_cache, None, None,
+        )
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_default_stream_yields_full_response(self):
+        class _Plain(_FakeLLM):
+            stream_response = BaseLLM.stream_response
+
+        self.assertEqual(list(_Plain().stream_response("hi")), ["Answer: full"])
+
+    @patch.object(route_chat, "search",
+                  return_value=[{"id": 1, "page_content": "ctx", "score": 0.9}])
+    def test_streams_tokens_then_stores_response(self, _search):
+        resp = self.client.post("/chat/stream", params={"user_id": "u1"}, json={"query": "hi"})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/event-stream"))
+        events = _parse_events(resp.text)
+        self.assertEqual(
+            [data["token"] for event, data in events if event == "message"],
+            ["Hello", ", ", "world"],
+        )
+        self.assertEqual(events[-1], ("done", {"response": "Hello, world"}))
+        self.response_cache.put.assert_called_once_with("u1", "hi", "Hello, world")
+        self.chat_history.add_ai_message.assert_called_once_with("u1", "Hello, world")
+
+    @patch.object(route_chat, "search")
+    def test_cache_hit_is_sent_without_generation(self, search):
+        self.response_cache.get.return_value = "Prompt Answer: cached"
+        resp = self.client.post("/chat/stream", params={"user_id": "u1"}, json={"query": "hi"})
+
+        events = _parse_events(resp.text)
+        self.assertEqual(events, [("message", {"token": "cached"}),
+                                  ("done", {"response": "cached"})])
+        search.assert_not_called()
+
+    @patch.object(route_chat, "search", side_effect=RuntimeError("boom"))
+    def test_failure_is_reported_as_error_event(self, _search):
+        resp = self.client.post("/chat/stream", params={"user_id": "u1"}, json={"query": "hi"})
+
+        events = _parse_events(resp.text)
+        self.assertEqual(events[-1][0], "error")
+        self.chat_history.add_ai_message.assert_not_called()
+
+    def test_full_queue_is_rejected_before_streaming(self):
+        with patch.object(self.executor, "submit", side_effect=ExecutorSaturatedError("full")):
+            resp = self.client.post("/chat/stream", params={"user_id": "u1"},
+                                    json={"query": "hi"})
+
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(resp.json()["message"], "full")
+        self.chat_history.add_ai_message.assert_not_called()
+
+    @patch.object(route_chat, "_build_prompt", return_value="prompt")
+    @patch.object(route_chat, "_prepare_answer", return_value=(None, "ctx", None))
+    def test_cancelled_stream_stops_generation_and_stores_nothing(self, _prepare, _prompt):
+        closed = []
+
+        class _EndlessLLM(_FakeLLM):
+            def stream_response(self, prompt):
+                try:
+                    while True:
+                        yield "token"
+                finally:
+                    closed.append(True)
+
+        cancelled = threading.Event()
+        partial = route_chat._stream_answer(
+            "u1", "hi", {"llm": _EndlessLLM(), "response_cache": self.response_cache,
+                         "chat_history": self.chat_history},
+            emit=lambda token: cancelled.set(), started_at=0.0, cancelled=cancelled,
+        )
+
+        self.assertEqual(partial, "token")
+        self.assertEqual(closed, [True])
+        self.response_cache.put.assert_not_called()
+        self.chat_history.add_ai_message.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,7 +18,9 @@ class TestCreateSQLiteEngine(unittest.TestCase):
         conn = create_sqlite_engine()
 
         # Assert
-        mock_connect.assert_called_once_with(database=app_setting.DATABASE_URL)
+        mock_connect.assert_called_once_with(
+            database=app_setting.DATABASE_URL, check_same_thread=False
+        )
         self.assertEqual(conn, mock_conn)
 
     @patch.dict('os.environ', {
@@ -0,0 +1,93 @@
+import sqlite3
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.dbs import create_chunks_table, create_embeddings_table, insert_embeddings
+from src.helpers import get_settings
+from src.rag import search
+from src.rag.database_retrieval import fetch_chunks, load_embeddings_and_metadata
+
+
+class TestFetchChunks(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        create_chunks_table(self.conn)
+        self.conn.executemany(
+            "INSERT INTO chunks (id, page_contest, pages, sources, authors) VALUES (?, ?, ?, ?, ?)",
+            [(i, f"text {i}", str(i), f"doc{i}.pdf", "Rami") for i in range(1, 6)],
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_preserves_rank_order_and_returns_metadata(self):
+        results = fetch_chunks(self.conn, [4, 1, 3])
+
+        self.assertEqual([r["id"] for r in results], [4, 1, 3])
+        self.assertEqual(results[0], {
+            "id": 4, "page_content": "text 4", "page": "4",
+            "source": "doc4.pdf", "author": "Rami",
+        })
+
+    def test_skips_missing_and_duplicate_ids(self):
+        results = fetch_chunks(self.conn, [2, 99, 2, 5])
+
+        self.assertEqual([r["id"] for r in results], [2, 5])
+
+    def test_search_fetches_hits_in_one_query(self):
+        index_service = MagicMock(ntotal=5)
+        index_service.search_with_scores.return_value = [(5, 0.9), (2, 0.8), (3, 0.4)]
+        conn = MagicMock(wraps=self.conn)
+
+        results = search(
+            "query", embedder=MagicMock(), conn=conn, top_k=3,
+            index_service=index_service, query_vector=np.zeros(4, dtype=np.float32),
+        )
+
+        self.assertEqual([r["id"] for r in results], [5, 2, 3])
+        self.assertEqual([r["score"] for r in results], [0.9, 0.8, 0.4])
+        self.assertEqual(conn.execute.call_count, 1)
+
+    def test_search_drops_hits_below_min_score(self):
+        index_service = MagicMock(ntotal=5)
+        index_service.search_with_scores.return_value = [(5, 0.9), (2, 0.8), (3, 0.4)]
+
+        results = search(
+            "query", embedder=MagicMock(), conn=self.conn, top_k=3,
+            index_service=index_service, query_vector=np.zeros(4, dtype=np.float32),
+            min_score=0.5,
+        )
+
+        self.assertEqual([r["id"] for r in results], [5, 2])
+
+
+class TestLoadEmbeddings(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        create_chunks_table(self.conn)
+        create_embeddings_table(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_streamed_batches_fill_one_matrix_in_row_order(self):
+        vectors = np.arange(40, dtype=np.float32).reshape(10, 4)
+        insert_embeddings(self.conn, list(range(20, 10, -1)), vectors)
+
+        with patch.object(get_settings(), "DB_FETCH_BATCH_SIZE", 3):
+            ids, embeddings, metadata = load_embeddings_and_metadata(
+                self.conn, with_metadata=False)
+
+        self.assertEqual(ids.tolist(), list(range(20, 10, -1)))
+        np.testing.assert_array_equal(embeddings, vectors)
+        self.assertEqual(metadata, {})
+
+    def test_empty_table_raises(self):
+        with self.assertRaises(ValueError):
+            load_embeddings_and_metadata(self.conn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import sqlite3
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.dbs import create_chunks_table
+from src.rag import search
+from src.rag.diversify import estimate_tokens, mmr_select
+
+
+class TestMmrSelect(unittest.TestCase):
+    def setUp(self):
+        self.query = np.array([1.0, 0.0], dtype=np.float32)
+        # Two near-identical chunks closest to the query, and one on a different topic.
+        self.vectors = np.array([[1.0, 0.1], [1.0, 0.11], [0.6, 0.8]], dtype=np.float32)
+
+    def test_lambda_one_keeps_relevance_order(self):
+        selected, duplicates = mmr_select(self.query, self.vectors, k=3, lambda_mult=1.0)
+        self.assertEqual(selected, [0, 1, 2])
+        self.assertEqual(duplicates, [])
+
+    def test_lower_lambda_prefers_diverse_chunks(self):
+        selected, _ = mmr_select(self.query, self.vectors, k=2, lambda_mult=0.3)
+        self.assertEqual(selected, [0, 2])
+
+    def test_drops_candidates_above_duplicate_threshold(self):
+        selected, duplicates = mmr_select(
+            self.query, self.vectors, k=3, lambda_mult=1.0, duplicate_threshold=0.99)
+        self.assertEqual(selected, [0, 2])
+        self.assertEqual(duplicates, [1])
+
+    def test_estimate_tokens(self):
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens("abcdefghi"), 3)
+
+
+class TestSearchDiversification(unittest.TestCase):
+    def test_search_drops_near_duplicate_chunks(self):
+        conn = sqlite3.connect(":memory:")
+        create_chunks_table(conn)
+        conn.executemany(
+            "INSERT INTO chunks (id, page_contest, pages, sources, authors) VALUES (?, ?, ?, ?, ?)",
+            [(1, "header " * 10, "1", "a.pdf", "Rami"),
+             (2, "header " * 10, "2", "a.pdf", "Rami"),
+             (3, "opening hours", "3", "a.pdf", "Rami")],
+        )
+        index_service = MagicMock(ntotal=3)
+        index_service.search_with_scores.return_value = [(1, 0.9), (2, 0.89), (3, 0.5)]
+        index_service.reconstruct.return_value = {
+            1: np.array([1.0, 0.1], dtype=np.float32),
+            2: np.array([1.0, 0.1], dtype=np.float32),
+            3: np.array([0.6, 0.8], dtype=np.float32),
+        }
+
+        with patch("src.rag.retrieval.RETRIEVAL_TOKENS_SAVED_TOTAL") as tokens_saved:
+            results = search("q", embedder=MagicMock(), conn=conn, top_k=2,
+                             index_service=index_service,
+                             query_vector=np.array([1.0, 0.0], dtype=np.float32),
+                             mode="vector", mmr_lambda=1.0)
+
+        self.assertEqual([r["id"] for r in results], [1, 3])
+        tokens_saved.inc.assert_called_once_with(estimate_tokens("header " * 10))
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
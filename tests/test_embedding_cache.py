@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.controllers import clear_table
+from src.dbs import (
+    AsyncDatabase,
+    create_chunks_table,
+    create_embedding_cache_table,
+    create_embeddings_table,
+    hash_chunk_text,
+    lookup_cached_embeddings,
+    run_migrations,
+    store_cached_embeddings,
+)
+from src.rag import search
+from src.rag.index_service import FaissIndexService
+from src.routes.route_embedd_chunks import chunks_to_embedding_routes
+from src.routes.route_histroy_mang import chat_manage_routes
+
+
+class _CountingModel:
+    model_name = "test-model"
+
+    def __init__(self):
+        self.encoded = []
+
+    def embed_batch(self, texts, batch_size=64, normalize_embeddings=False):
+        self.encoded.extend(texts)
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        create_chunks_table(self.conn)
+        create_embeddings_table(self.conn)
+        create_embedding_cache_table(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_lookup_is_scoped_by_model_and_normalization(self):
+        key = hash_chunk_text("hello")
+        store_cached_embeddings(self.conn, "m", False, [key], np.array([[1.0, 2.0]]))
+
+        np.testing.assert_array_equal(
+            lookup_cached_embeddings(self.conn, "m", False, [key, "other"])[key], [1.0, 2.0])
+        self.assertEqual(lookup_cached_embeddings(self.conn, "m", True, [key]), {})
+        self.assertEqual(lookup_cached_embeddings(self.conn, "m2", False, [key]), {})
+
+    def test_reingestion_only_encodes_new_or_changed_chunks(self):
+        model = _CountingModel()
+        app = FastAPI()
+        app.include_router(chunks_to_embedding_routes)
+        app.state.conn = self.conn
+        app.state.embedding_model = model
+        app.state.index_service = None
+        client = TestClient(app)
+
+        self._insert_chunks(["alpha", "beta", "gamma"])
+        first = client.post("/chunks_to_embedding").json()
+        self.assertEqual((first["encoded_chunks"], first["reused_embeddings"]), (3, 0))
+
+        self.conn.execute("DELETE FROM embeddings")
+        self.conn.execute("DELETE FROM chunks")
+        self._insert_chunks(["alpha", "beta changed", "gamma"])
+        second = client.post("/chunks_to_embedding").json()
+
+        self.assertEqual((second["encoded_chunks"], second["reused_embeddings"]), (1, 2))
+        self.assertEqual(model.encoded, ["alpha", "beta", "gamma", "beta changed"])
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0], 3)
+
+    def _client(self, index_service):
+        app = FastAPI()
+        app.include_router(chunks_to_embedding_routes)
+        app.state.conn = self.conn
+        app.state.embedding_model = _CountingModel()
+        app.state.index_service = index_service
+        return TestClient(app)
+
+    def test_rerun_only_embeds_new_chunks_and_appends_to_the_index(self):
+        run_migrations(self.conn)
+        index_service = MagicMock(needs_retraining=False, ids=np.empty(0, dtype=np.int64))
+        client = self._client(index_service)
+
+        self._insert_chunks(["alpha", "beta"])
+        client.post("/chunks_to_embedding")
+        index_service.ids = np.array([1, 2], dtype=np.int64)
+        self._insert_chunks(["gamma"])
+        second = client.post("/chunks_to_embedding").json()
+
+        self.assertEqual(second["embedded_chunks"], 1)
+        self.assertEqual(index_service.add.call_args_list[-1].args[0], [3])
+        index_service.build.assert_not_called()
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0], 3)
+
+    def test_edited_chunk_is_reembedded_and_the_index_rebuilt(self):
+        run_migrations(self.conn)
+        index_service = MagicMock(needs_retraining=False, ids=np.empty(0, dtype=np.int64))
+        client = self._client(index_service)
+
+        self._insert_chunks(["alpha", "beta"])
+        client.post("/chunks_to_embedding")
+        index_service.ids = np.array([1, 2], dtype=np.int64)
+        with self.conn:
+            self.conn.execute("UPDATE chunks SET page_contest = 'beta v2' WHERE id = 2")
+        second = client.post("/chunks_to_embedding").json()
+
+        self.assertEqual((second["embedded_chunks"], second["encoded_chunks"]), (1, 1))
+        index_service.build.assert_called_once_with(self.conn)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0], 2)
+
+    def _reset_and_reingest(self):
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index_service = FaissIndexService(index_path=os.path.join(tmp_dir, "faiss.index"))
+            client = self._client(index_service)
+            self._insert_chunks(texts)
+            client.post("/chunks_to_embedding")
+
+            # /to_chunks with do_reset clears only the chunks table.
+            clear_table(self.conn, "chunks")
+            self._insert_chunks(texts)
+            client.post("/chunks_to_embedding")
+
+            results = search("ccc", embedder=None, conn=self.conn, top_k=1,
+                             index_service=index_service,
+                             query_vector=np.array([3.0, 1.0], dtype=np.float32), mode="vector")
+            return index_service.ntotal, results
+
+    def test_reingesting_after_a_chunk_reset_replaces_the_indexed_vectors(self):
+        run_migrations(self.conn)
+        ntotal, results = self._reset_and_reingest()
+
+        self.assertEqual(ntotal, 5)
+        self.assertEqual([(r["id"], r["page_content"]) for r in results], [(8, "ccc")])
+
+    def test_orphaned_embeddings_are_removed_without_the_trigger(self):
+        ntotal, results = self._reset_and_reingest()
+
+        self.assertEqual(ntotal, 5)
+        self.assertEqual([r["id"] for r in results], [8])
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0], 5)
+
+    def test_non_positive_batch_size_is_rejected(self):
+        self._insert_chunks(["alpha"])
+        response = self._client(None).post("/chunks_to_embedding", params={"batch_size": 0})
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0], 0)
+
+    def test_resetting_embeddings_clears_the_cache(self):
+        store_cached_embeddings(self.conn, "test-model", False, [hash_chunk_text("alpha")],
+                                np.ones((1, 2)))
+        app = FastAPI()
+        app.include_router(chat_manage_routes)
+        app.state.async_db = AsyncDatabase(self.conn, max_workers=1)
+        app.state.chat_manager = MagicMock()
+        try:
+            response = TestClient(app).post(
+                "/chat/manage", params={"remove_embeddings": True},
+                json={"clear_chat": False, "reset_memory": False},
+            )
+        finally:
+            app.state.async_db.shutdown()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0], 0)
+
+    def _insert_chunks(self, texts):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO chunks (page_contest, pages, sources, authors) VALUES (?, ?, ?, ?)",
+                [(text, "1", "doc.pdf", "Rami") for text in texts],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
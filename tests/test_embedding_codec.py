@@ -0,0 +1,85 @@
+import json
+import sqlite3
+import unittest
+
+import numpy as np
+
+from src.dbs import (
+    create_chunks_table,
+    create_embeddings_table,
+    decode_embeddings,
+    decode_legacy_embedding,
+    encode_embedding,
+    insert_embedding,
+    migrate_json_embeddings,
+)
+
+
+class TestEmbeddingCodec(unittest.TestCase):
+
+    def test_round_trip_many_vectors(self):
+        vectors = np.random.rand(5, 8).astype(np.float32)
+        blobs = [encode_embedding(vector) for vector in vectors]
+
+        self.assertTrue(all(len(blob) == 8 * 4 for blob in blobs))
+        np.testing.assert_array_equal(decode_embeddings(blobs, 8), vectors)
+
+    def test_decode_rejects_wrong_dimension(self):
+        blobs = [encode_embedding([0.1, 0.2, 0.3])]
+        with self.assertRaises(ValueError):
+            decode_embeddings(blobs, 4)
+
+    def test_decode_legacy_json(self):
+        vector = decode_legacy_embedding(json.dumps([0.5, 1.5]))
+        np.testing.assert_array_equal(vector, np.array([0.5, 1.5], dtype=np.float32))
+
+
+class TestMigrateJsonEmbeddings(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        create_chunks_table(self.conn)
+        # Legacy layout: no dim/dtype columns, JSON text in the BLOB column.
+        self.conn.execute("""
+            CREATE TABLE embeddings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chunk_id INTEGER NOT NULL,
+                embedding BLOB NOT NULL
+            );
+        """)
+        self.conn.executemany(
+            "INSERT INTO embeddings (chunk_id, embedding) VALUES (?, ?)",
+            [(1, json.dumps([0.1, 0.2])), (2, json.dumps([0.3, 0.4]))],
+        )
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_migration_converts_rows_and_is_idempotent(self):
+        self.assertEqual(migrate_json_embeddings(self.conn, batch_size=1), 2)
+        self.assertEqual(migrate_json_embeddings(self.conn), 0)
+
+        rows = self.conn.execute(
+            "SELECT embedding, dim, dtype FROM embeddings ORDER BY id"
+        ).fetchall()
+        self.assertTrue(all(row[1] == 2 and row[2] == "<f4" for row in rows))
+        np.testing.assert_allclose(
+            decode_embeddings([row[0] for row in rows], 2),
+            [[0.1, 0.2], [0.3, 0.4]],
+            rtol=1e-6,
+        )
+
+    def test_new_rows_are_written_in_binary(self):
+        create_embeddings_table(self.conn)
+        insert_embedding(self.conn, [1.0, 2.0], chunk_id=3)
+
+        blob, dim, dtype = self.conn.execute(
+            "SELECT embedding, dim, dtype FROM embeddings WHERE chunk_id = 3"
+        ).fetchone()
+        self.assertEqual((dim, dtype), (2, "<f4"))
+        self.assertEqual(len(blob), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
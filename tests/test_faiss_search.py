@@ -0,0 +1,51 @@
+import unittest
+
+import faiss
+import numpy as np
+
+from src.enums import FaissIndexType
+from src.rag.faiss_search import build_faiss_index, index_type_of, search_parameters
+
+
+class TestFaissIndexFactory(unittest.TestCase):
+    def setUp(self):
+        self.vectors = np.random.default_rng(0).random((2000, 32), dtype=np.float32)
+
+    def test_every_type_finds_stored_vectors(self):
+        for index_type in FaissIndexType:
+            with self.subTest(index_type=index_type):
+                index = build_faiss_index(self.vectors, index_type)
+                params = search_parameters(index, nprobe=_all_lists(index), ef_search=128)
+                _, ids = index.search(self.vectors[:5], 1, params=params)
+
+                self.assertEqual(index_type_of(index), index_type)
+                self.assertEqual(index.ntotal, 2000)
+                self.assertGreaterEqual(int((ids[:, 0] == np.arange(5)).sum()), 4)
+
+    def test_search_parameters_match_index_type(self):
+        ivf = build_faiss_index(self.vectors, FaissIndexType.IVF_FLAT)
+        hnsw = build_faiss_index(self.vectors, FaissIndexType.HNSW)
+        flat = build_faiss_index(self.vectors, FaissIndexType.FLAT)
+
+        self.assertIsInstance(search_parameters(ivf, nprobe=4), faiss.SearchParametersIVF)
+        self.assertIsInstance(search_parameters(hnsw, ef_search=32), faiss.SearchParametersHNSW)
+        self.assertIsNone(search_parameters(flat, nprobe=4, ef_search=32))
+        self.assertIsNone(search_parameters(ivf))
+
+    def test_ivfpq_falls_back_on_small_corpus(self):
+        index = build_faiss_index(self.vectors[:100], FaissIndexType.IVF_PQ)
+
+        self.assertEqual(index_type_of(index), FaissIndexType.IVF_FLAT)
+
+    def test_unknown_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            build_faiss_index(self.vectors, "LSH")
+
+
+def _all_lists(index):
+    """Scan every inverted list so IVF results are exact."""
+    return getattr(faiss.downcast_index(index), "nlist", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
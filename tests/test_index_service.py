@@ -0,0 +1,214 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.dbs import create_chunks_table, create_embeddings_table, insert_embeddings
+from src.enums import FaissIndexType, FaissMetric
+from src.helpers import get_settings
+from src.rag.faiss_search import index_type_of, metric_of
+from src.rag.index_service import FaissIndexService
+
+
+class TestFaissIndexService(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp_dir.name, "faiss.index")
+        self.conn = sqlite3.connect(":memory:")
+        create_chunks_table(self.conn)
+        create_embeddings_table(self.conn)
+        self.vectors = np.eye(4, dtype=np.float32)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_empty_corpus_starts_with_empty_index(self):
+        service = FaissIndexService(index_path=self.index_path)
+        service.load_or_build(self.conn)
+        self.assertEqual(service.ntotal, 0)
+        self.assertEqual(service.search(self.vectors[0], top_k=3), [])
+
+    def test_add_then_search_returns_chunk_ids(self):
+        service = FaissIndexService(index_path=self.index_path)
+        service.add([10, 11, 12, 13], self.vectors)
+
+        self.assertEqual(service.ntotal, 4)
+        self.assertEqual(service.search(self.vectors[2], top_k=1), [12])
+
+    def test_add_persists_index_to_disk(self):
+        service = FaissIndexService(index_path=self.index_path)
+        service.add([10, 11, 12, 13], self.vectors)
+
+        reloaded = FaissIndexService(index_path=self.index_path)
+        self.assertTrue(reloaded._load())
+        self.assertEqual(reloaded.search(self.vectors[3], top_k=1), [13])
+
+    def test_reconstruct_returns_stored_vectors_by_chunk_id(self):
+        service = FaissIndexService(index_path=self.index_path)
+        service.add([13, 10, 12, 11], self.vectors)
+
+        vectors = service.reconstruct([11, 13, 99])
+
+        self.assertEqual(sorted(vectors), [11, 13])
+        np.testing.assert_array_equal(vectors[11], self.vectors[3])
+        np.testing.assert_array_equal(vectors[13], self.vectors[0])
+
+    def test_add_rejects_mismatched_ids(self):
+        service = FaissIndexService(index_path=self.index_path)
+        with self.assertRaises(ValueError):
+            service.add([1, 2], self.vectors)
+
+    def test_reset_removes_files(self):
+        service = FaissIndexService(index_path=self.index_path)
+        service.add([10, 11, 12, 13], self.vectors)
+        service.reset()
+
+        self.assertEqual(service.ntotal, 0)
+        self.assertFalse(os.path.exists(self.index_path))
+
+    def _store_corpus(self):
+        """Chunks 100..103 embedded in reverse order, so embeddings.id != chunk_id."""
+        self.conn.executemany(
+            "INSERT INTO chunks (id, page_contest, pages, sources, authors) VALUES (?, ?, ?, ?, ?)",
+            [(100 + i, f"text {i}", "1", "doc.pdf", "Rami") for i in range(4)],
+        )
+        insert_embeddings(self.conn, [103, 102, 101, 100], self.vectors[::-1].copy())
+
+    def test_build_maps_index_rows_to_chunk_ids(self):
+        self._store_corpus()
+        service = FaissIndexService(index_path=self.index_path)
+        service.load_or_build(self.conn)
+
+        self.assertEqual(service.ids.dtype, np.int64)
+        self.assertEqual(service.ids.tolist(), [103, 102, 101, 100])
+        self.assertEqual(service.search(self.vectors[1], top_k=1), [101])
+
+    def test_build_streams_embeddings_in_batches(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((300, 8)).astype(np.float32)
+        chunk_ids = list(range(1000, 1300))
+        insert_embeddings(self.conn, chunk_ids, vectors)
+        service = FaissIndexService(index_path=self.index_path)
+        service.index_type = FaissIndexType.IVF_FLAT
+
+        with patch.object(get_settings(), "DB_FETCH_BATCH_SIZE", 64):
+            service.build(self.conn)
+
+        self.assertEqual(index_type_of(service._index), FaissIndexType.IVF_FLAT)
+        self.assertEqual(service.ids.tolist(), chunk_ids)
+        self.assertEqual(service.search(vectors[123], top_k=1, nprobe=64), [1123])
+
+    def test_pq_fallback_on_small_corpus_is_not_rebuilt(self):
+        rng = np.random.default_rng(0)
+        insert_embeddings(self.conn, list(range(100)),
+                          rng.standard_normal((100, 16)).astype(np.float32))
+        service = FaissIndexService(index_path=self.index_path)
+        service.index_type = FaissIndexType.IVF_PQ
+        service.build(self.conn)
+        service.add(list(range(100, 150)), rng.standard_normal((50, 16)).astype(np.float32))
+
+        self.assertIs(index_type_of(service._index), FaissIndexType.IVF_FLAT)
+        self.assertFalse(service.needs_retraining)
+        service._pq_min_vectors = 150
+        self.assertTrue(service.needs_retraining)
+
+    def test_stale_id_map_on_disk_triggers_rebuild(self):
+        self._store_corpus()
+        stale = FaissIndexService(index_path=self.index_path)
+        stale.add([1, 2, 3, 4], self.vectors)
+
+        service = FaissIndexService(index_path=self.index_path)
+        service.load_or_build(self.conn)
+
+        self.assertEqual(service.ids.tolist(), [103, 102, 101, 100])
+
+    def test_validate_reports_dangling_chunk_ids(self):
+        self._store_corpus()
+        service = FaissIndexService(index_path=self.index_path)
+        service.load_or_build(self.conn)
+        self.conn.execute("DELETE FROM chunks WHERE id = 102")
+
+        self.assertEqual(service.validate(self.conn), 1)
+
+    def test_cosine_metric_ranks_by_angle_and_returns_similarities(self):
+        corpus = np.array([[10.0, 0.0], [1.0, 1.0]], dtype=np.float32)
+        query = np.array([5.0, 1.0], dtype=np.float32)
+
+        l2 = FaissIndexService(index_path=self.index_path)
+        l2.metric = FaissMetric.L2
+        l2.add([1, 2], corpus, persist=False)
+        cosine = FaissIndexService(index_path=os.path.join(self.tmp_dir.name, "cos.index"))
+        cosine.metric = FaissMetric.COSINE
+        cosine.add([1, 2], corpus, persist=False)
+
+        self.assertEqual(l2.search(query, top_k=1), [2])
+        (best, score), (_, runner_up) = cosine.search_with_scores(query, top_k=2)
+        self.assertEqual(best, 1)
+        self.assertAlmostEqual(score, 5 / np.sqrt(26), places=5)
+        self.assertGreater(score, runner_up)
+
+    def test_metric_change_triggers_rebuild(self):
+        self._store_corpus()
+        service = FaissIndexService(index_path=self.index_path)
+        service.metric = FaissMetric.L2
+        service.load_or_build(self.conn)
+
+        switched = FaissIndexService(index_path=self.index_path)
+        switched.metric = FaissMetric.COSINE
+        switched.load_or_build(self.conn)
+
+        self.assertIs(metric_of(switched._index), FaissMetric.COSINE)
+        [(chunk_id, score)] = switched.search_with_scores(self.vectors[1], top_k=1)
+        self.assertEqual(chunk_id, 101)
+        self.assertAlmostEqual(score, 1.0, places=5)
+
+    def _mapped_service(self):
+        service = FaissIndexService(index_path=self.index_path)
+        service.mmap, service.reload_interval = True, 0
+        return service
+
+    def test_mmap_load_shares_saved_files_read_only(self):
+        FaissIndexService(index_path=self.index_path).add([10, 11, 12, 13], self.vectors)
+
+        service = self._mapped_service()
+        self.assertTrue(service._load())
+        self.assertTrue(service.mapped)
+        self.assertIsInstance(service._ids, np.memmap)
+        self.assertEqual(service.search(self.vectors[2], top_k=1), [12])
+
+    def test_add_to_mapped_index_copies_then_remaps_saved_files(self):
+        writer = self._mapped_service()
+        writer.add([10, 11, 12, 13], self.vectors)
+        self.assertTrue(writer.mapped)
+
+        writer.add([14], np.full((1, 4), 2.0, dtype=np.float32))
+
+        self.assertTrue(writer.mapped)
+        self.assertEqual(writer.ntotal, 5)
+        self.assertEqual(writer.search(np.full(4, 2.0), top_k=1), [14])
+
+    def test_reader_picks_up_index_replaced_by_another_process(self):
+        writer = FaissIndexService(index_path=self.index_path)
+        writer.add([10, 11, 12, 13], self.vectors)
+        reader = self._mapped_service()
+        reader._load()
+        version = reader.version
+
+        writer.add([14], np.full((1, 4), 2.0, dtype=np.float32))
+
+        self.assertTrue(reader.reload_if_changed(force=True))
+        self.assertGreater(reader.version, version)
+        self.assertEqual(reader.search(np.full(4, 2.0), top_k=1), [14])
+        self.assertFalse(reader.reload_if_changed(force=True))
+
+        writer.reset()
+        self.assertTrue(reader.reload_if_changed(force=True))
+        self.assertEqual(reader.ntotal, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
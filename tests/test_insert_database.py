@@ -2,10 +2,10 @@ import unittest
 from unittest.mock import MagicMock, patch, call
 import sqlite3
 import pandas as pd
-import json
+import numpy as np
 
 # Import the functions to test
-from src.dbs import insert_chunk, insert_embedding, insert_query_response
+from src.dbs import insert_chunk, insert_embedding, insert_embeddings, insert_query_response, hash_query
 
 class TestDatabaseInsertions(unittest.TestCase):
     def setUp(self):
@@ -72,9 +72,9 @@ class TestDatabaseInsertions(unittest.TestCase):
         # Verify the correct SQL was executed
         # Use call() to match the exact SQL string including whitespace
         expected_call = call("""
-            INSERT INTO embeddings (chunk_id, embedding)
-            VALUES (?, ?)
-        """, (test_chunk_id, json.dumps(test_embedding)))
+            INSERT INTO embeddings (chunk_id, embedding, dim, dtype)
+            VALUES (?, ?, ?, ?)
+        """, (test_chunk_id, np.asarray(test_embedding, dtype="<f4").tobytes(), 3, "<f4"))
         
         self.mock_cursor.execute.assert_called_once()
         self.assertEqual(self.mock_cursor.execute.call_args, expected_call)
@@ -94,6 +94,26 @@ class TestDatabaseInsertions(unittest.TestCase):
         # Verify rollback was called
         self.mock_conn.rollback.assert_called_once()
 
+    def test_insert_embeddings_batch_uses_executemany(self):
+        """Test a batch of embeddings is written with one executemany call."""
+        embeddings = np.array([[0.1, 0.2], [0.3, 0.4]], dtype=np.float32)
+
+        inserted = insert_embeddings(self.mock_conn, [1, 2], embeddings)
+
+        self.assertEqual(inserted, 2)
+        self.mock_conn.executemany.assert_called_once()
+        rows = self.mock_conn.executemany.call_args[0][1]
+        self.assertEqual(rows[0], (1, embeddings[0].tobytes(), 2, "<f4"))
+        self.assertEqual(rows[1][0], 2)
+
+    def test_insert_embeddings_batch_failure(self):
+        """Test a failing batch reports zero inserted rows."""
+        self.mock_conn.executemany.side_effect = sqlite3.DatabaseError("DB error")
+
+        inserted = insert_embeddings(self.mock_conn, [1], np.zeros((1, 2), dtype=np.float32))
+
+        self.assertEqual(inserted, 0)
+
     def test_insert_query_response_success(self):
         """Test successful insertion of a query-response pair."""
         test_query = "What is AI?"
@@ -101,14 +121,15 @@ class TestDatabaseInsertions(unittest.TestCase):
         test_user_id = "user123"
 
         # Call the function
-        insert_query_response(self.mock_conn, test_query, test_response, test_user_id)
+        with patch("src.dbs.insert_to_database.time.time", return_value=1700000000.0):
+            insert_query_response(self.mock_conn, test_query, test_response, test_user_id)
 
         # Verify the correct SQL was executed
         # Use call() to match the exact SQL string including whitespace
         expected_call = call("""
-            INSERT INTO query_responses (user_id, query, response)
-            VALUES (?, ?, ?)
-        """, (test_user_id, test_query, test_response))
+            INSERT INTO query_responses (user_id, query, response, query_hash, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (test_user_id, test_query, test_response, hash_query(test_query), 1700000000.0))
         
         self.mock_cursor.execute.assert_called_once()
         self.assertEqual(self.mock_cursor.execute.call_args, expected_call)
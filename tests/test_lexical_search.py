@@ -0,0 +1,90 @@
+import sqlite3
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from src.controllers import clear_table
+from src.dbs import create_chunks_fts_table, create_chunks_table, insert_chunk
+from src.rag import lexical_search, search
+from src.rag.lexical_search import build_match_query
+from src.rag.rank_fusion import reciprocal_rank_fusion
+
+
+def _chunks(*texts):
+    return pd.DataFrame({
+        "page_contest": list(texts),
+        "pages": ["1"] * len(texts),
+        "sources": ["doc.pdf"] * len(texts),
+        "authors": ["Rami"] * len(texts),
+    })
+
+
+class TestLexicalSearch(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        create_chunks_table(self.conn)
+        self.assertTrue(create_chunks_fts_table(self.conn))
+        insert_chunk(self.conn, _chunks(
+            "Our Amman branch opens at 9 AM.",
+            "Call customer service on 0791234567.",
+            "Product RX-200 ships with a two year warranty.",
+        ))
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_exact_terms_are_found(self):
+        self.assertEqual(lexical_search(self.conn, "rx-200 warranty?", top_k=1)[0][0], 3)
+        self.assertEqual(lexical_search(self.conn, "0791234567", top_k=3)[0][0], 2)
+
+    def test_match_query_quotes_terms(self):
+        self.assertEqual(build_match_query('Amman "branch" OR NOT*'),
+                         '"amman" OR "branch" OR "or" OR "not"')
+        self.assertEqual(lexical_search(self.conn, "?!", top_k=3), [])
+
+    def test_index_follows_inserts_and_deletes(self):
+        insert_chunk(self.conn, _chunks("Irbid branch is closed on Fridays."))
+        self.assertEqual(lexical_search(self.conn, "Irbid", top_k=3)[0][0], 4)
+
+        clear_table(self.conn, "chunks")
+        self.assertEqual(lexical_search(self.conn, "branch", top_k=3), [])
+
+    def test_existing_chunks_are_indexed_when_table_is_created(self):
+        conn = sqlite3.connect(":memory:")
+        create_chunks_table(conn)
+        insert_chunk(conn, _chunks("Zarqa branch"))
+        create_chunks_fts_table(conn)
+
+        self.assertEqual(lexical_search(conn, "zarqa", top_k=1)[0][0], 1)
+        conn.close()
+
+    def test_reciprocal_rank_fusion_rewards_agreement(self):
+        fused = reciprocal_rank_fusion([[1, 2, 3], [3, 4]], k=60)
+
+        self.assertEqual([item for item, _ in fused], [3, 1, 2, 4])
+
+    def test_search_falls_back_to_lexical_without_embedder(self):
+        results = search("Amman branch", embedder=None, conn=self.conn, top_k=2,
+                         index_service=MagicMock(ntotal=3), mode="hybrid")
+
+        self.assertEqual(results[0]["id"], 1)
+        self.assertGreater(results[0]["score"], 0)
+
+    def test_hybrid_search_fuses_dense_and_lexical_hits(self):
+        index_service = MagicMock(ntotal=3)
+        index_service.search_with_scores.return_value = [(1, 0.9), (3, 0.5)]
+
+        query = "branch service warranty year"
+        # BM25: two matched terms beat one, and the shorter chunk wins a single-term tie.
+        self.assertEqual([chunk_id for chunk_id, _ in lexical_search(self.conn, query, top_k=3)],
+                         [3, 2, 1])
+
+        results = search(query, embedder=MagicMock(), conn=self.conn, top_k=3,
+                         index_service=index_service, query_vector=[0.0], mode="hybrid")
+
+        self.assertEqual([r["id"] for r in results], [3, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.dbs import create_chunks_table
+from src.rag import FaissIndexService
+from src.routes import route_live_rag
+
+
+class _OneHotEmbedder:
+    """Embeds a query "cN" as the N-th unit vector and counts encode calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_batch(self, texts, batch_size=64, normalize_embeddings=False):
+        self.calls.append(len(texts))
+        vectors = np.zeros((len(texts), 4), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vectors[row, int(text[1:])] = 1.0
+        return vectors
+
+
+class TestLiveRagBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        create_chunks_table(self.conn)
+        self.conn.executemany(
+            "INSERT INTO chunks (id, page_contest, pages, sources, authors) VALUES (?, ?, ?, ?, ?)",
+            [(i, f"chunk {i}", "1", "doc.pdf", "Rami") for i in range(1, 5)],
+        )
+        self.index_service = FaissIndexService(
+            index_path=os.path.join(self.tmp_dir.name, "faiss.index"))
+        self.index_service.add([1, 2, 3, 4], np.eye(4, dtype=np.float32))
+        self.embedder = _OneHotEmbedder()
+
+        app = FastAPI()
+        app.include_router(route_live_rag.live_rag_route)
+        app.dependency_overrides[route_live_rag.get_embedd] = lambda: self.embedder
+        app.dependency_overrides[route_live_rag.get_db_conn] = lambda: self.conn
+        app.dependency_overrides[route_live_rag.get_index_service] = lambda: self.index_service
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_streams_one_ndjson_line_per_query_in_order(self):
+        queries = ["c2", "c0", "c3"]
+        response = self.client.post("/live_rag/batch", json={"queries": queries})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([line["query"] for line in lines], queries)
+        self.assertEqual([line["Retriever Results"] for line in lines],
+                         [["chunk 3"], ["chunk 1"], ["chunk 4"]])
+        self.assertEqual(self.embedder.calls, [3])
+
+    def test_rejects_empty_queries(self):
+        response = self.client.post("/live_rag/batch", json={"queries": ["c1", " "]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_single_query_search_runs_off_the_event_loop(self):
+        def fake_search(**kwargs):
+            with self.assertRaises(RuntimeError):
+                asyncio.get_running_loop()
+            return [{"page_content": "chunk 2", "score": 1.0}]
+
+        app = self.client.app
+        app.dependency_overrides[route_live_rag.get_optional_embedd] = lambda: self.embedder
+        app.dependency_overrides[route_live_rag.get_reranker] = lambda: None
+        with patch.object(route_live_rag, "search", side_effect=fake_search) as search:
+            response = self.client.post("/live_rag", json={"query": "c1", "top_k": 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["Retriever Results"], ["chunk 2"])
+        search.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
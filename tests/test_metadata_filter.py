@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+from pydantic import ValidationError
+
+from src.dbs import create_chunks_fts_table, create_chunks_table, insert_chunk
+from src.rag import ChunkFilter, FaissIndexService, lexical_search, search
+from src.rag.metadata_filter import RowBitmap
+from src.schemes import RetrievalFilters
+
+
+class TestChunkFilter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(":memory:")
+        create_chunks_table(self.conn)
+        self.assertTrue(create_chunks_fts_table(self.conn))
+        insert_chunk(self.conn, pd.DataFrame({
+            "page_contest": ["warranty terms a", "warranty terms b",
+                             "warranty terms c", "warranty terms d"],
+            "pages": ["1", "2", "10", "3"],
+            "sources": ["a.pdf", "a.pdf", "a.pdf", "b.pdf"],
+            "authors": ["Rami", "Rami", "Lina", "Rami"],
+        }))
+        self.service = FaissIndexService(
+            index_path=os.path.join(self.tmp_dir.name, "faiss.index"))
+        self.service.add([1, 2, 3, 4], np.eye(4, dtype=np.float32))
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_of_returns_none_without_constraints(self):
+        self.assertIsNone(ChunkFilter.of())
+        self.assertEqual(ChunkFilter.of(sources=["b", "a", "a"]).sources, ("a", "b"))
+
+    def test_matching_ids_compares_pages_as_numbers(self):
+        chunk_filter = ChunkFilter.of(sources=["a.pdf"], page_min=2, page_max=10)
+        self.assertEqual(chunk_filter.matching_ids(self.conn).tolist(), [2, 3])
+
+    def test_row_bitmap_selects_rows_of_allowed_ids(self):
+        bitmap = RowBitmap(np.array([7, 5, 9], dtype=np.int64), np.array([9, 7]))
+        self.assertEqual(bitmap.count, 2)
+        self.assertEqual(np.unpackbits(bitmap.bits, bitorder="little")[:3].tolist(), [1, 0, 1])
+
+    def test_index_search_only_returns_matching_chunks(self):
+        chunk_filter = ChunkFilter.of(authors=["Rami"], page_min=2)
+        hits = self.service.search_with_scores(
+            np.ones(4, dtype=np.float32), top_k=4, chunk_filter=chunk_filter, conn=self.conn)
+        self.assertEqual(sorted(chunk_id for chunk_id, _ in hits), [2, 4])
+
+    def test_filter_bitmap_is_cached_until_the_index_changes(self):
+        chunk_filter = ChunkFilter.of(sources=["b.pdf"])
+        with patch.object(ChunkFilter, "matching_ids",
+                          return_value=np.array([4], dtype=np.int64)) as matching_ids:
+            for _ in range(3):
+                self.service.search_with_scores(np.ones(4), 2, chunk_filter=chunk_filter,
+                                                conn=self.conn)
+            self.assertEqual(matching_ids.call_count, 1)
+
+            self.service.add([5], np.ones((1, 4), dtype=np.float32))
+            self.service.search_with_scores(np.ones(4), 2, chunk_filter=chunk_filter,
+                                            conn=self.conn)
+            self.assertEqual(matching_ids.call_count, 2)
+
+    def test_lexical_search_applies_filter_before_limit(self):
+        hits = lexical_search(self.conn, "warranty", top_k=1,
+                              chunk_filter=ChunkFilter.of(sources=["b.pdf"]))
+        self.assertEqual([chunk_id for chunk_id, _ in hits], [4])
+
+    def test_search_without_matches_returns_nothing(self):
+        results = search("warranty", embedder=None, conn=self.conn, top_k=3,
+                         index_service=self.service, query_vector=np.ones(4),
+                         mode="hybrid", filters=ChunkFilter.of(authors=["Nobody"]))
+        self.assertEqual(results, [])
+
+    def test_schema_rejects_inverted_page_range(self):
+        with self.assertRaises(ValidationError):
+            RetrievalFilters(page_min=5, page_max=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from src.dbs import (
+    MIGRATIONS,
+    create_chunks_table,
+    create_embeddings_table,
+    delete_embeddings,
+    insert_embeddings,
+    run_migrations,
+    schema_version,
+)
+
+
+def _index_names(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA index_list({table})")}
+
+
+class TestMigrations(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "app.db")
+        self.conn = sqlite3.connect(self.path)
+        create_chunks_table(self.conn)
+        create_embeddings_table(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_fresh_database_reaches_latest_version(self):
+        version = run_migrations(self.conn)
+
+        self.assertEqual(version, MIGRATIONS[-1][0])
+        self.assertEqual(schema_version(self.conn), version)
+        self.assertIn("idx_chunks_sources", _index_names(self.conn, "chunks"))
+        self.assertIn("idx_embeddings_chunk_id", _index_names(self.conn, "embeddings"))
+
+    def test_duplicate_embeddings_are_collapsed_to_the_newest(self):
+        insert_embeddings(self.conn, [1, 1, 2], np.array([[0.0], [1.0], [2.0]]))
+
+        run_migrations(self.conn)
+
+        rows = self.conn.execute("SELECT chunk_id, embedding FROM embeddings ORDER BY chunk_id")
+        self.assertEqual([(chunk_id, np.frombuffer(blob, "<f4")[0]) for chunk_id, blob in rows],
+                         [(1, 1.0), (2, 2.0)])
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.conn.execute("INSERT INTO embeddings (chunk_id, embedding) VALUES (1, x'00')")
+
+    def test_replacing_embeddings_keeps_one_row_per_chunk(self):
+        run_migrations(self.conn)
+        insert_embeddings(self.conn, [1, 2], np.zeros((2, 2)))
+
+        self.assertEqual(delete_embeddings(self.conn, [2, 3]), 1)
+        self.assertEqual(insert_embeddings(self.conn, [2, 3], np.ones((2, 2))), 2)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0], 3)
+
+    def test_editing_chunk_text_drops_its_embedding(self):
+        run_migrations(self.conn)
+        self.conn.executemany(
+            "INSERT INTO chunks (id, page_contest, pages, sources, authors) VALUES (?, ?, ?, ?, ?)",
+            [(1, "alpha", "1", "doc.pdf", "Rami"), (2, "beta", "1", "doc.pdf", "Rami")],
+        )
+        insert_embeddings(self.conn, [1, 2], np.zeros((2, 2)))
+
+        self.conn.execute("UPDATE chunks SET pages = '2' WHERE id = 1")
+        self.conn.execute("UPDATE chunks SET page_contest = 'beta v2' WHERE id = 2")
+
+        remaining = [row[0] for row in self.conn.execute("SELECT chunk_id FROM embeddings")]
+        self.assertEqual(remaining, [1])
+
+    def test_deleting_chunks_drops_their_embeddings(self):
+        run_migrations(self.conn)
+        self.conn.executemany(
+            "INSERT INTO chunks (id, page_contest, pages, sources, authors) VALUES (?, ?, ?, ?, ?)",
+            [(1, "alpha", "1", "doc.pdf", "Rami"), (2, "beta", "1", "doc.pdf", "Rami")],
+        )
+        insert_embeddings(self.conn, [1, 2], np.zeros((2, 2)))
+
+        self.conn.execute("DELETE FROM chunks WHERE id = 2")
+
+        remaining = [row[0] for row in self.conn.execute("SELECT chunk_id FROM embeddings")]
+        self.assertEqual(remaining, [1])
+
+    def test_applied_migrations_are_not_rerun(self):
+        calls = []
+        migrations = [(1, "first", lambda conn: calls.append(1)),
+                      (2, "second", lambda conn: calls.append(2))]
+
+        run_migrations(self.conn, migrations[:1])
+        run_migrations(self.conn, migrations)
+        run_migrations(self.conn, migrations)
+
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(schema_version(self.conn), 2)
+
+    def test_failed_migration_rolls_back_schema_and_version(self):
+        def broken(conn):
+            conn.execute("CREATE INDEX idx_broken ON chunks (pages)")
+            raise sqlite3.OperationalError("boom")
+
+        with self.assertRaises(sqlite3.OperationalError):
+            run_migrations(self.conn, [(1, "broken", broken)])
+
+        self.assertEqual(schema_version(self.conn), 0)
+        self.assertNotIn("idx_broken", _index_names(self.conn, "chunks"))
+
+    def test_concurrent_workers_apply_each_migration_once(self):
+        calls = []
+        lock = threading.Lock()
+
+        def slow_migration(conn):
+            with lock:
+                calls.append(threading.get_ident())
+            conn.execute("CREATE TABLE marker (id INTEGER)")
+
+        def worker():
+            conn = sqlite3.connect(self.path, timeout=0.05)
+            try:
+                run_migrations(conn, [(1, "marker", slow_migration)])
+            finally:
+                conn.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(schema_version(self.conn), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import sqlite3
 from typing import List, Dict, Any, Tuple
 
 # Import the function to test
-from src.dbs import pull_from_table
+from src.dbs import hash_query, pull_from_table, stream_columns, stream_from_table
 
 class TestPullFromTable(unittest.TestCase):
     def setUp(self):
@@ -31,8 +31,9 @@ class TestPullFromTable(unittest.TestCase):
         
         # Verify
         self.mock_cursor.execute.assert_called_once_with(
-            "SELECT response FROM query_responses WHERE user_id = ? AND query = ?",
-            cache_key
+            "SELECT response FROM query_responses WHERE user_id = ? AND query_hash = ? "
+            "ORDER BY id DESC LIMIT 1",
+            ("user123", hash_query("test query"))
         )
         self.assertEqual(result, "cached response")
 
@@ -131,5 +132,40 @@ class TestPullFromTable(unittest.TestCase):
         # Verify
         self.assertEqual(result, [])
 
+class TestStreamFromTable(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        self.conn.executemany("INSERT INTO items (id, name) VALUES (?, ?)",
+                              [(i, f"item {i}") for i in range(10, 0, -1)])
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_rows_come_in_bounded_batches(self):
+        batches = list(stream_from_table(self.conn, "items", ["id", "name"],
+                                         batch_size=4, order_by="id"))
+
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual(batches[0][0], (1, "item 1"))
+
+    def test_column_batches(self):
+        batches = list(stream_columns(self.conn, "items", ["id", "name"],
+                                      batch_size=6, order_by="id"))
+
+        self.assertEqual(batches[0]["id"], (1, 2, 3, 4, 5, 6))
+        self.assertEqual(batches[1]["name"], ("item 7", "item 8", "item 9", "item 10"))
+
+    def test_empty_table_yields_nothing(self):
+        self.conn.execute("DELETE FROM items")
+        self.assertEqual(list(stream_from_table(self.conn, "items", ["id"], batch_size=4)), [])
+
+    def test_rejects_unsafe_names(self):
+        with self.assertRaises(ValueError):
+            next(stream_from_table(self.conn, "items; DROP TABLE items", ["id"]))
+        with self.assertRaises(ValueError):
+            next(stream_from_table(self.conn, "items", ["id"], batch_size=0))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
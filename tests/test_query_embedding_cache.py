@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.cache import QueryEmbeddingCache
+from src.rag import embed_query
+
+
+class TestQueryEmbeddingCache(unittest.TestCase):
+    def test_hit_returns_a_read_only_float32_array_and_counts_hit_rate(self):
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.put("model", False, "hello", [1.0, 2.0])
+
+        vector = cache.get("model", False, "hello")
+        self.assertEqual(vector.dtype, np.float32)
+        with self.assertRaises(ValueError):
+            vector[0] = 3.0
+
+        np.testing.assert_array_equal(cache.get("model", False, "hello"), [1.0, 2.0])
+        self.assertIsNone(cache.get("model", True, "hello"))
+        self.assertIsNone(cache.get("other-model", False, "hello"))
+        self.assertAlmostEqual(cache.stats["hit_rate"], 0.5)
+
+    def test_caller_owned_arrays_are_copied_before_freezing(self):
+        cache = QueryEmbeddingCache(max_entries=2)
+        owned = np.array([1.0, 2.0], dtype=np.float64)
+        cache.put("m", False, "a", owned)
+        owned[0] = 9.0
+
+        self.assertTrue(owned.flags.writeable)
+        np.testing.assert_array_equal(cache.get("m", False, "a"), [1.0, 2.0])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.put("m", False, "a", [1.0])
+        cache.put("m", False, "b", [2.0])
+        cache.get("m", False, "a")
+        cache.put("m", False, "c", [3.0])
+
+        self.assertIsNone(cache.get("m", False, "b"))
+        np.testing.assert_array_equal(cache.get("m", False, "a"), [1.0])
+
+    def test_zero_size_disables_the_cache(self):
+        cache = QueryEmbeddingCache(max_entries=0)
+        cache.put("m", False, "a", [1.0])
+        self.assertIsNone(cache.get("m", False, "a"))
+
+    def test_embed_query_skips_the_model_for_repeated_queries(self):
+        embedder = MagicMock(model_name="test-model")
+        embedder.embed.return_value = np.array([0.5, 0.5], dtype=np.float32)
+
+        with patch("src.rag.embedding_query._query_cache", QueryEmbeddingCache(max_entries=8)):
+            first = embed_query("store hours?", embedder, convert_to_tensor=False)
+            second = embed_query("store hours?", embedder, convert_to_tensor=False)
+            embed_query("store hours?", embedder, normalize_embeddings=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.dtype, np.float32)
+        self.assertEqual(embedder.embed.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import sqlite3
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.dbs import create_chunks_table
+from src.rag import CrossEncoderReranker, search
+
+
+class _LengthModel:
+    """Scores a pair by chunk length, so longer chunks rank first."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size, show_progress_bar):
+        self.calls.append(len(pairs))
+        return np.array([len(text) for _, text in pairs], dtype=np.float32)
+
+
+def _chunks(*texts):
+    return [{"id": i, "page_content": text} for i, text in enumerate(texts)]
+
+
+class TestCrossEncoderReranker(unittest.TestCase):
+    def test_scores_all_candidates_in_one_batch_and_keeps_top_n(self):
+        model = _LengthModel()
+        reranker = CrossEncoderReranker(candidates=50, budget_ms=0, model=model)
+
+        ranked = reranker.rerank("q", _chunks("a", "ccc", "bb"), top_n=2)
+
+        self.assertEqual(model.calls, [3])
+        self.assertEqual([c["page_content"] for c in ranked], ["ccc", "bb"])
+        self.assertEqual(ranked[0]["rerank_score"], 3.0)
+
+    def test_skips_when_expected_latency_exceeds_budget_then_probes(self):
+        model = _LengthModel()
+        reranker = CrossEncoderReranker(budget_ms=10, probe_every=2, model=model)
+        reranker._per_pair_ms = 5.0
+
+        skipped = reranker.rerank("q", _chunks("a", "ccc", "bb"), top_n=2)
+        self.assertEqual([c["page_content"] for c in skipped], ["a", "ccc"])
+        reranker.rerank("q", _chunks("a", "ccc", "bb"), top_n=2)
+        self.assertEqual(model.calls, [])
+
+        reranker.rerank("q", _chunks("a", "ccc", "bb"), top_n=2)
+        self.assertEqual(model.calls, [3])
+        self.assertLess(reranker._per_pair_ms, 5.0)
+
+    def test_search_widens_candidates_for_the_reranker(self):
+        conn = sqlite3.connect(":memory:")
+        create_chunks_table(conn)
+        conn.executemany(
+            "INSERT INTO chunks (id, page_contest, pages, sources, authors) VALUES (?, ?, ?, ?, ?)",
+            [(i, "x" * i, "1", "doc.pdf", "Rami") for i in range(1, 6)],
+        )
+        index_service = MagicMock(ntotal=5)
+        index_service.search_with_scores.return_value = [(i, 1.0 / i) for i in range(1, 6)]
+        reranker = CrossEncoderReranker(candidates=5, budget_ms=0, model=_LengthModel())
+
+        results = search("q", embedder=MagicMock(), conn=conn, top_k=2,
+                         index_service=index_service, query_vector=np.zeros(4),
+                         mode="vector", reranker=reranker)
+
+        self.assertEqual(index_service.search_with_scores.call_args[0][1], 5)
+        self.assertEqual([r["id"] for r in results], [5, 4])
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import sqlite3
+import time
+import unittest
+from unittest.mock import patch
+
+from src.cache import ResponseCache
+from src.dbs import (
+    create_query_responses_table,
+    evict_query_responses,
+    hash_query,
+    insert_query_response,
+)
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        create_query_responses_table(self.conn)
+        self.cache = ResponseCache(
+            self.conn, ttl_seconds=60, max_rows=100, lru_size=2, eviction_interval=0
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_lookup_ignores_case_and_whitespace(self):
+        self.cache.put("u1", "What are  the store hours?", "Answer: 9 to 9")
+
+        self.assertEqual(self.cache.get("u1", "  what are the STORE hours? "), "Answer: 9 to 9")
+        self.assertIsNone(self.cache.get("u2", "What are the store hours?"))
+
+    def test_database_tier_serves_after_memory_is_cleared(self):
+        self.cache.put("u1", "hello", "Answer: hi")
+        self.cache.clear()
+
+        self.assertEqual(self.cache.get("u1", "hello"), "Answer: hi")
+        self.assertEqual(self.cache.stats["memory_entries"], 1)
+
+    def test_memory_tier_is_bounded(self):
+        for i in range(5):
+            self.cache.put("u1", f"q{i}", f"r{i}")
+
+        self.assertEqual(self.cache.stats["memory_entries"], 2)
+
+    def test_expired_entries_are_not_served(self):
+        self.cache.put("u1", "hello", "Answer: hi")
+
+        with patch("time.time", return_value=time.time() + 120):
+            self.assertIsNone(self.cache.get("u1", "hello"))
+            self.assertEqual(self.cache.evict(), 1)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM query_responses").fetchone()[0], 0)
+
+    def test_row_cap_drops_oldest_rows(self):
+        for i in range(5):
+            insert_query_response(self.conn, f"q{i}", f"r{i}", "u1")
+
+        expired, overflow = evict_query_responses(self.conn, ttl_seconds=0, max_rows=3)
+        self.assertEqual(expired, 0)
+        self.assertEqual(overflow, [("u1", hash_query("q0")), ("u1", hash_query("q1"))])
+        remaining = [row[0] for row in self.conn.execute(
+            "SELECT query FROM query_responses ORDER BY id")]
+        self.assertEqual(remaining, ["q2", "q3", "q4"])
+
+    def test_row_cap_eviction_drops_the_memory_copy(self):
+        cache = ResponseCache(self.conn, ttl_seconds=60, max_rows=1, lru_size=4,
+                              eviction_interval=0)
+        cache.put("u1", "old", "Answer: old")
+        cache.put("u1", "new", "Answer: new")
+
+        self.assertEqual(cache.evict(), 1)
+        self.assertIsNone(cache.get("u1", "old"))
+        self.assertEqual(cache.get("u1", "new"), "Answer: new")
+
+    def test_legacy_rows_are_backfilled_and_indexed(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""
+            CREATE TABLE query_responses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                query TEXT NOT NULL,
+                response TEXT NOT NULL
+            );
+        """)
+        conn.execute("INSERT INTO query_responses (user_id, query, response) "
+                     "VALUES ('u1', 'Old Question', 'Answer: old')")
+        create_query_responses_table(conn)
+
+        cache = ResponseCache(conn, ttl_seconds=60, max_rows=0, lru_size=0, eviction_interval=0)
+        self.assertEqual(cache.get("u1", "old question"), "Answer: old")
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT response FROM query_responses "
+            "WHERE user_id = 'u1' AND query_hash = 'x'").fetchall()
+        self.assertIn("idx_query_responses_user_hash", str(plan))
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import sqlite3
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.cache import ResponseCache, ResponseWriter
+from src.dbs import create_query_responses_table
+
+
+def _row_count(conn):
+    return conn.execute("SELECT COUNT(*) FROM query_responses").fetchone()[0]
+
+
+class TestResponseWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        create_query_responses_table(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_rows_are_written_immediately_when_not_started(self):
+        writer = ResponseWriter(self.conn, max_queue=10, batch_size=5, flush_interval=60)
+        writer.submit("u1", "hello", "Answer: hi")
+
+        self.assertEqual(_row_count(self.conn), 1)
+
+    def test_rows_wait_for_a_flush_and_are_written_on_stop(self):
+        writer = ResponseWriter(self.conn, max_queue=10, batch_size=5, flush_interval=60)
+        writer.start()
+        for i in range(3):
+            writer.submit("u1", f"q{i}", f"r{i}")
+
+        self.assertEqual(writer.stats["pending"], 3)
+        self.assertEqual(_row_count(self.conn), 0)
+
+        writer.stop()
+        self.assertEqual(writer.stats["pending"], 0)
+        self.assertEqual(_row_count(self.conn), 3)
+
+    def test_reaching_the_batch_size_triggers_a_background_flush(self):
+        writer = ResponseWriter(self.conn, max_queue=10, batch_size=2, flush_interval=60)
+        writer.start()
+        try:
+            writer.submit("u1", "q1", "r1")
+            writer.submit("u1", "q2", "r2")
+            deadline = time.monotonic() + 5
+            while _row_count(self.conn) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(_row_count(self.conn), 2)
+        finally:
+            writer.stop()
+
+    def test_full_queue_is_flushed_by_the_submitting_thread(self):
+        writer = ResponseWriter(self.conn, max_queue=2, batch_size=100, flush_interval=60)
+        writer.start()
+        try:
+            for i in range(3):
+                writer.submit("u1", f"q{i}", f"r{i}")
+            self.assertEqual(_row_count(self.conn), 3)
+            self.assertEqual(writer.stats["pending"], 0)
+        finally:
+            writer.stop()
+
+    def test_discard_drops_unwritten_rows(self):
+        writer = ResponseWriter(self.conn, max_queue=10, batch_size=5, flush_interval=60)
+        writer.start()
+        writer.submit("u1", "q1", "r1")
+
+        self.assertEqual(writer.discard(), 1)
+        writer.stop()
+        self.assertEqual(_row_count(self.conn), 0)
+
+    def test_discard_waits_for_an_in_flight_flush(self):
+        writer = ResponseWriter(self.conn, max_queue=10, batch_size=5, flush_interval=60)
+        writer.start()
+        writer.submit("u1", "q1", "r1")
+        flushing, release = threading.Event(), threading.Event()
+
+        def slow_insert(conn, rows):
+            flushing.set()
+            release.wait(5)
+            return len(rows)
+
+        with patch("src.cache.response_writer.insert_query_responses", side_effect=slow_insert):
+            flusher = threading.Thread(target=writer.flush)
+            flusher.start()
+            flushing.wait(5)
+            discarder = threading.Thread(target=writer.discard)
+            discarder.start()
+            discarder.join(0.1)
+            self.assertTrue(discarder.is_alive())
+            release.set()
+            discarder.join(5)
+            flusher.join(5)
+        writer.stop()
+        self.assertFalse(discarder.is_alive())
+
+    def test_cache_serves_queued_responses_from_memory(self):
+        writer = ResponseWriter(self.conn, max_queue=10, batch_size=5, flush_interval=60)
+        cache = ResponseCache(self.conn, ttl_seconds=60, max_rows=100, lru_size=4,
+                              eviction_interval=0, writer=writer)
+        writer.start()
+        cache.put("u1", "What are the store hours?", "Answer: 9 to 9")
+
+        self.assertEqual(cache.get("u1", "what are the store hours?"), "Answer: 9 to 9")
+        writer.stop()
+        row = self.conn.execute("SELECT query_hash, created_at FROM query_responses").fetchone()
+        self.assertIsNotNone(row[0])
+        self.assertIsNotNone(row[1])
+
+    def test_concurrent_submits_are_all_written(self):
+        writer = ResponseWriter(self.conn, max_queue=50, batch_size=10, flush_interval=0.05)
+        writer.start()
+        threads = [
+            threading.Thread(target=lambda t=t: [writer.submit(f"u{t}", f"q{i}", "r")
+                                                 for i in range(25)])
+            for t in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.stop()
+
+        self.assertEqual(_row_count(self.conn), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
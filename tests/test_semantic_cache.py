@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from src.cache import SemanticCache
+
+
+class _FakeIndexService:
+    version = 0
+
+
+class TestSemanticCache(unittest.TestCase):
+
+    def setUp(self):
+        self.index_service = _FakeIndexService()
+        self.cache = SemanticCache(
+            threshold=0.9, max_entries=3, index_service=self.index_service
+        )
+
+    def test_similar_query_hits_and_distant_query_misses(self):
+        self.cache.put("u1", np.array([1.0, 0.0, 0.0]), "Answer: 9 to 9")
+
+        self.assertEqual(self.cache.get("u1", np.array([0.95, 0.1, 0.0])), "Answer: 9 to 9")
+        self.assertIsNone(self.cache.get("u1", np.array([0.0, 1.0, 0.0])))
+        self.assertEqual(self.cache.stats["hit_rate"], 0.5)
+
+    def test_answers_are_scoped_per_user(self):
+        self.cache.put("u1", np.array([1.0, 0.0]), "Answer: mine")
+
+        self.assertIsNone(self.cache.get("u2", np.array([1.0, 0.0])))
+
+    def test_corpus_change_invalidates_entries(self):
+        self.cache.put("u1", np.array([1.0, 0.0]), "Answer: old")
+        self.index_service.version += 1
+
+        self.assertIsNone(self.cache.get("u1", np.array([1.0, 0.0])))
+        self.assertEqual(self.cache.stats["entries"], 0)
+
+    def test_oldest_entries_are_dropped_beyond_capacity(self):
+        for i in range(4):
+            vector = np.zeros(4)
+            vector[i] = 1.0
+            self.cache.put("u1", vector, f"Answer: {i}")
+
+        self.assertEqual(self.cache.stats["entries"], 3)
+        self.assertIsNone(self.cache.get("u1", np.array([1.0, 0.0, 0.0, 0.0])))
+        self.assertEqual(self.cache.get("u1", np.array([0.0, 0.0, 0.0, 1.0])), "Answer: 3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+from fastapi import FastAPI
+from langchain.schema import HumanMessage
+
+from src.llm.base_llm import BaseLLM
+from src.routes import route_chat
+from src.utils import BoundedExecutor, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight(name="test")
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do("key", work) for _ in range(4)))
+
+        results = asyncio.run(scenario())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r for r, _ in results], ["result"] * 4)
+        self.assertEqual(sorted(shared for _, shared in results), [False, True, True, True])
+        self.assertEqual(flight.in_flight, 0)
+
+    def test_errors_reach_every_caller_and_key_is_released(self):
+        flight = SingleFlight(name="test")
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def scenario():
+            results = await asyncio.gather(
+                flight.do("key", failing), flight.do("key", failing), return_exceptions=True
+            )
+            follow_up = await flight.do("key", lambda: asyncio.sleep(0, result="ok"))
+            return results, follow_up
+
+        results, follow_up = asyncio.run(scenario())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(follow_up, ("ok", False))
+
+
+class _SlowLLM(BaseLLM):
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def initialize_llm(self, *args, **kwargs):
+        pass
+
+    def generate_response(self, prompt):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.2)
+        return "Answer: open 9 to 9"
+
+
+class TestChatCoalescing(unittest.TestCase):
+
+    def _run_concurrent_chats(self, llm, histories, queries):
+        executor = BoundedExecutor(max_concurrency=4, max_queue=8, name="test")
+        response_cache = MagicMock()
+        response_cache.get.return_value = None
+        chat_history = MagicMock()
+        chat_history.get_chat_history.side_effect = lambda user_id: histories[user_id]
+
+        app = FastAPI()
+        app.include_router(route_chat.generate_routes)
+        app.dependency_overrides[route_chat.get_all_dependencies] = lambda: (
+            MagicMock(), chat_history, MagicMock(), llm, MagicMock(), executor,
+            response_cache, None, None,
+        )
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(*(
+                    client.post("/chat", params={"user_id": user_id}, json={"query": query})
+                    for user_id, query in zip(histories, queries)
+                ))
+
+        try:
+            return asyncio.run(scenario()), response_cache
+        finally:
+            executor.shutdown()
+
+    @patch.object(route_chat, "search", return_value=[{"id": 1, "page_content": "hours"}])
+    def test_identical_concurrent_requests_share_a_generation(self, _search):
+        llm = _SlowLLM()
+
+        responses, response_cache = self._run_concurrent_chats(
+            llm, {"u0": [], "u1": [], "u2": []},
+            ["store hours?", "Store  hours?", "store hours?"],
+        )
+
+        self.assertEqual(llm.calls, 1)
+        self.assertEqual({r.json()["response"] for r in responses}, {"open 9 to 9"})
+        self.assertEqual(response_cache.put.call_count, 3)
+
+    @patch.object(route_chat, "search", return_value=[{"id": 1, "page_content": "hours"}])
+    def test_users_with_different_histories_are_not_coalesced(self, _search):
+        llm = _SlowLLM()
+
+        responses, _ = self._run_concurrent_chats(
+            llm,
+            {"u0": [HumanMessage(content="I live in Haifa")],
+             "u1": [HumanMessage(content="I live in Jaffa")],
+             "u2": []},
+            ["store hours?"] * 3,
+        )
+
+        self.assertEqual(llm.calls, 3)
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+
+
+if __name__ == "__main__":
+    unittest.main()
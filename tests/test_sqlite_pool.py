@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+import pandas as pd
+
+from src.dbs import SQLitePool, create_chunks_table, insert_chunk, unwrap_connection
+
+
+class TestSQLitePool(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.pool = SQLitePool(database=os.path.join(self.tmp_dir.name, "app.db"),
+                               max_connections=4, busy_timeout_ms=200)
+
+    def tearDown(self):
+        self.pool.close_all()
+        self.tmp_dir.cleanup()
+
+    def test_connections_use_wal_and_tuned_pragmas(self):
+        conn = self.pool.proxy
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)
+        self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 200)
+
+    def test_each_thread_gets_its_own_connection(self):
+        main_conn = self.pool.connection()
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(self.pool.connection()))
+        worker.start()
+        worker.join()
+
+        self.assertIs(self.pool.connection(), main_conn)
+        self.assertIsNot(seen[0], main_conn)
+
+    def test_finished_threads_free_their_slot(self):
+        for _ in range(6):
+            worker = threading.Thread(target=self.pool.connection)
+            worker.start()
+            worker.join()
+        self.pool.connection()
+        self.assertLessEqual(self.pool.stats["open_connections"], 4)
+
+    def test_exhausted_pool_raises_after_busy_timeout(self):
+        pool = SQLitePool(database=os.path.join(self.tmp_dir.name, "small.db"),
+                          max_connections=1, busy_timeout_ms=50)
+        pool.connection()
+        errors = []
+
+        def use_pool():
+            try:
+                pool.connection()
+            except sqlite3.OperationalError as err:
+                errors.append(err)
+
+        worker = threading.Thread(target=use_pool)
+        worker.start()
+        worker.join()
+        pool.close_all()
+        self.assertEqual(len(errors), 1)
+
+    def test_writes_through_proxy_are_visible_to_other_threads(self):
+        conn = self.pool.proxy
+        create_chunks_table(conn)
+        insert_chunk(conn, pd.DataFrame({
+            "page_contest": ["a"], "pages": ["1"], "sources": ["s"], "authors": ["r"]}))
+        self.assertIsInstance(unwrap_connection(conn), sqlite3.Connection)
+
+        counts = []
+        worker = threading.Thread(target=lambda: counts.append(
+            conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]))
+        worker.start()
+        worker.join()
+        self.assertEqual(counts, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()